@@ -0,0 +1,11 @@
+-- +goose Up
+UPDATE mods SET created_at = CURRENT_TIMESTAMP WHERE created_at IS NULL;
+ALTER TABLE mods ALTER COLUMN created_at SET NOT NULL;
+
+-- Keyset-пагинация GetMods идёт по (created_at, id) DESC
+CREATE INDEX IF NOT EXISTS mods_created_at_id_idx
+    ON mods (created_at DESC, id DESC);
+
+-- +goose Down
+DROP INDEX IF EXISTS mods_created_at_id_idx;
+ALTER TABLE mods ALTER COLUMN created_at DROP NOT NULL;
@@ -0,0 +1,13 @@
+-- +goose Up
+-- GetMods с фильтром по автору
+CREATE INDEX IF NOT EXISTS mods_author_id_created_at_id_idx
+    ON mods (author_id, created_at DESC, id DESC);
+
+-- Публичный каталог: только UPLOADED
+CREATE INDEX IF NOT EXISTS mods_uploaded_created_at_id_idx
+    ON mods (created_at DESC, id DESC)
+    WHERE status = 'UPLOADED';
+
+-- +goose Down
+DROP INDEX IF EXISTS mods_uploaded_created_at_id_idx;
+DROP INDEX IF EXISTS mods_author_id_created_at_id_idx;
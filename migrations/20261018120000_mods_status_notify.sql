@@ -0,0 +1,20 @@
+-- +goose Up
+-- +goose StatementBegin
+CREATE OR REPLACE FUNCTION notify_mod_status_changed() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('mod_status_changed', NEW.id::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+-- +goose StatementEnd
+
+-- Кеши s3_key на всех репликах сбрасываются по этому уведомлению
+CREATE TRIGGER mods_status_changed
+    AFTER UPDATE OF status ON mods
+    FOR EACH ROW
+    WHEN (OLD.status IS DISTINCT FROM NEW.status)
+    EXECUTE FUNCTION notify_mod_status_changed();
+
+-- +goose Down
+DROP TRIGGER IF EXISTS mods_status_changed ON mods;
+DROP FUNCTION IF EXISTS notify_mod_status_changed();
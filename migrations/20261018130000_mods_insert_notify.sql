@@ -0,0 +1,10 @@
+-- +goose Up
+-- Новый мод меняет каталог GetMods: кеши ответов на всех репликах
+-- сбрасываются по тому же каналу, что и при смене статуса
+CREATE TRIGGER mods_inserted
+    AFTER INSERT ON mods
+    FOR EACH ROW
+    EXECUTE FUNCTION notify_mod_status_changed();
+
+-- +goose Down
+DROP TRIGGER IF EXISTS mods_inserted ON mods;
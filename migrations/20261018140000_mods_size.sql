@@ -0,0 +1,12 @@
+-- +goose Up
+-- Размер mod.zip в байтах, заполняется при подтверждении загрузки
+ALTER TABLE mods ADD COLUMN IF NOT EXISTS size BIGINT;
+
+-- Реконсилер загрузок обходит UPLOADING моды по (created_at, id)
+CREATE INDEX IF NOT EXISTS mods_uploading_created_at_id_idx
+    ON mods (created_at, id)
+    WHERE status = 'UPLOADING';
+
+-- +goose Down
+DROP INDEX IF EXISTS mods_uploading_created_at_id_idx;
+ALTER TABLE mods DROP COLUMN IF EXISTS size;
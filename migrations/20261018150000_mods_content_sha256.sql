@@ -0,0 +1,31 @@
+-- +goose Up
+-- SHA-256 содержимого mod.zip (hex), заполняется после подтверждения
+-- загрузки. Моды с одинаковым хешем делят один объект в S3: s3_key
+-- дубликата указывает на объект первого мода
+ALTER TABLE mods ADD COLUMN IF NOT EXISTS content_sha256 CHAR(64);
+
+CREATE INDEX IF NOT EXISTS mods_content_sha256_idx
+    ON mods (content_sha256)
+    WHERE content_sha256 IS NOT NULL;
+
+-- Очередь на хеширование: загруженные моды без хеша, по id
+CREATE INDEX IF NOT EXISTS mods_unhashed_id_idx
+    ON mods (id)
+    WHERE status = 'UPLOADED' AND content_sha256 IS NULL;
+
+-- Сборщик мусора проверяет, не ссылается ли на объект чужой s3_key
+CREATE INDEX IF NOT EXISTS mods_s3_key_idx ON mods (s3_key);
+
+-- Смена s3_key сбрасывает кеши s3_key и ссылок на всех репликах
+CREATE TRIGGER mods_s3_key_changed
+    AFTER UPDATE OF s3_key ON mods
+    FOR EACH ROW
+    WHEN (OLD.s3_key IS DISTINCT FROM NEW.s3_key)
+    EXECUTE FUNCTION notify_mod_status_changed();
+
+-- +goose Down
+DROP TRIGGER IF EXISTS mods_s3_key_changed ON mods;
+DROP INDEX IF EXISTS mods_s3_key_idx;
+DROP INDEX IF EXISTS mods_unhashed_id_idx;
+DROP INDEX IF EXISTS mods_content_sha256_idx;
+ALTER TABLE mods DROP COLUMN IF EXISTS content_sha256;
@@ -0,0 +1,17 @@
+-- +goose Up
+-- Оглавление mod.zip из central directory: без скачивания архива
+-- видно число файлов и размер после распаковки
+CREATE TABLE IF NOT EXISTS mod_manifests (
+    mod_id INT PRIMARY KEY REFERENCES mods (id) ON DELETE CASCADE,
+    file_count INT NOT NULL,
+    compressed_size BIGINT NOT NULL,
+    uncompressed_size BIGINT NOT NULL,
+    -- [{"name": ..., "size": ..., "compressed_size": ...}, ...]
+    entries JSONB NOT NULL,
+    -- Причина, по которой архив не разобран; NULL — разобран
+    error TEXT,
+    inspected_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- +goose Down
+DROP TABLE IF EXISTS mod_manifests;
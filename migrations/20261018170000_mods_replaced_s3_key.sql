@@ -0,0 +1,17 @@
+-- +goose Up
+-- s3_key, с которого дедупликация перевела мод на объект оригинала:
+-- копию под ним нужно удалить. Колонка очищается после удаления, а
+-- неудавшиеся удаления повторяются следующим проходом. replaced_at —
+-- время перевода: копия удаляется, только когда выданные на неё
+-- ссылки на скачивание истекли
+ALTER TABLE mods ADD COLUMN IF NOT EXISTS replaced_s3_key TEXT;
+ALTER TABLE mods ADD COLUMN IF NOT EXISTS replaced_at TIMESTAMP;
+
+CREATE INDEX IF NOT EXISTS mods_replaced_s3_key_id_idx
+    ON mods (id)
+    WHERE replaced_s3_key IS NOT NULL;
+
+-- +goose Down
+DROP INDEX IF EXISTS mods_replaced_s3_key_id_idx;
+ALTER TABLE mods DROP COLUMN IF EXISTS replaced_at;
+ALTER TABLE mods DROP COLUMN IF EXISTS replaced_s3_key;
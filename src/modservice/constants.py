@@ -2,3 +2,37 @@ STATUS_UPLOADING = "UPLOADING"
 STATUS_UPLOADED = "UPLOADED"
 STATUS_BANNED = "BANNED"
 STATUS_HIDDEN = "HIDDEN"
+
+# ModRepository.get_mod_s3_key возвращает его, если мод не найден
+# или не в статусе UPLOADED
+S3_KEY_NOT_FOUND = "0"
+
+# mods.id и author_id — INT: id из ключа S3 больше этого в запрос
+# не передаётся, иначе $1::int[] роняет весь запрос
+MAX_DB_ID = 2**31 - 1
+
+# GetModsRequest.page_size = 0 означает DEFAULT_PAGE_SIZE, а не «все
+# моды»: клиент без page_size получает первую страницу и next_page_token
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+STREAM_MODS_PREFETCH = 500
+
+MAX_DOWNLOAD_LINKS_BATCH = 500
+
+# Ограничения S3 multipart upload: все части, кроме последней, не меньше
+# 5 MiB, частей не больше 10 000
+S3_MIN_PART_SIZE = 5 * 1024 * 1024
+S3_MAX_PARTS = 10_000
+S3_DEFAULT_PART_SIZE = 8 * 1024 * 1024
+# Размер куска, которым тело объекта читается из сети и пишется на диск
+S3_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# Central directory больше этого считается подозрительным и не читается:
+# это порядка десяти тысяч файлов в одном архиве, а весь каталог
+# целиком держится в памяти на время разбора
+MAX_CENTRAL_DIRECTORY_SIZE = 1024 * 1024
+# DeleteObjects принимает не больше 1000 ключей за запрос
+S3_DELETE_BATCH_SIZE = 1000
+
+# Канал pg_notify, в который триггер mods_status_changed пишет id мода
+MOD_STATUS_CHANNEL = "mod_status_changed"
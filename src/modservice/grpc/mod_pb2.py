@@ -25,33 +25,41 @@ _sym_db = _symbol_database.Default()
 from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\tmod.proto\x12\x03mod\x1a\x1fgoogle/protobuf/timestamp.proto\"\x10\n\x0eGetModsRequest\")\n\x0fGetModsResponse\x12\x16\n\x04mods\x18\x01 \x03(\x0b\x32\x08.mod.Mod\"\xa9\x01\n\x03Mod\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x11\n\tauthor_id\x18\x02 \x01(\x03\x12\r\n\x05title\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\x12\x0f\n\x07version\x18\x05 \x01(\x03\x12\x1e\n\x06status\x18\x06 \x01(\x0e\x32\x0e.mod.ModStatus\x12.\n\ncreated_at\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"B\n\x10SetStatusRequest\x12\x0e\n\x06mod_id\x18\x01 \x01(\x03\x12\x1e\n\x06status\x18\x02 \x01(\x0e\x32\x0e.mod.ModStatus\"$\n\x11SetStatusResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"[\n\x10\x43reateModRequest\x12\r\n\x05title\x18\x01 \x01(\t\x12\x11\n\tauthor_id\x18\x02 \x01(\x03\x12\x10\n\x08\x66ilename\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\"G\n\x11\x43reateModResponse\x12\x0e\n\x06mod_id\x18\x01 \x01(\x03\x12\x12\n\nupload_url\x18\x02 \x01(\t\x12\x0e\n\x06s3_key\x18\x03 \x01(\t\"+\n\x19GetModDownloadLinkRequest\x12\x0e\n\x06mod_id\x18\x01 \x01(\x03\".\n\x1aGetModDownloadLinkResponse\x12\x10\n\x08link_url\x18\x01 \x01(\t*n\n\tModStatus\x12\x1a\n\x16MOD_STATUS_UNSPECIFIED\x10\x00\x12\x17\n\x13MOD_STATUS_UPLOADED\x10\x01\x12\x15\n\x11MOD_STATUS_BANNED\x10\x02\x12\x15\n\x11MOD_STATUS_HIDDEN\x10\x03\x32\x91\x02\n\nModService\x12:\n\tCreateMod\x12\x15.mod.CreateModRequest\x1a\x16.mod.CreateModResponse\x12:\n\tSetStatus\x12\x15.mod.SetStatusRequest\x1a\x16.mod.SetStatusResponse\x12U\n\x12GetModDownloadLink\x12\x1e.mod.GetModDownloadLinkRequest\x1a\x1f.mod.GetModDownloadLinkResponse\x12\x34\n\x07GetMods\x12\x13.mod.GetModsRequest\x1a\x14.mod.GetModsResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\tmod.proto\x12\x03mod\x1a\x1fgoogle/protobuf/timestamp.proto\"\xd3\x01\n\x0eGetModsRequest\x12\x11\n\tpage_size\x18\x01 \x01(\x05\x12\x12\n\npage_token\x18\x02 \x01(\t\x12\x11\n\tauthor_id\x18\x03 \x01(\x03\x12 \n\x08statuses\x18\x04 \x03(\x0e\x32\x0e.mod.ModStatus\x12\x31\n\rcreated_after\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x32\n\x0e\x63reated_before\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"B\n\x0fGetModsResponse\x12\x16\n\x04mods\x18\x01 \x03(\x0b\x32\x08.mod.Mod\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\"\x13\n\x11StreamModsRequest\"\xa9\x01\n\x03Mod\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x11\n\tauthor_id\x18\x02 \x01(\x03\x12\r\n\x05title\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\x12\x0f\n\x07version\x18\x05 \x01(\x03\x12\x1e\n\x06status\x18\x06 \x01(\x0e\x32\x0e.mod.ModStatus\x12.\n\ncreated_at\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"B\n\x10SetStatusRequest\x12\x0e\n\x06mod_id\x18\x01 \x01(\x03\x12\x1e\n\x06status\x18\x02 \x01(\x0e\x32\x0e.mod.ModStatus\"$\n\x11SetStatusResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"[\n\x10\x43reateModRequest\x12\r\n\x05title\x18\x01 \x01(\t\x12\x11\n\tauthor_id\x18\x02 \x01(\x03\x12\x10\n\x08\x66ilename\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\"G\n\x11\x43reateModResponse\x12\x0e\n\x06mod_id\x18\x01 \x01(\x03\x12\x12\n\nupload_url\x18\x02 \x01(\t\x12\x0e\n\x06s3_key\x18\x03 \x01(\t\"+\n\x19GetModDownloadLinkRequest\x12\x0e\n\x06mod_id\x18\x01 \x01(\x03\".\n\x1aGetModDownloadLinkResponse\x12\x10\n\x08link_url\x18\x01 \x01(\t\"-\n\x1aGetModDownloadLinksRequest\x12\x0f\n\x07mod_ids\x18\x01 \x03(\x03\"B\n\x0fModDownloadLink\x12\x0e\n\x06mod_id\x18\x01 \x01(\x03\x12\x10\n\x08link_url\x18\x02 \x01(\t\x12\r\n\x05\x66ound\x18\x03 \x01(\x08\"B\n\x1bGetModDownloadLinksResponse\x12#\n\x05links\x18\x01 \x03(\x0b\x32\x14.mod.ModDownloadLink*n\n\tModStatus\x12\x1a\n\x16MOD_STATUS_UNSPECIFIED\x10\x00\x12\x17\n\x13MOD_STATUS_UPLOADED\x10\x01\x12\x15\n\x11MOD_STATUS_BANNED\x10\x02\x12\x15\n\x11MOD_STATUS_HIDDEN\x10\x03\x32\x9d\x03\n\nModService\x12:\n\tCreateMod\x12\x15.mod.CreateModRequest\x1a\x16.mod.CreateModResponse\x12:\n\tSetStatus\x12\x15.mod.SetStatusRequest\x1a\x16.mod.SetStatusResponse\x12U\n\x12GetModDownloadLink\x12\x1e.mod.GetModDownloadLinkRequest\x1a\x1f.mod.GetModDownloadLinkResponse\x12X\n\x13GetModDownloadLinks\x12\x1f.mod.GetModDownloadLinksRequest\x1a .mod.GetModDownloadLinksResponse\x12\x34\n\x07GetMods\x12\x13.mod.GetModsRequest\x1a\x14.mod.GetModsResponse\x12\x30\n\nStreamMods\x12\x16.mod.StreamModsRequest\x1a\x08.mod.Mod0\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'mod_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
-  _globals['_MODSTATUS']._serialized_start=649
-  _globals['_MODSTATUS']._serialized_end=759
-  _globals['_GETMODSREQUEST']._serialized_start=51
-  _globals['_GETMODSREQUEST']._serialized_end=67
-  _globals['_GETMODSRESPONSE']._serialized_start=69
-  _globals['_GETMODSRESPONSE']._serialized_end=110
-  _globals['_MOD']._serialized_start=113
-  _globals['_MOD']._serialized_end=282
-  _globals['_SETSTATUSREQUEST']._serialized_start=284
-  _globals['_SETSTATUSREQUEST']._serialized_end=350
-  _globals['_SETSTATUSRESPONSE']._serialized_start=352
-  _globals['_SETSTATUSRESPONSE']._serialized_end=388
-  _globals['_CREATEMODREQUEST']._serialized_start=390
-  _globals['_CREATEMODREQUEST']._serialized_end=481
-  _globals['_CREATEMODRESPONSE']._serialized_start=483
-  _globals['_CREATEMODRESPONSE']._serialized_end=554
-  _globals['_GETMODDOWNLOADLINKREQUEST']._serialized_start=556
-  _globals['_GETMODDOWNLOADLINKREQUEST']._serialized_end=599
-  _globals['_GETMODDOWNLOADLINKRESPONSE']._serialized_start=601
-  _globals['_GETMODDOWNLOADLINKRESPONSE']._serialized_end=647
-  _globals['_MODSERVICE']._serialized_start=762
-  _globals['_MODSERVICE']._serialized_end=1035
+  _globals['_MODSTATUS']._serialized_start=1074
+  _globals['_MODSTATUS']._serialized_end=1184
+  _globals['_GETMODSREQUEST']._serialized_start=52
+  _globals['_GETMODSREQUEST']._serialized_end=263
+  _globals['_GETMODSRESPONSE']._serialized_start=265
+  _globals['_GETMODSRESPONSE']._serialized_end=331
+  _globals['_STREAMMODSREQUEST']._serialized_start=333
+  _globals['_STREAMMODSREQUEST']._serialized_end=352
+  _globals['_MOD']._serialized_start=355
+  _globals['_MOD']._serialized_end=524
+  _globals['_SETSTATUSREQUEST']._serialized_start=526
+  _globals['_SETSTATUSREQUEST']._serialized_end=592
+  _globals['_SETSTATUSRESPONSE']._serialized_start=594
+  _globals['_SETSTATUSRESPONSE']._serialized_end=630
+  _globals['_CREATEMODREQUEST']._serialized_start=632
+  _globals['_CREATEMODREQUEST']._serialized_end=723
+  _globals['_CREATEMODRESPONSE']._serialized_start=725
+  _globals['_CREATEMODRESPONSE']._serialized_end=796
+  _globals['_GETMODDOWNLOADLINKREQUEST']._serialized_start=798
+  _globals['_GETMODDOWNLOADLINKREQUEST']._serialized_end=841
+  _globals['_GETMODDOWNLOADLINKRESPONSE']._serialized_start=843
+  _globals['_GETMODDOWNLOADLINKRESPONSE']._serialized_end=889
+  _globals['_GETMODDOWNLOADLINKSREQUEST']._serialized_start=891
+  _globals['_GETMODDOWNLOADLINKSREQUEST']._serialized_end=936
+  _globals['_MODDOWNLOADLINK']._serialized_start=938
+  _globals['_MODDOWNLOADLINK']._serialized_end=1004
+  _globals['_GETMODDOWNLOADLINKSRESPONSE']._serialized_start=1006
+  _globals['_GETMODDOWNLOADLINKSRESPONSE']._serialized_end=1072
+  _globals['_MODSERVICE']._serialized_start=1187
+  _globals['_MODSERVICE']._serialized_end=1600
 # @@protoc_insertion_point(module_scope)
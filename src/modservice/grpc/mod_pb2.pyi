@@ -22,14 +22,32 @@ MOD_STATUS_BANNED: ModStatus
 MOD_STATUS_HIDDEN: ModStatus
 
 class GetModsRequest(_message.Message):
-    __slots__ = ()
-    def __init__(self) -> None: ...
+    __slots__ = ("page_size", "page_token", "author_id", "statuses", "created_after", "created_before")
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    AUTHOR_ID_FIELD_NUMBER: _ClassVar[int]
+    STATUSES_FIELD_NUMBER: _ClassVar[int]
+    CREATED_AFTER_FIELD_NUMBER: _ClassVar[int]
+    CREATED_BEFORE_FIELD_NUMBER: _ClassVar[int]
+    page_size: int
+    page_token: str
+    author_id: int
+    statuses: _containers.RepeatedScalarFieldContainer[ModStatus]
+    created_after: _timestamp_pb2.Timestamp
+    created_before: _timestamp_pb2.Timestamp
+    def __init__(self, page_size: _Optional[int] = ..., page_token: _Optional[str] = ..., author_id: _Optional[int] = ..., statuses: _Optional[_Iterable[_Union[ModStatus, str]]] = ..., created_after: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., created_before: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ...) -> None: ...
 
 class GetModsResponse(_message.Message):
-    __slots__ = ("mods",)
+    __slots__ = ("mods", "next_page_token")
     MODS_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
     mods: _containers.RepeatedCompositeFieldContainer[Mod]
-    def __init__(self, mods: _Optional[_Iterable[_Union[Mod, _Mapping]]] = ...) -> None: ...
+    next_page_token: str
+    def __init__(self, mods: _Optional[_Iterable[_Union[Mod, _Mapping]]] = ..., next_page_token: _Optional[str] = ...) -> None: ...
+
+class StreamModsRequest(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
 
 class Mod(_message.Message):
     __slots__ = ("id", "author_id", "title", "description", "version", "status", "created_at")
@@ -96,3 +114,25 @@ class GetModDownloadLinkResponse(_message.Message):
     LINK_URL_FIELD_NUMBER: _ClassVar[int]
     link_url: str
     def __init__(self, link_url: _Optional[str] = ...) -> None: ...
+
+class GetModDownloadLinksRequest(_message.Message):
+    __slots__ = ("mod_ids",)
+    MOD_IDS_FIELD_NUMBER: _ClassVar[int]
+    mod_ids: _containers.RepeatedScalarFieldContainer[int]
+    def __init__(self, mod_ids: _Optional[_Iterable[int]] = ...) -> None: ...
+
+class ModDownloadLink(_message.Message):
+    __slots__ = ("mod_id", "link_url", "found")
+    MOD_ID_FIELD_NUMBER: _ClassVar[int]
+    LINK_URL_FIELD_NUMBER: _ClassVar[int]
+    FOUND_FIELD_NUMBER: _ClassVar[int]
+    mod_id: int
+    link_url: str
+    found: bool
+    def __init__(self, mod_id: _Optional[int] = ..., link_url: _Optional[str] = ..., found: bool = ...) -> None: ...
+
+class GetModDownloadLinksResponse(_message.Message):
+    __slots__ = ("links",)
+    LINKS_FIELD_NUMBER: _ClassVar[int]
+    links: _containers.RepeatedCompositeFieldContainer[ModDownloadLink]
+    def __init__(self, links: _Optional[_Iterable[_Union[ModDownloadLink, _Mapping]]] = ...) -> None: ...
@@ -49,11 +49,21 @@ class ModServiceStub(object):
                 request_serializer=mod__pb2.GetModDownloadLinkRequest.SerializeToString,
                 response_deserializer=mod__pb2.GetModDownloadLinkResponse.FromString,
                 _registered_method=True)
+        self.GetModDownloadLinks = channel.unary_unary(
+                '/mod.ModService/GetModDownloadLinks',
+                request_serializer=mod__pb2.GetModDownloadLinksRequest.SerializeToString,
+                response_deserializer=mod__pb2.GetModDownloadLinksResponse.FromString,
+                _registered_method=True)
         self.GetMods = channel.unary_unary(
                 '/mod.ModService/GetMods',
                 request_serializer=mod__pb2.GetModsRequest.SerializeToString,
                 response_deserializer=mod__pb2.GetModsResponse.FromString,
                 _registered_method=True)
+        self.StreamMods = channel.unary_stream(
+                '/mod.ModService/StreamMods',
+                request_serializer=mod__pb2.StreamModsRequest.SerializeToString,
+                response_deserializer=mod__pb2.Mod.FromString,
+                _registered_method=True)
 
 
 class ModServiceServicer(object):
@@ -77,12 +87,24 @@ class ModServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetModDownloadLinks(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetMods(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def StreamMods(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_ModServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -101,11 +123,21 @@ def add_ModServiceServicer_to_server(servicer, server):
                     request_deserializer=mod__pb2.GetModDownloadLinkRequest.FromString,
                     response_serializer=mod__pb2.GetModDownloadLinkResponse.SerializeToString,
             ),
+            'GetModDownloadLinks': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetModDownloadLinks,
+                    request_deserializer=mod__pb2.GetModDownloadLinksRequest.FromString,
+                    response_serializer=mod__pb2.GetModDownloadLinksResponse.SerializeToString,
+            ),
             'GetMods': grpc.unary_unary_rpc_method_handler(
                     servicer.GetMods,
                     request_deserializer=mod__pb2.GetModsRequest.FromString,
                     response_serializer=mod__pb2.GetModsResponse.SerializeToString,
             ),
+            'StreamMods': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamMods,
+                    request_deserializer=mod__pb2.StreamModsRequest.FromString,
+                    response_serializer=mod__pb2.Mod.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'mod.ModService', rpc_method_handlers)
@@ -198,6 +230,33 @@ class ModService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def GetModDownloadLinks(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/mod.ModService/GetModDownloadLinks',
+            mod__pb2.GetModDownloadLinksRequest.SerializeToString,
+            mod__pb2.GetModDownloadLinksResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GetMods(request,
             target,
@@ -224,3 +283,30 @@ class ModService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def StreamMods(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/mod.ModService/StreamMods',
+            mod__pb2.StreamModsRequest.SerializeToString,
+            mod__pb2.Mod.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -0,0 +1,29 @@
+import grpc
+
+from modservice.grpc import mod_pb2
+from modservice.service.service import ModService
+
+
+async def GetModDownloadLinks(
+    service: ModService,
+    request: mod_pb2.GetModDownloadLinksRequest,
+    context: grpc.ServicerContext,
+) -> mod_pb2.GetModDownloadLinksResponse:
+    try:
+        links = await service.get_mod_download_links(list(request.mod_ids))
+    except ValueError as e:
+        context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+        context.set_details(str(e))
+        return mod_pb2.GetModDownloadLinksResponse()
+
+    # Порядок и повторы как в запросе
+    return mod_pb2.GetModDownloadLinksResponse(
+        links=[
+            mod_pb2.ModDownloadLink(
+                mod_id=mod_id,
+                link_url=links.get(mod_id, ""),
+                found=mod_id in links,
+            )
+            for mod_id in request.mod_ids
+        ]
+    )
@@ -2,6 +2,8 @@ import grpc
 
 from modservice.constants import STATUS_BANNED, STATUS_HIDDEN, STATUS_UPLOADED
 from modservice.grpc import mod_pb2
+from modservice.handler.get_mods_cache import GetModsResponseCache
+from modservice.repository.model import ModFilter, ModRow
 from modservice.service.service import ModService
 
 STATUS_TO_PROTO: dict[str, mod_pb2.ModStatus] = {
@@ -10,31 +12,92 @@ STATUS_TO_PROTO: dict[str, mod_pb2.ModStatus] = {
     STATUS_HIDDEN: mod_pb2.ModStatus.MOD_STATUS_HIDDEN,
 }
 
+PROTO_TO_STATUS: dict[int, str] = {
+    proto_status: status for status, proto_status in STATUS_TO_PROTO.items()
+}
+
+
+def mod_to_proto(mod: ModRow) -> mod_pb2.Mod:
+    return mod_pb2.Mod(
+        id=mod.id,
+        author_id=mod.author_id,
+        title=mod.title,
+        description=mod.description,
+        version=mod.version,
+        # UPLOADING и FAILED в proto нет, отдаём их как UNSPECIFIED
+        status=STATUS_TO_PROTO.get(
+            mod.status, mod_pb2.ModStatus.MOD_STATUS_UNSPECIFIED
+        ),
+        created_at=mod.created_at,
+        # avatar_url=mod.avatar_url,
+        # download_count=mod.download_count,
+        # tags=mod.tags,
+        # updated_at=mod.updated_at,
+    )
+
+
+def _request_to_filter(request: mod_pb2.GetModsRequest) -> ModFilter | None:
+    statuses = []
+    for proto_status in request.statuses:
+        if proto_status not in PROTO_TO_STATUS:
+            raise ValueError(f"Unsupported status filter: {proto_status}")
+        statuses.append(PROTO_TO_STATUS[proto_status])
+
+    mod_filter = ModFilter(
+        author_id=request.author_id or None,
+        statuses=tuple(statuses),
+        created_after=(
+            request.created_after.ToDatetime()
+            if request.HasField("created_after")
+            else None
+        ),
+        created_before=(
+            request.created_before.ToDatetime()
+            if request.HasField("created_before")
+            else None
+        ),
+    )
+    return mod_filter if mod_filter != ModFilter() else None
+
 
 async def GetMods(
     service: ModService,
-    request: mod_pb2.GetModsRequest,  # noqa: ARG001
-    context: grpc.ServicerContext,  # noqa: ARG001
-) -> mod_pb2.GetModsResponse:
-    mods_data = await service.get_mods()
-
-    mods = []
-    for mod_data in mods_data:
-        mod = mod_pb2.Mod(
-            id=mod_data["id"],
-            author_id=mod_data["author_id"],
-            title=mod_data["title"],
-            description=mod_data["description"],
-            version=mod_data["version"],
-            status=STATUS_TO_PROTO[mod_data["status"]],
-            created_at=(
-                mod_data["created_at"] if mod_data.get("created_at") else None
-            ),
-            # avatar_url=mod_data.get("avatar_url", ""),
-            # download_count=mod_data.get("download_count", 0),
-            # tags=mod_data.get("tags", []),
-            # updated_at=mod_data["updated_at"] if mod_data.get("updated_at") else None,
+    request: mod_pb2.GetModsRequest,
+    context: grpc.ServicerContext,
+    response_cache: GetModsResponseCache | None = None,
+) -> mod_pb2.GetModsResponse | bytes:
+    """
+    Каталог без фильтров одинаков для всех клиентов, поэтому с
+    response_cache он отдаётся готовыми байтами: их пропускает без
+    сериализации SerializedResponseInterceptor.
+    """
+    try:
+        mod_filter = _request_to_filter(request)
+        if response_cache is not None and mod_filter is None:
+            cached = response_cache.get(request.page_size, request.page_token)
+            if cached is not None:
+                return cached
+            generation = response_cache.generation
+
+        mod_rows, next_page_token = await service.get_mods(
+            request.page_size,
+            request.page_token,
+            mod_filter,
         )
-        mods.append(mod)
+    except ValueError as e:
+        context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+        context.set_details(str(e))
+        return mod_pb2.GetModsResponse()
 
-    return mod_pb2.GetModsResponse(mods=mods)
+    mods = [mod_to_proto(mod) for mod in mod_rows]
+    response = mod_pb2.GetModsResponse(
+        mods=mods, next_page_token=next_page_token
+    )
+
+    if response_cache is not None and mod_filter is None:
+        data = response.SerializeToString()
+        response_cache.put(
+            request.page_size, request.page_token, data, generation
+        )
+        return data
+    return response
@@ -0,0 +1,63 @@
+from collections import OrderedDict
+from collections.abc import Callable
+
+
+class GetModsResponseCache:
+    """
+    LRU-кеш сериализованных GetModsResponse без фильтров по ключу
+    (page_size, page_token).
+
+    Запись помечена поколением каталога (ModService.catalogue_version) и
+    отдаётся, только пока поколение не изменилось. put() принимает
+    поколение, снятое до похода в БД, и игнорирует ответ, если каталог с
+    тех пор менялся: параллельная пересборка по старым данным не затрёт
+    свежую запись.
+    """
+
+    def __init__(
+        self, generation: Callable[[], int], max_size: int = 256
+    ) -> None:
+        self._generation = generation
+        self._max_size = max_size
+        self._entries: OrderedDict[tuple[int, str], tuple[int, bytes]] = (
+            OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def generation(self) -> int:
+        return self._generation()
+
+    def get(self, page_size: int, page_token: str) -> bytes | None:
+        key = (page_size, page_token)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        generation, data = entry
+        if generation != self._generation():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return data
+
+    def put(
+        self, page_size: int, page_token: str, data: bytes, generation: int
+    ) -> None:
+        if generation != self._generation():
+            return
+
+        key = (page_size, page_token)
+        self._entries[key] = (generation, data)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
@@ -1,3 +1,5 @@
+from collections.abc import AsyncIterator
+
 import grpc
 
 from modservice.grpc import mod_pb2, mod_pb2_grpc
@@ -5,15 +7,27 @@ from modservice.handler.create_mod import CreateMod as _create_mod
 from modservice.handler.get_mod_download_link import (
     GetDownloadLink as _get_mod_download_link,
 )
+from modservice.handler.get_mod_download_links import (
+    GetModDownloadLinks as _get_mod_download_links,
+)
 from modservice.handler.get_mods import GetMods as _get_mods
+from modservice.handler.get_mods_cache import GetModsResponseCache
 from modservice.handler.set_status import SetStatus as _set_status
+from modservice.handler.stream_mods import StreamMods as _stream_mods
+from modservice.metrics import timed
 from modservice.service.service import ModService
 
 
 class ModHandler(mod_pb2_grpc.ModServiceServicer):
-    def __init__(self, service: ModService):
+    def __init__(
+        self,
+        service: ModService,
+        get_mods_cache: GetModsResponseCache | None = None,
+    ):
         self._service = service
+        self._get_mods_cache = get_mods_cache
 
+    @timed("handler")
     async def CreateMod(
         self,
         request: mod_pb2.CreateModRequest,
@@ -21,6 +35,7 @@ class ModHandler(mod_pb2_grpc.ModServiceServicer):
     ) -> mod_pb2.CreateModResponse:
         return await _create_mod(self._service, request, context)
 
+    @timed("handler")
     async def GetModDownloadLink(
         self,
         request: mod_pb2.GetModDownloadLinkRequest,
@@ -28,6 +43,15 @@ class ModHandler(mod_pb2_grpc.ModServiceServicer):
     ) -> mod_pb2.GetModDownloadLinkResponse:
         return await _get_mod_download_link(self._service, request, context)
 
+    @timed("handler")
+    async def GetModDownloadLinks(
+        self,
+        request: mod_pb2.GetModDownloadLinksRequest,
+        context: grpc.ServicerContext,
+    ) -> mod_pb2.GetModDownloadLinksResponse:
+        return await _get_mod_download_links(self._service, request, context)
+
+    @timed("handler")
     async def SetStatus(
         self,
         request: mod_pb2.SetStatusRequest,
@@ -35,9 +59,20 @@ class ModHandler(mod_pb2_grpc.ModServiceServicer):
     ) -> mod_pb2.SetStatusResponse:
         return await _set_status(self._service, request, context)
 
+    @timed("handler")
     async def GetMods(
         self,
         request: mod_pb2.GetModsRequest,
         context: grpc.ServicerContext,
-    ) -> mod_pb2.GetModsResponse:
-        return await _get_mods(self._service, request, context)
+    ) -> mod_pb2.GetModsResponse | bytes:
+        return await _get_mods(
+            self._service, request, context, self._get_mods_cache
+        )
+
+    async def StreamMods(
+        self,
+        request: mod_pb2.StreamModsRequest,
+        context: grpc.ServicerContext,
+    ) -> AsyncIterator[mod_pb2.Mod]:
+        async for mod in _stream_mods(self._service, request, context):
+            yield mod
@@ -0,0 +1,242 @@
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
+
+import grpc
+
+from modservice.metrics import Counter, Histogram
+from modservice.repository.pool import PoolExhaustedError
+
+logger = logging.getLogger(__name__)
+
+GRPC_STARTED = Counter(
+    "grpc_server_started_total",
+    "RPCs started on the server",
+    ("grpc_service", "grpc_method"),
+)
+GRPC_HANDLED = Counter(
+    "grpc_server_handled_total",
+    "RPCs completed on the server, by status code",
+    ("grpc_service", "grpc_method", "grpc_code"),
+)
+GRPC_HANDLING_SECONDS = Histogram(
+    "grpc_server_handling_seconds",
+    "RPC handling time on the server",
+    ("grpc_service", "grpc_method"),
+)
+
+
+class MetricsInterceptor(grpc.aio.ServerInterceptor):  # type: ignore[type-arg]
+    """
+    Считает запуски, завершения по коду статуса и время обработки RPC.
+
+    Должен стоять первым в списке interceptors, чтобы видеть коды,
+    выставленные остальными (например RESOURCE_EXHAUSTED от
+    ErrorInterceptor). Для потоковых методов время — до конца потока.
+    """
+
+    async def intercept_service(
+        self,
+        continuation: Callable[
+            [grpc.HandlerCallDetails],
+            Awaitable["grpc.RpcMethodHandler[Any, Any]"],
+        ],
+        handler_call_details: grpc.HandlerCallDetails,
+    ) -> "grpc.RpcMethodHandler[Any, Any]":
+        handler = await continuation(handler_call_details)
+        if handler is None:
+            return handler
+
+        labels = _split_method(handler_call_details.method)
+        if handler.unary_unary is not None:
+            return handler._replace(  # type: ignore[attr-defined, no-any-return]
+                unary_unary=_measure_unary(handler.unary_unary, labels)
+            )
+        if handler.unary_stream is not None:
+            return handler._replace(  # type: ignore[attr-defined, no-any-return]
+                unary_stream=_measure_stream(handler.unary_stream, labels)
+            )
+        return handler
+
+
+def _split_method(method: str) -> tuple[str, str]:
+    service, _, name = method.lstrip("/").rpartition("/")
+    return service, name
+
+
+def _status_code(
+    context: grpc.aio.ServicerContext[Any, Any],
+    error: BaseException | None = None,
+) -> str:
+    # context.code() выставлен через set_code() или abort()
+    code = context.code()
+    if code is not None:
+        return str(code.name)
+    if error is None:
+        return grpc.StatusCode.OK.name
+    if isinstance(error, asyncio.CancelledError | GeneratorExit):
+        return grpc.StatusCode.CANCELLED.name
+    return grpc.StatusCode.UNKNOWN.name
+
+
+def _observe(
+    labels: tuple[str, str],
+    started: float,
+    context: grpc.aio.ServicerContext[Any, Any],
+    error: BaseException | None = None,
+) -> None:
+    GRPC_HANDLING_SECONDS.observe(time.perf_counter() - started, labels)
+    GRPC_HANDLED.inc(labels=(*labels, _status_code(context, error)))
+
+
+def _measure_unary(
+    behavior: Callable[..., Awaitable[Any]], labels: tuple[str, str]
+) -> Callable[..., Awaitable[Any]]:
+    async def wrapper(
+        request: Any, context: grpc.aio.ServicerContext[Any, Any]
+    ) -> Any:
+        GRPC_STARTED.inc(labels=labels)
+        started = time.perf_counter()
+        try:
+            response = await behavior(request, context)
+        except BaseException as e:
+            _observe(labels, started, context, e)
+            raise
+        _observe(labels, started, context)
+        return response
+
+    return wrapper
+
+
+def _measure_stream(
+    behavior: Callable[..., Any], labels: tuple[str, str]
+) -> Callable[..., AsyncIterator[Any]]:
+    async def wrapper(
+        request: Any, context: grpc.aio.ServicerContext[Any, Any]
+    ) -> AsyncIterator[Any]:
+        GRPC_STARTED.inc(labels=labels)
+        started = time.perf_counter()
+        try:
+            async for response in behavior(request, context):
+                yield response
+        except BaseException as e:
+            _observe(labels, started, context, e)
+            raise
+        _observe(labels, started, context)
+
+    return wrapper
+
+
+class ErrorInterceptor(grpc.aio.ServerInterceptor):  # type: ignore[type-arg]
+    """
+    Переводит исключения инфраструктуры в gRPC статусы для всех методов.
+
+    PoolExhaustedError -> RESOURCE_EXHAUSTED: клиент может повторить
+    запрос с backoff, а не ждать, пока освободится соединение.
+    """
+
+    async def intercept_service(
+        self,
+        continuation: Callable[
+            [grpc.HandlerCallDetails],
+            Awaitable["grpc.RpcMethodHandler[Any, Any]"],
+        ],
+        handler_call_details: grpc.HandlerCallDetails,
+    ) -> "grpc.RpcMethodHandler[Any, Any]":
+        handler = await continuation(handler_call_details)
+        if handler is None:
+            return handler
+
+        method = handler_call_details.method
+        if handler.unary_unary is not None:
+            return handler._replace(  # type: ignore[attr-defined, no-any-return]
+                unary_unary=_wrap_unary(handler.unary_unary, method)
+            )
+        if handler.unary_stream is not None:
+            return handler._replace(  # type: ignore[attr-defined, no-any-return]
+                unary_stream=_wrap_stream(handler.unary_stream, method)
+            )
+        return handler
+
+
+async def _abort_exhausted(
+    context: grpc.aio.ServicerContext[Any, Any],
+    method: str,
+    error: PoolExhaustedError,
+) -> None:
+    logger.warning(f"{method}: {error!s}")
+    await context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, str(error))
+
+
+def _wrap_unary(
+    behavior: Callable[..., Awaitable[Any]], method: str
+) -> Callable[..., Awaitable[Any]]:
+    async def wrapper(
+        request: Any, context: grpc.aio.ServicerContext[Any, Any]
+    ) -> Any:
+        try:
+            return await behavior(request, context)
+        except PoolExhaustedError as e:
+            await _abort_exhausted(context, method, e)
+
+    return wrapper
+
+
+def _wrap_stream(
+    behavior: Callable[..., Any], method: str
+) -> Callable[..., AsyncIterator[Any]]:
+    async def wrapper(
+        request: Any, context: grpc.aio.ServicerContext[Any, Any]
+    ) -> AsyncIterator[Any]:
+        try:
+            async for response in behavior(request, context):
+                yield response
+        except PoolExhaustedError as e:
+            await _abort_exhausted(context, method, e)
+
+    return wrapper
+
+
+class SerializedResponseInterceptor(
+    grpc.aio.ServerInterceptor  # type: ignore[type-arg]
+):
+    """
+    Разрешает unary-обработчикам возвращать готовые байты ответа.
+
+    bytes отдаются в сокет как есть, остальные ответы сериализуются
+    штатным serializer метода. Так GetMods отдаёт кешированный
+    GetModsResponse без повторной сериализации.
+    """
+
+    async def intercept_service(
+        self,
+        continuation: Callable[
+            [grpc.HandlerCallDetails],
+            Awaitable["grpc.RpcMethodHandler[Any, Any]"],
+        ],
+        handler_call_details: grpc.HandlerCallDetails,
+    ) -> "grpc.RpcMethodHandler[Any, Any]":
+        handler = await continuation(handler_call_details)
+        if (
+            handler is None
+            or handler.unary_unary is None
+            or handler.response_serializer is None
+        ):
+            return handler
+
+        return handler._replace(  # type: ignore[attr-defined, no-any-return]
+            response_serializer=_passthrough_bytes(handler.response_serializer)
+        )
+
+
+def _passthrough_bytes(
+    serializer: Callable[[Any], bytes],
+) -> Callable[[Any], bytes]:
+    def serialize(response: Any) -> bytes:
+        if isinstance(response, bytes):
+            return response
+        return serializer(response)
+
+    return serialize
@@ -2,6 +2,7 @@ import grpc
 
 from modservice.constants import STATUS_BANNED, STATUS_HIDDEN, STATUS_UPLOADED
 from modservice.grpc import mod_pb2
+from modservice.repository.pool import PoolExhaustedError
 from modservice.service.service import ModService
 
 _ENUM_TO_DB_STATUS_BY_VALUE: dict[int, str] = {
@@ -30,6 +31,9 @@ async def SetStatus(
         context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
         context.set_details(str(e))
         return mod_pb2.SetStatusResponse(success=False)
+    except PoolExhaustedError:
+        # ErrorInterceptor отвечает RESOURCE_EXHAUSTED
+        raise
     except Exception as e:
         context.set_code(grpc.StatusCode.INTERNAL)
         context.set_details(f"Failed to set status: {e!s}")
@@ -0,0 +1,16 @@
+from collections.abc import AsyncIterator
+
+import grpc
+
+from modservice.grpc import mod_pb2
+from modservice.handler.get_mods import mod_to_proto
+from modservice.service.service import ModService
+
+
+async def StreamMods(
+    service: ModService,
+    request: mod_pb2.StreamModsRequest,  # noqa: ARG001
+    context: grpc.ServicerContext,  # noqa: ARG001
+) -> AsyncIterator[mod_pb2.Mod]:
+    async for mod in service.stream_mods():
+        yield mod_to_proto(mod)
@@ -0,0 +1,181 @@
+import asyncio
+import hmac
+import inspect
+import logging
+from collections.abc import Awaitable, Callable
+from typing import NamedTuple
+
+logger = logging.getLogger(__name__)
+
+HttpResponse = tuple[int, str, bytes]
+# Обработчик получает тело запроса и возвращает (код, content-type, тело),
+# синхронно или через await
+HttpHandler = Callable[[bytes], Awaitable[HttpResponse] | HttpResponse]
+
+MAX_BODY_SIZE = 1024 * 1024
+# Таймаут только на чтение запроса от клиента
+READ_TIMEOUT = 10.0
+# Обработчик, не уложившийся в HANDLER_TIMEOUT, получает 503: клиент
+# (например нотификатор S3) повторит запрос
+HANDLER_TIMEOUT = 30.0
+
+_REASONS = {
+    200: "OK",
+    202: "Accepted",
+    400: "Bad Request",
+    401: "Unauthorized",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+
+class PayloadTooLargeError(ValueError):
+    """Content-Length больше MAX_BODY_SIZE"""
+
+
+class HttpRequest(NamedTuple):
+    method: str
+    path: str
+    authorization: str
+    body: bytes
+
+
+class HttpServer:
+    """
+    Минимальный HTTP/1.1 сервер для служебных эндпоинтов (/metrics и т.п.).
+
+    Одно соединение — один запрос, без keep-alive и chunked encoding.
+    """
+
+    def __init__(self, host: str, port: int, reuse_port: bool = False) -> None:
+        self._host = host
+        self._port = port
+        self._reuse_port = reuse_port
+        self._routes: dict[tuple[str, str], HttpHandler] = {}
+        self._tokens: dict[tuple[str, str], str] = {}
+        self._server: asyncio.Server | None = None
+
+    def add_route(
+        self,
+        method: str,
+        path: str,
+        handler: HttpHandler,
+        token: str | None = None,
+    ) -> None:
+        """
+        token — если задан, запрос без заголовка
+        `Authorization: Bearer <token>` получает 401
+        """
+        self._routes[method.upper(), path] = handler
+        if token:
+            self._tokens[method.upper(), path] = token
+
+    @property
+    def port(self) -> int:
+        if self._server is None or not self._server.sockets:
+            return self._port
+        return int(self._server.sockets[0].getsockname()[1])
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(
+            self._handle_connection,
+            self._host,
+            self._port,
+            reuse_port=self._reuse_port or None,
+        )
+        logger.info(f"HTTP server listening on {self._host}:{self.port}")
+
+    async def close(self) -> None:
+        if self._server is None:
+            return
+        self._server.close()
+        await self._server.wait_closed()
+        self._server = None
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            request = await asyncio.wait_for(
+                self._read_request(reader), READ_TIMEOUT
+            )
+        except PayloadTooLargeError:
+            response = 413, "text/plain", b"payload too large\n"
+        except (TimeoutError, ValueError, asyncio.IncompleteReadError):
+            response = 400, "text/plain", b"bad request\n"
+        else:
+            response = await self._dispatch(request)
+
+        status, content_type, body = response
+        reason = _REASONS.get(status, "")
+        head = (
+            f"HTTP/1.1 {status} {reason}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: close\r\n\r\n"
+        )
+        try:
+            writer.write(head.encode("latin-1") + body)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> HttpRequest:
+        """
+        Raises:
+            PayloadTooLargeError: тело больше MAX_BODY_SIZE
+            ValueError: запрос не разобран
+        """
+        request_line = (await reader.readline()).decode("latin-1")
+        method, target, _ = request_line.split(" ", 2)
+        path = target.split("?", 1)[0]
+
+        content_length = 0
+        authorization = ""
+        while True:
+            line = (await reader.readline()).decode("latin-1")
+            if line in ("\r\n", "\n", ""):
+                break
+            name, _, value = line.partition(":")
+            name = name.strip().lower()
+            if name == "content-length":
+                content_length = int(value.strip())
+            elif name == "authorization":
+                authorization = value.strip()
+
+        if content_length > MAX_BODY_SIZE:
+            raise PayloadTooLargeError(f"Content-Length {content_length}")
+        body = await reader.readexactly(content_length)
+        return HttpRequest(method.upper(), path, authorization, body)
+
+    async def _dispatch(self, request: HttpRequest) -> HttpResponse:
+        method, path = request.method, request.path
+        handler = self._routes.get((method, path))
+        if handler is None:
+            if any(route_path == path for _, route_path in self._routes):
+                return 405, "text/plain", b"method not allowed\n"
+            return 404, "text/plain", b"not found\n"
+
+        token = self._tokens.get((method, path))
+        if token is not None and not hmac.compare_digest(
+            request.authorization.encode("latin-1"),
+            f"Bearer {token}".encode(),
+        ):
+            return 401, "text/plain", b"unauthorized\n"
+
+        try:
+            response = handler(request.body)
+            if inspect.isawaitable(response):
+                return await asyncio.wait_for(response, HANDLER_TIMEOUT)
+            return response
+        except TimeoutError:
+            logger.error(f"{method} {path}: обработчик не ответил вовремя")
+            return 503, "text/plain", b"service unavailable\n"
+        except Exception:
+            logger.exception(f"Ошибка обработки {method} {path}")
+            return 500, "text/plain", b"internal error\n"
@@ -0,0 +1,192 @@
+import functools
+import time
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+import prometheus_client
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    disable_created_metrics,
+    generate_latest,
+)
+from prometheus_client.metrics import MetricWrapperBase
+
+DEFAULT_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+CONTENT_TYPE = CONTENT_TYPE_LATEST
+
+# Метрики регистрируются в общем реестре prometheus_client: в /metrics
+# попадают и его метрики процесса (память, CPU, файловые дескрипторы)
+REGISTRY = prometheus_client.REGISTRY
+
+# Без отдельных рядов *_created у каждого счётчика и гистограммы
+disable_created_metrics()  # type: ignore[no-untyped-call]
+
+Labels = tuple[str, ...]
+
+
+def metrics_response(
+    _body: bytes = b"", registry: CollectorRegistry = REGISTRY
+) -> tuple[int, str, bytes]:
+    """Ответ для GET /metrics"""
+    return 200, CONTENT_TYPE, generate_latest(registry)
+
+
+class Metric[M: MetricWrapperBase]:
+    """
+    Обёртка над метрикой prometheus_client: значения меток передаются
+    кортежем в порядке labelnames, а value()/count() читают текущее
+    значение (для тестов и set_function).
+    """
+
+    def __init__(self, metric: M, labelnames: Labels) -> None:
+        self._metric = metric
+        self.labelnames = tuple(labelnames)
+
+    def _child(self, labels: Labels) -> M:
+        if not self.labelnames:
+            if labels:
+                raise ValueError(f"Metric has no labels, got {labels}")
+            return self._metric
+        return self._metric.labels(*labels)
+
+    def _sample(self, name: str, labels: Labels) -> float | None:
+        expected = dict(zip(self.labelnames, labels, strict=True))
+        for family in self._metric.collect():
+            for sample in family.samples:
+                if sample.name == name and sample.labels == expected:
+                    return sample.value
+        return None
+
+
+class Counter(Metric[prometheus_client.Counter]):
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Labels = (),
+        registry: CollectorRegistry | None = REGISTRY,
+    ) -> None:
+        super().__init__(
+            prometheus_client.Counter(
+                name, documentation, labelnames, registry=registry
+            ),
+            labelnames,
+        )
+        self._sample_name = f"{name.removesuffix('_total')}_total"
+
+    def inc(self, amount: float = 1.0, labels: Labels = ()) -> None:
+        self._child(labels).inc(amount)
+
+    def value(self, labels: Labels = ()) -> float:
+        return self._sample(self._sample_name, labels) or 0.0
+
+
+class Gauge(Metric[prometheus_client.Gauge]):
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Labels = (),
+        registry: CollectorRegistry | None = REGISTRY,
+    ) -> None:
+        super().__init__(
+            prometheus_client.Gauge(
+                name, documentation, labelnames, registry=registry
+            ),
+            labelnames,
+        )
+        self._name = name
+
+    def set(self, value: float, labels: Labels = ()) -> None:
+        self._child(labels).set(value)
+
+    def set_function(
+        self, function: Callable[[], float], labels: Labels = ()
+    ) -> None:
+        """Значение будет вычисляться при каждом чтении метрик"""
+        self._child(labels).set_function(function)
+
+    def value(self, labels: Labels = ()) -> float:
+        return self._sample(self._name, labels) or 0.0
+
+
+class Histogram(Metric[prometheus_client.Histogram]):
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Labels = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+        registry: CollectorRegistry | None = REGISTRY,
+    ) -> None:
+        super().__init__(
+            prometheus_client.Histogram(
+                name,
+                documentation,
+                labelnames,
+                buckets=buckets,
+                registry=registry,
+            ),
+            labelnames,
+        )
+        self._name = name
+
+    def observe(self, value: float, labels: Labels = ()) -> None:
+        self._child(labels).observe(value)
+
+    def count(self, labels: Labels = ()) -> int:
+        return int(self._sample(f"{self._name}_count", labels) or 0)
+
+    def sum(self, labels: Labels = ()) -> float:
+        return self._sample(f"{self._name}_sum", labels) or 0.0
+
+
+LAYER_DURATION = Histogram(
+    "modservice_layer_duration_seconds",
+    "Time spent in a service layer per operation",
+    ("layer", "operation"),
+)
+
+
+def timed[**P, R](
+    layer: str,
+) -> Callable[
+    [Callable[P, Coroutine[Any, Any, R]]], Callable[P, Coroutine[Any, Any, R]]
+]:
+    """
+    Декоратор корутины: время вызова пишется в LAYER_DURATION с метками
+    layer и operation (имя функции), в том числе при исключении.
+    """
+
+    def decorator(
+        fn: Callable[P, Coroutine[Any, Any, R]],
+    ) -> Callable[P, Coroutine[Any, Any, R]]:
+        labels = (layer, fn.__name__)
+
+        @functools.wraps(fn)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            started = time.perf_counter()
+            try:
+                return await fn(*args, **kwargs)
+            finally:
+                LAYER_DURATION.observe(time.perf_counter() - started, labels)
+
+        return wrapper
+
+    return decorator
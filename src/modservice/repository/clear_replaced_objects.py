@@ -0,0 +1,23 @@
+from modservice.repository.model import ReplacedObject
+from modservice.repository.pool import MeteredPool
+
+# Условие на replaced_s3_key не сотрёт запись, появившуюся после
+# чтения пачки
+CLEAR_REPLACED_OBJECTS_QUERY = """
+UPDATE mods
+SET replaced_s3_key = NULL
+FROM unnest($1::int[], $2::text[]) AS deleted(id, s3_key)
+WHERE mods.id = deleted.id
+AND mods.replaced_s3_key = deleted.s3_key
+"""
+
+
+async def clear_replaced_objects(
+    db_pool: MeteredPool, objects: list[ReplacedObject]
+) -> None:
+    async with db_pool.acquire() as conn:
+        await conn.execute(
+            CLEAR_REPLACED_OBJECTS_QUERY,
+            [obj.id for obj in objects],
+            [obj.s3_key for obj in objects],
+        )
@@ -1,22 +1,32 @@
-from asyncpg import Pool
+from modservice.repository.pool import MeteredPool
+
+# id берётся из sequence заранее, чтобы s3_key записался
+# тем же INSERT: без второго запроса и без строк с NULL s3_key
+CREATE_MOD_QUERY = """
+WITH new_mod AS (
+    SELECT nextval(pg_get_serial_sequence('mods', 'id')) AS id
+)
+INSERT INTO mods (id, author_id, title, description, version, s3_key, status, created_at)
+SELECT id, $1::int, $2, $3, $4::int, $1::int || '/' || id, 'UPLOADING', NOW()
+FROM new_mod
+RETURNING id, s3_key
+"""
 
 
 async def create_mod(
-    db_pool: Pool,
-    title: str,  # noqa: ARG001
-    author_id: int,  # noqa: ARG001
-    description: str,  # noqa: ARG001
-) -> int:
+    db_pool: MeteredPool,
+    title: str,
+    author_id: int,
+    description: str,
+) -> tuple[int, str]:
     async with db_pool.acquire() as conn:
-        mod_id: int = await conn.fetchval(
-            """
-            INSERT INTO mods (author_id, title, description, version, status, created_at)
-            VALUES ($1, $2, $3, $4, 'UPLOADING', NOW())
-            RETURNING id
-            """,
+        row = await conn.fetchrow(
+            CREATE_MOD_QUERY,
             author_id,
             title,
             description,
             1,
         )
-        return mod_id
+        if row is None:
+            raise RuntimeError("INSERT INTO mods не вернул строку")
+        return int(row["id"]), str(row["s3_key"])
@@ -0,0 +1,17 @@
+from modservice.repository.pool import MeteredPool
+
+# Без фильтра по статусу: объекты FAILED, HIDDEN и BANNED модов
+# остаются, пока есть строка в mods
+GET_EXISTING_MOD_IDS_QUERY = """
+SELECT id
+FROM mods
+WHERE id = ANY($1::int[]);
+"""
+
+
+async def get_existing_mod_ids(
+    db_pool: MeteredPool, ids: list[int]
+) -> set[int]:
+    async with db_pool.acquire() as conn:
+        rows = await conn.fetch(GET_EXISTING_MOD_IDS_QUERY, ids)
+        return {int(row["id"]) for row in rows}
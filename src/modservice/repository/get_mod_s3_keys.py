@@ -0,0 +1,17 @@
+from modservice.repository.pool import MeteredPool
+
+GET_MOD_S3_KEYS_QUERY = """
+SELECT id, s3_key
+FROM mods
+WHERE id = ANY($1::int[])
+AND status = 'UPLOADED'
+AND s3_key IS NOT NULL;
+"""
+
+
+async def get_mod_s3_keys(
+    db_pool: MeteredPool, ids: list[int]
+) -> dict[int, str]:
+    async with db_pool.acquire() as conn:
+        rows = await conn.fetch(GET_MOD_S3_KEYS_QUERY, ids)
+        return {int(row["id"]): str(row["s3_key"]) for row in rows}
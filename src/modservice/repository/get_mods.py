@@ -1,45 +1,78 @@
+from datetime import datetime
 from typing import Any
 
-from asyncpg import Pool
+from modservice.repository.model import ModFilter, ModRow
+from modservice.repository.pool import MeteredPool
+
+_SELECT_MODS = """
+SELECT
+    id,
+    author_id,
+    title,
+    description,
+    version,
+    s3_key,
+    status,
+    created_at
+FROM mods
+"""
+
+
+def build_get_mods_query(
+    limit: int,
+    after: tuple[datetime, int] | None = None,
+    mod_filter: ModFilter | None = None,
+) -> tuple[str, list[Any]]:
+    conditions: list[str] = []
+    args: list[Any] = []
+
+    def bind(value: Any) -> str:
+        args.append(value)
+        return f"${len(args)}"
+
+    if mod_filter is not None:
+        if mod_filter.author_id is not None:
+            conditions.append(f"author_id = {bind(mod_filter.author_id)}")
+        if mod_filter.statuses:
+            statuses = bind(list(mod_filter.statuses))
+            conditions.append(f"status = ANY({statuses}::mod_status[])")
+        if mod_filter.created_after is not None:
+            conditions.append(
+                f"created_at >= {bind(mod_filter.created_after)}"
+            )
+        if mod_filter.created_before is not None:
+            conditions.append(
+                f"created_at < {bind(mod_filter.created_before)}"
+            )
+
+    if after is not None:
+        created_at, mod_id = after
+        conditions.append(
+            f"(created_at, id) < ({bind(created_at)}, {bind(mod_id)})"
+        )
+
+    query = _SELECT_MODS
+    if conditions:
+        query += "WHERE " + "\nAND ".join(conditions) + "\n"
+    query += f"ORDER BY created_at DESC, id DESC\nLIMIT {bind(limit)}\n"
+
+    return query, args
 
 
 async def get_mods(
-    db_pool: Pool,
-) -> list[dict[str, Any]]:
+    db_pool: MeteredPool,
+    limit: int,
+    after: tuple[datetime, int] | None = None,
+    mod_filter: ModFilter | None = None,
+) -> list[ModRow]:
+    # NOTE: Поля для будущего добавления в БД:
+    # - avatar_url
+    # - download_count
+    # - tags
+    # - updated_at
+    query, args = build_get_mods_query(limit, after, mod_filter)
+
     async with db_pool.acquire() as conn:
-        # NOTE: Поля для будущего добавления в БД:
-        # - avatar_url
-        # - download_count
-        # - tags
-        # - updated_at
-        results = await conn.fetch(
-            """
-            SELECT
-                id,
-                author_id,
-                title,
-                description,
-                version,
-                s3_key,
-                status,
-                created_at
-            FROM mods
-            ORDER BY created_at DESC
-            """
-        )
+        results = await conn.fetch(query, *args)
 
-        mods = []
-        for row in results:
-            mod = {
-                "id": row["id"],
-                "author_id": row["author_id"],
-                "title": row["title"],
-                "description": row["description"],
-                "version": row["version"],
-                "s3_key": row["s3_key"],
-                "status": row["status"],
-                "created_at": row["created_at"],
-            }
-            mods.append(mod)
-
-        return mods
+        return list(map(ModRow._make, results))
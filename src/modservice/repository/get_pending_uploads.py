@@ -0,0 +1,29 @@
+from datetime import datetime
+
+from modservice.repository.model import PendingUpload
+from modservice.repository.pool import MeteredPool
+
+# Keyset-пагинация по (created_at, id): первая страница начинается
+# с (datetime.min, 0) — 0001-01-01, раньше любого created_at
+GET_PENDING_UPLOADS_QUERY = """
+SELECT id, s3_key, created_at
+FROM mods
+WHERE status = 'UPLOADING'
+AND s3_key IS NOT NULL
+AND (created_at, id) > ($1::timestamp, $2::int)
+ORDER BY created_at, id
+LIMIT $3
+"""
+
+
+async def get_pending_uploads(
+    db_pool: MeteredPool,
+    limit: int,
+    after: tuple[datetime, int] | None = None,
+) -> list[PendingUpload]:
+    created_at, mod_id = after if after is not None else (datetime.min, 0)
+    async with db_pool.acquire() as conn:
+        rows = await conn.fetch(
+            GET_PENDING_UPLOADS_QUERY, created_at, mod_id, limit
+        )
+        return [PendingUpload._make(row) for row in rows]
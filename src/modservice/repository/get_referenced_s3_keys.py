@@ -0,0 +1,17 @@
+from modservice.repository.pool import MeteredPool
+
+# После дедупликации объект может принадлежать одному моду, а
+# использоваться другим: такие s3_key сборщик мусора не трогает
+GET_REFERENCED_S3_KEYS_QUERY = """
+SELECT DISTINCT s3_key
+FROM mods
+WHERE s3_key = ANY($1::text[]);
+"""
+
+
+async def get_referenced_s3_keys(
+    db_pool: MeteredPool, s3_keys: list[str]
+) -> set[str]:
+    async with db_pool.acquire() as conn:
+        rows = await conn.fetch(GET_REFERENCED_S3_KEYS_QUERY, s3_keys)
+        return {str(row["s3_key"]) for row in rows}
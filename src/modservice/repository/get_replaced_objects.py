@@ -0,0 +1,25 @@
+from modservice.repository.model import ReplacedObject
+from modservice.repository.pool import MeteredPool
+
+# Копии mod.zip, ещё не удалённые после дедупликации и заменённые
+# больше min_age секунд назад; идёт по частичному индексу
+# mods_replaced_s3_key_id_idx
+GET_REPLACED_OBJECTS_QUERY = """
+SELECT id, replaced_s3_key
+FROM mods
+WHERE replaced_s3_key IS NOT NULL
+AND replaced_at < LOCALTIMESTAMP - make_interval(secs => $3)
+AND id > $1
+ORDER BY id
+LIMIT $2
+"""
+
+
+async def get_replaced_objects(
+    db_pool: MeteredPool, limit: int, after_id: int = 0, min_age: float = 0.0
+) -> list[ReplacedObject]:
+    async with db_pool.acquire() as conn:
+        rows = await conn.fetch(
+            GET_REPLACED_OBJECTS_QUERY, after_id, limit, min_age
+        )
+        return [ReplacedObject._make(row) for row in rows]
@@ -0,0 +1,27 @@
+from modservice.repository.model import UnhashedMod
+from modservice.repository.pool import MeteredPool
+
+# Идёт по частичному индексу mods_unhashed_id_idx; keyset по id.
+# Моды моложе min_age секунд пропускаются: пока жива ссылка на
+# загрузку, mod.zip под их s3_key ещё может быть перезаписан
+GET_UNHASHED_MODS_QUERY = """
+SELECT id, s3_key
+FROM mods
+WHERE status = 'UPLOADED'
+AND content_sha256 IS NULL
+AND s3_key IS NOT NULL
+AND created_at < LOCALTIMESTAMP - make_interval(secs => $3)
+AND id > $1
+ORDER BY id
+LIMIT $2
+"""
+
+
+async def get_unhashed_mods(
+    db_pool: MeteredPool, limit: int, after_id: int = 0, min_age: float = 0.0
+) -> list[UnhashedMod]:
+    async with db_pool.acquire() as conn:
+        rows = await conn.fetch(
+            GET_UNHASHED_MODS_QUERY, after_id, limit, min_age
+        )
+        return [UnhashedMod._make(row) for row in rows]
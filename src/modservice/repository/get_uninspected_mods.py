@@ -0,0 +1,24 @@
+from modservice.repository.model import UninspectedMod
+from modservice.repository.pool import MeteredPool
+
+# Загруженные моды без строки в mod_manifests; keyset по id
+GET_UNINSPECTED_MODS_QUERY = """
+SELECT mods.id, mods.s3_key
+FROM mods
+WHERE mods.status = 'UPLOADED'
+AND mods.s3_key IS NOT NULL
+AND mods.id > $1
+AND NOT EXISTS (
+    SELECT 1 FROM mod_manifests WHERE mod_manifests.mod_id = mods.id
+)
+ORDER BY mods.id
+LIMIT $2
+"""
+
+
+async def get_uninspected_mods(
+    db_pool: MeteredPool, limit: int, after_id: int = 0
+) -> list[UninspectedMod]:
+    async with db_pool.acquire() as conn:
+        rows = await conn.fetch(GET_UNINSPECTED_MODS_QUERY, after_id, limit)
+        return [UninspectedMod._make(row) for row in rows]
@@ -0,0 +1,19 @@
+from modservice.repository.pool import MeteredPool
+
+# Возраст считается по часам БД: created_at пишется её CURRENT_TIMESTAMP
+MARK_FAILED_UPLOADS_QUERY = """
+UPDATE mods
+SET status = 'FAILED'
+WHERE id = ANY($1::int[])
+AND status = 'UPLOADING'
+AND created_at < LOCALTIMESTAMP - make_interval(secs => $2)
+RETURNING id
+"""
+
+
+async def mark_failed_uploads(
+    db_pool: MeteredPool, mod_ids: list[int], max_age: float
+) -> list[int]:
+    async with db_pool.acquire() as conn:
+        rows = await conn.fetch(MARK_FAILED_UPLOADS_QUERY, mod_ids, max_age)
+        return [int(row["id"]) for row in rows]
@@ -0,0 +1,29 @@
+from modservice.repository.pool import MeteredPool
+
+# Один UPDATE на пачку: тройки (id, s3_key, size) приходят тремя
+# массивами, size может быть NULL, если источник его не сообщил.
+# Мод подтверждается, только если объект лежит под его s3_key:
+# загрузка в чужой префикс с тем же id мод не меняет.
+# Условие на статус не даёт перезаписать мод, который уже
+# перевели в другой статус (например BANNED)
+MARK_UPLOADED_QUERY = """
+UPDATE mods
+SET status = 'UPLOADED', size = COALESCE(uploaded.size, mods.size)
+FROM unnest($1::int[], $2::text[], $3::bigint[])
+    AS uploaded(id, s3_key, size)
+WHERE mods.id = uploaded.id
+AND mods.s3_key = uploaded.s3_key
+AND mods.status = 'UPLOADING'
+RETURNING mods.id
+"""
+
+
+async def mark_uploaded(
+    db_pool: MeteredPool,
+    mod_ids: list[int],
+    s3_keys: list[str],
+    sizes: list[int | None],
+) -> list[int]:
+    async with db_pool.acquire() as conn:
+        rows = await conn.fetch(MARK_UPLOADED_QUERY, mod_ids, s3_keys, sizes)
+        return [int(row["id"]) for row in rows]
@@ -0,0 +1,99 @@
+import asyncio
+import logging
+from collections.abc import Callable
+from typing import Any
+
+import asyncpg
+
+from modservice.constants import MOD_STATUS_CHANNEL
+from modservice.repository.pool import MeteredPool, PoolExhaustedError
+
+logger = logging.getLogger(__name__)
+
+
+class ModStatusListener:
+    """
+    Слушает LISTEN mod_status_changed на выделенном соединении из пула.
+
+    На каждое уведомление вызывает on_change(mod_id). При потере соединения
+    уведомления могли быть пропущены, поэтому вызывается on_reset() и
+    соединение переподключается с паузой retry_delay.
+    """
+
+    def __init__(
+        self,
+        db_pool: MeteredPool,
+        on_change: Callable[[int], None],
+        on_reset: Callable[[], None],
+        retry_delay: float = 1.0,
+    ) -> None:
+        self._db_pool = db_pool
+        self._on_change = on_change
+        self._on_reset = on_reset
+        self._retry_delay = retry_delay
+        self._conn: Any | None = None
+        self._reconnect_task: asyncio.Task[None] | None = None
+        self._closed = False
+
+    async def start(self) -> None:
+        conn = await self._db_pool.acquire_connection()
+        try:
+            await conn.add_listener(MOD_STATUS_CHANNEL, self._notify)
+        except BaseException:
+            await self._db_pool.release(conn)
+            raise
+        conn.add_termination_listener(self._terminated)
+        self._conn = conn
+        logger.info(f"Подписка на канал {MOD_STATUS_CHANNEL} установлена")
+
+    async def close(self) -> None:
+        self._closed = True
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        conn.remove_termination_listener(self._terminated)
+        await conn.remove_listener(MOD_STATUS_CHANNEL, self._notify)
+        await self._db_pool.release(conn)
+
+    def _notify(
+        self,
+        conn: Any,  # noqa: ARG002
+        pid: int,  # noqa: ARG002
+        channel: str,  # noqa: ARG002
+        payload: object,
+    ) -> None:
+        try:
+            mod_id = int(str(payload))
+        except ValueError:
+            logger.warning(f"Некорректный payload уведомления: {payload!r}")
+            return
+        self._on_change(mod_id)
+
+    def _terminated(self, conn: Any) -> None:
+        logger.warning(f"Соединение для канала {MOD_STATUS_CHANNEL} потеряно")
+        self._conn = None
+        self._on_reset()
+        if not self._closed:
+            self._reconnect_task = asyncio.create_task(self._reconnect(conn))
+
+    async def _reconnect(self, lost_conn: Any) -> None:
+        await self._db_pool.release(lost_conn)
+        while not self._closed:
+            await asyncio.sleep(self._retry_delay)
+            try:
+                await self.start()
+            except (
+                OSError,
+                asyncpg.PostgresError,
+                PoolExhaustedError,
+            ) as e:
+                logger.warning(f"Не удалось переподписаться: {e!s}")
+                continue
+            # Уведомления, пришедшие без подписки, потеряны
+            self._on_reset()
+            self._reconnect_task = None
+            return
@@ -1,4 +1,8 @@
 from dataclasses import dataclass
+from datetime import datetime
+from typing import NamedTuple
+
+from modservice.zip_manifest import ZipEntry
 
 
 @dataclass
@@ -7,3 +11,71 @@ class Mod:
     author_id: int
     filename: str
     description: str
+
+
+class ModRow(NamedTuple):
+    """
+    Строка mods в порядке колонок SELECT в get_mods/stream_mods.
+    Собирается из asyncpg.Record через ModRow._make(record), без
+    промежуточного dict.
+    """
+
+    id: int
+    author_id: int
+    title: str
+    description: str | None
+    version: int
+    s3_key: str | None
+    status: str
+    created_at: datetime
+
+
+class PendingUpload(NamedTuple):
+    """Мод в статусе UPLOADING, для которого ещё ждём mod.zip в S3"""
+
+    id: int
+    s3_key: str
+    created_at: datetime
+
+
+class UninspectedMod(NamedTuple):
+    """Загруженный мод, оглавление mod.zip которого ещё не прочитано"""
+
+    id: int
+    s3_key: str
+
+
+class ModManifest(NamedTuple):
+    """
+    Строка mod_manifests. Для повреждённого архива error содержит
+    причину, а размеры и список файлов пустые.
+    """
+
+    mod_id: int
+    file_count: int
+    compressed_size: int
+    uncompressed_size: int
+    entries: list[ZipEntry]
+    error: str | None = None
+
+
+class UnhashedMod(NamedTuple):
+    """Загруженный мод, для mod.zip которого ещё не посчитан SHA-256"""
+
+    id: int
+    s3_key: str
+
+
+class ReplacedObject(NamedTuple):
+    """Копия mod.zip мода под s3_key, с которого его перевели на оригинал"""
+
+    id: int
+    s3_key: str
+
+
+@dataclass(frozen=True)
+class ModFilter:
+    author_id: int | None = None
+    statuses: tuple[str, ...] = ()
+    created_after: datetime | None = None
+    created_before: datetime | None = None
@@ -0,0 +1,131 @@
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import asyncpg
+from asyncpg import Pool
+from asyncpg.pool import PoolConnectionProxy
+
+from modservice.metrics import Counter, Gauge, Histogram
+
+POOL_SIZE = Gauge("db_pool_size", "Open connections in the asyncpg pool")
+POOL_IN_USE = Gauge(
+    "db_pool_connections_in_use", "Connections checked out of the pool"
+)
+POOL_IDLE = Gauge("db_pool_connections_idle", "Idle connections in the pool")
+POOL_ACQUIRE_WAIT = Histogram(
+    "db_pool_acquire_wait_seconds",
+    "Time spent waiting for a pool connection",
+)
+POOL_ACQUIRE_TIMEOUTS = Counter(
+    "db_pool_acquire_timeouts_total",
+    "Pool acquires that failed with PoolExhaustedError",
+)
+
+
+class PoolExhaustedError(Exception):
+    """Соединение из пула не получено за acquire_timeout"""
+
+
+class MeteredPool:
+    """
+    asyncpg.Pool с таймаутом acquire() по умолчанию и метриками ожидания.
+
+    Репозиторий берёт соединения через `async with pool.acquire()`;
+    долгоживущее соединение (LISTEN) — через acquire_connection() и
+    release().
+    """
+
+    def __init__(
+        self, pool: Pool, acquire_timeout: float | None = None
+    ) -> None:
+        self._pool = pool
+        self._acquire_timeout = acquire_timeout
+
+    async def acquire_connection(
+        self, timeout: float | None = None
+    ) -> PoolConnectionProxy:
+        """
+        Raises:
+            PoolExhaustedError: свободного соединения не появилось за
+                timeout (по умолчанию acquire_timeout пула)
+        """
+        if timeout is None:
+            timeout = self._acquire_timeout
+
+        started = time.monotonic()
+        try:
+            return await self._pool.acquire(timeout=timeout)
+        except TimeoutError as e:
+            POOL_ACQUIRE_TIMEOUTS.inc()
+            raise PoolExhaustedError(
+                f"No database connection available within {timeout}s"
+            ) from e
+        finally:
+            POOL_ACQUIRE_WAIT.observe(time.monotonic() - started)
+
+    @asynccontextmanager
+    async def acquire(
+        self, timeout: float | None = None
+    ) -> AsyncIterator[PoolConnectionProxy]:
+        conn = await self.acquire_connection(timeout)
+        try:
+            yield conn
+        finally:
+            await self._pool.release(conn)
+
+    async def release(self, conn: PoolConnectionProxy) -> None:
+        await self._pool.release(conn)
+
+    async def close(self) -> None:
+        await self._pool.close()
+
+    def get_size(self) -> int:
+        return self._pool.get_size()
+
+    def get_idle_size(self) -> int:
+        return self._pool.get_idle_size()
+
+
+def register_pool_metrics(pool: MeteredPool) -> None:
+    POOL_SIZE.set_function(pool.get_size)
+    POOL_IDLE.set_function(pool.get_idle_size)
+    POOL_IN_USE.set_function(lambda: pool.get_size() - pool.get_idle_size())
+
+
+async def create_pool(
+    dsn: str,
+    *,
+    min_size: int = 1,
+    max_size: int = 10,
+    acquire_timeout: float | None = None,
+    command_timeout: float | None = None,
+    max_inactive_connection_lifetime: float = 300.0,
+    statement_cache_size: int = 100,
+    max_cached_statement_lifetime: int = 300,
+    prepared_statements: bool = True,
+) -> MeteredPool:
+    """
+    Запросы репозитория готовятся как именованные statement кешем
+    asyncpg: на каждом соединении при первом выполнении, дальше
+    переиспользуются (statement_cache_size, max_cached_statement_lifetime).
+
+    prepared_statements=False — режим для PgBouncer в transaction mode и
+    других пулеров без поддержки prepared statements: кеш отключается
+    (statement_cache_size=0), каждый запрос идёт безымянным statement.
+    """
+    if not prepared_statements:
+        statement_cache_size = 0
+
+    pool = await asyncpg.create_pool(
+        dsn,
+        min_size=min_size,
+        max_size=max_size,
+        max_inactive_connection_lifetime=max_inactive_connection_lifetime,
+        command_timeout=command_timeout,
+        statement_cache_size=statement_cache_size,
+        max_cached_statement_lifetime=max_cached_statement_lifetime,
+    )
+    metered = MeteredPool(pool, acquire_timeout)
+    register_pool_metrics(metered)
+    return metered
@@ -1,42 +1,207 @@
-from typing import Any
-
-from asyncpg import Pool
+from collections.abc import AsyncIterator
+from datetime import datetime
 
+from modservice.constants import S3_KEY_NOT_FOUND, STREAM_MODS_PREFETCH
+from modservice.metrics import timed
+from modservice.repository.clear_replaced_objects import (
+    clear_replaced_objects as _clear_replaced_objects,
+)
 from modservice.repository.create_mod import create_mod as _create_mod
+from modservice.repository.get_existing_mod_ids import (
+    get_existing_mod_ids as _get_existing_mod_ids,
+)
 from modservice.repository.get_mod_s3_key import (
     get_mod_s3_key as _get_mod_s3_key,
 )
+from modservice.repository.get_mod_s3_keys import (
+    get_mod_s3_keys as _get_mod_s3_keys,
+)
 from modservice.repository.get_mods import get_mods as _get_mods
-from modservice.repository.insert_s3_key import insert_s3_key as _insert_s3_key
+from modservice.repository.get_pending_uploads import (
+    get_pending_uploads as _get_pending_uploads,
+)
+from modservice.repository.get_referenced_s3_keys import (
+    get_referenced_s3_keys as _get_referenced_s3_keys,
+)
+from modservice.repository.get_replaced_objects import (
+    get_replaced_objects as _get_replaced_objects,
+)
+from modservice.repository.get_unhashed_mods import (
+    get_unhashed_mods as _get_unhashed_mods,
+)
+from modservice.repository.get_uninspected_mods import (
+    get_uninspected_mods as _get_uninspected_mods,
+)
+from modservice.repository.mark_failed_uploads import (
+    mark_failed_uploads as _mark_failed_uploads,
+)
+from modservice.repository.mark_uploaded import mark_uploaded as _mark_uploaded
+from modservice.repository.model import (
+    ModFilter,
+    ModManifest,
+    ModRow,
+    PendingUpload,
+    ReplacedObject,
+    UnhashedMod,
+    UninspectedMod,
+)
+from modservice.repository.pool import MeteredPool
+from modservice.repository.s3_key_cache import S3KeyCache
+from modservice.repository.save_mod_manifests import (
+    save_mod_manifests as _save_mod_manifests,
+)
+from modservice.repository.set_content_hash import (
+    set_content_hash as _set_content_hash,
+)
 from modservice.repository.set_status import set_status as _set_status
+from modservice.repository.stream_mods import stream_mods as _stream_mods
 
 
 class ModRepository:
-    def __init__(self, db_pool: Pool):
+    def __init__(
+        self, db_pool: MeteredPool, s3_key_cache: S3KeyCache | None = None
+    ):
         self._db_pool = db_pool
+        self._s3_key_cache = s3_key_cache
 
+    @timed("repository")
     async def create_mod(
         self,
         title: str,
         author_id: int,
         description: str,
-    ) -> int:
+    ) -> tuple[int, str]:
         return await _create_mod(self._db_pool, title, author_id, description)
 
-    async def insert_s3_key(
-        self,
-        mod_id: int,
-        author_id: int,
-    ) -> str:
-        return await _insert_s3_key(self._db_pool, mod_id, author_id)
-
+    @timed("repository")
     async def get_mod_s3_key(self, mod_id: int) -> str:
-        return str(await _get_mod_s3_key(self._db_pool, mod_id))
+        cache = self._s3_key_cache
+        if cache is None:
+            return str(await _get_mod_s3_key(self._db_pool, mod_id))
+
+        s3_key = cache.get(mod_id)
+        if s3_key is not None:
+            return s3_key
+
+        version = cache.version
+        s3_key = str(await _get_mod_s3_key(self._db_pool, mod_id))
+        if s3_key != S3_KEY_NOT_FOUND:
+            cache.put(mod_id, s3_key, version)
+        return s3_key
+
+    @timed("repository")
+    async def get_mod_s3_keys(self, mod_ids: list[int]) -> dict[int, str]:
+        cache = self._s3_key_cache
+        if cache is None:
+            return await _get_mod_s3_keys(self._db_pool, mod_ids)
 
+        s3_keys: dict[int, str] = {}
+        missing_ids = []
+        for mod_id in mod_ids:
+            s3_key = cache.get(mod_id)
+            if s3_key is None:
+                missing_ids.append(mod_id)
+            else:
+                s3_keys[mod_id] = s3_key
+
+        if missing_ids:
+            version = cache.version
+            fetched = await _get_mod_s3_keys(self._db_pool, missing_ids)
+            for mod_id, s3_key in fetched.items():
+                cache.put(mod_id, s3_key, version)
+            s3_keys.update(fetched)
+        return s3_keys
+
+    def invalidate_s3_key(self, mod_id: int) -> None:
+        if self._s3_key_cache is not None:
+            self._s3_key_cache.invalidate(mod_id)
+
+    def clear_s3_keys(self) -> None:
+        if self._s3_key_cache is not None:
+            self._s3_key_cache.clear()
+
+    @timed("repository")
     async def set_status(self, mod_id: int, status: str) -> bool:
         return await _set_status(self._db_pool, mod_id, status)
 
+    @timed("repository")
     async def get_mods(
         self,
-    ) -> list[dict[str, Any]]:
-        return await _get_mods(self._db_pool)
+        limit: int,
+        after: tuple[datetime, int] | None = None,
+        mod_filter: ModFilter | None = None,
+    ) -> list[ModRow]:
+        return await _get_mods(self._db_pool, limit, after, mod_filter)
+
+    @timed("repository")
+    async def get_pending_uploads(
+        self,
+        limit: int,
+        after: tuple[datetime, int] | None = None,
+    ) -> list[PendingUpload]:
+        return await _get_pending_uploads(self._db_pool, limit, after)
+
+    @timed("repository")
+    async def mark_failed_uploads(
+        self, mod_ids: list[int], max_age: float
+    ) -> list[int]:
+        return await _mark_failed_uploads(self._db_pool, mod_ids, max_age)
+
+    @timed("repository")
+    async def get_existing_mod_ids(self, mod_ids: list[int]) -> set[int]:
+        return await _get_existing_mod_ids(self._db_pool, mod_ids)
+
+    @timed("repository")
+    async def get_referenced_s3_keys(self, s3_keys: list[str]) -> set[str]:
+        return await _get_referenced_s3_keys(self._db_pool, s3_keys)
+
+    @timed("repository")
+    async def get_unhashed_mods(
+        self, limit: int, after_id: int = 0, min_age: float = 0.0
+    ) -> list[UnhashedMod]:
+        return await _get_unhashed_mods(
+            self._db_pool, limit, after_id, min_age
+        )
+
+    @timed("repository")
+    async def set_content_hash(self, mod_id: int, sha256: str) -> str | None:
+        return await _set_content_hash(self._db_pool, mod_id, sha256)
+
+    @timed("repository")
+    async def get_replaced_objects(
+        self, limit: int, after_id: int = 0, min_age: float = 0.0
+    ) -> list[ReplacedObject]:
+        return await _get_replaced_objects(
+            self._db_pool, limit, after_id, min_age
+        )
+
+    @timed("repository")
+    async def clear_replaced_objects(
+        self, objects: list[ReplacedObject]
+    ) -> None:
+        await _clear_replaced_objects(self._db_pool, objects)
+
+    @timed("repository")
+    async def get_uninspected_mods(
+        self, limit: int, after_id: int = 0
+    ) -> list[UninspectedMod]:
+        return await _get_uninspected_mods(self._db_pool, limit, after_id)
+
+    @timed("repository")
+    async def save_mod_manifests(self, manifests: list[ModManifest]) -> None:
+        await _save_mod_manifests(self._db_pool, manifests)
+
+    @timed("repository")
+    async def mark_uploaded(
+        self,
+        mod_ids: list[int],
+        s3_keys: list[str],
+        sizes: list[int | None],
+    ) -> list[int]:
+        return await _mark_uploaded(self._db_pool, mod_ids, s3_keys, sizes)
+
+    def stream_mods(
+        self,
+        prefetch: int = STREAM_MODS_PREFETCH,
+    ) -> AsyncIterator[ModRow]:
+        return _stream_mods(self._db_pool, prefetch)
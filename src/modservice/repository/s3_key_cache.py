@@ -0,0 +1,52 @@
+from collections import OrderedDict
+
+
+class S3KeyCache:
+    """
+    LRU-кеш mod_id → s3_key для модов в статусе UPLOADED.
+
+    s3_key загруженного мода не меняется, поэтому записи живут до вытеснения
+    или до invalidate() по уведомлению о смене статуса. put() принимает
+    version, снятую до похода в БД, и игнорирует её, если с тех пор была
+    инвалидация.
+    """
+
+    def __init__(self, max_size: int = 100_000) -> None:
+        self._max_size = max_size
+        self._entries: OrderedDict[int, str] = OrderedDict()
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, mod_id: int) -> str | None:
+        s3_key = self._entries.get(mod_id)
+        if s3_key is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(mod_id)
+        self.hits += 1
+        return s3_key
+
+    def put(
+        self, mod_id: int, s3_key: str, version: int | None = None
+    ) -> None:
+        if version is not None and version != self.version:
+            return
+
+        self._entries[mod_id] = s3_key
+        self._entries.move_to_end(mod_id)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, mod_id: int) -> None:
+        self.version += 1
+        self._entries.pop(mod_id, None)
+
+    def clear(self) -> None:
+        self.version += 1
+        self._entries.clear()
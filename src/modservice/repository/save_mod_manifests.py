@@ -0,0 +1,51 @@
+import json
+
+from modservice.repository.model import ModManifest
+from modservice.repository.pool import MeteredPool
+
+# Одна вставка на пачку: колонки приходят параллельными массивами
+SAVE_MOD_MANIFESTS_QUERY = """
+INSERT INTO mod_manifests (
+    mod_id, file_count, compressed_size, uncompressed_size, entries, error
+)
+SELECT *
+FROM unnest(
+    $1::int[], $2::int[], $3::bigint[], $4::bigint[], $5::jsonb[], $6::text[]
+)
+ON CONFLICT (mod_id) DO UPDATE
+SET file_count = EXCLUDED.file_count,
+    compressed_size = EXCLUDED.compressed_size,
+    uncompressed_size = EXCLUDED.uncompressed_size,
+    entries = EXCLUDED.entries,
+    error = EXCLUDED.error,
+    inspected_at = CURRENT_TIMESTAMP
+"""
+
+
+def _entries_json(manifest: ModManifest) -> str:
+    return json.dumps(
+        [
+            {
+                "name": entry.name,
+                "size": entry.uncompressed_size,
+                "compressed_size": entry.compressed_size,
+            }
+            for entry in manifest.entries
+        ],
+        ensure_ascii=False,
+    )
+
+
+async def save_mod_manifests(
+    db_pool: MeteredPool, manifests: list[ModManifest]
+) -> None:
+    async with db_pool.acquire() as conn:
+        await conn.execute(
+            SAVE_MOD_MANIFESTS_QUERY,
+            [manifest.mod_id for manifest in manifests],
+            [manifest.file_count for manifest in manifests],
+            [manifest.compressed_size for manifest in manifests],
+            [manifest.uncompressed_size for manifest in manifests],
+            [_entries_json(manifest) for manifest in manifests],
+            [manifest.error for manifest in manifests],
+        )
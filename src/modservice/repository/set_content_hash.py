@@ -0,0 +1,45 @@
+from modservice.repository.pool import MeteredPool
+
+# Моды с одинаковым хешем сериализуются advisory-блокировкой: два
+# одновременно посчитанных дубликата не станут оба «первыми»
+LOCK_CONTENT_HASH_QUERY = """
+SELECT pg_advisory_xact_lock(hashtextextended($1, 0))
+"""
+
+# Записывает хеш и, если такой объект уже есть у другого мода,
+# переводит s3_key на него, а прежний s3_key и время перевода
+# запоминает в replaced_s3_key/replaced_at до удаления копии.
+# Возвращает итоговый s3_key или
+# ничего, если хеш мода уже записан
+SET_CONTENT_HASH_QUERY = """
+WITH original AS (
+    SELECT s3_key
+    FROM mods
+    WHERE content_sha256 = $2
+    AND id <> $1
+    AND s3_key IS NOT NULL
+    ORDER BY id
+    LIMIT 1
+)
+UPDATE mods
+SET content_sha256 = $2,
+    s3_key = COALESCE((SELECT s3_key FROM original), mods.s3_key),
+    replaced_s3_key = CASE
+        WHEN (SELECT s3_key FROM original) <> mods.s3_key THEN mods.s3_key
+    END,
+    replaced_at = CASE
+        WHEN (SELECT s3_key FROM original) <> mods.s3_key THEN LOCALTIMESTAMP
+    END
+WHERE id = $1
+AND content_sha256 IS NULL
+RETURNING s3_key
+"""
+
+
+async def set_content_hash(
+    db_pool: MeteredPool, mod_id: int, sha256: str
+) -> str | None:
+    async with db_pool.acquire() as conn, conn.transaction():
+        await conn.execute(LOCK_CONTENT_HASH_QUERY, sha256)
+        row = await conn.fetchrow(SET_CONTENT_HASH_QUERY, mod_id, sha256)
+        return None if row is None else str(row["s3_key"])
@@ -1,19 +1,20 @@
-from asyncpg import Pool
+from modservice.repository.pool import MeteredPool, PoolExhaustedError
 
+SET_STATUS_QUERY = """
+UPDATE mods
+SET status = $1
+WHERE id = $2
+"""
 
-async def set_status(db_pool: Pool, mod_id: int, status: str) -> bool:
+
+async def set_status(db_pool: MeteredPool, mod_id: int, status: str) -> bool:
     try:
         async with db_pool.acquire() as conn:
-            result = await conn.execute(
-                """
-                UPDATE mods
-                SET status = $1
-                WHERE id = $2
-                """,
-                status,
-                mod_id,
-            )
+            result = await conn.execute(SET_STATUS_QUERY, status, mod_id)
             rows_affected = int(result.split()[-1]) if result else 0
             return rows_affected > 0
+    except PoolExhaustedError:
+        # ErrorInterceptor отвечает RESOURCE_EXHAUSTED
+        raise
     except Exception:
         return False
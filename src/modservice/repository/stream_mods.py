@@ -0,0 +1,29 @@
+from collections.abc import AsyncIterator
+
+from modservice.repository.model import ModRow
+from modservice.repository.pool import MeteredPool
+
+
+async def stream_mods(
+    db_pool: MeteredPool,
+    prefetch: int,
+) -> AsyncIterator[ModRow]:
+    async with db_pool.acquire() as conn, conn.transaction(readonly=True):
+        # Серверный курсор: в памяти не больше prefetch строк за раз
+        async for row in conn.cursor(
+            """
+            SELECT
+                id,
+                author_id,
+                title,
+                description,
+                version,
+                s3_key,
+                status,
+                created_at
+            FROM mods
+            ORDER BY created_at DESC, id DESC
+            """,
+            prefetch=prefetch,
+        ):
+            yield ModRow._make(row)
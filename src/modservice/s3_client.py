@@ -1,13 +1,84 @@
+import asyncio
+import contextlib
+import hashlib
 import logging
-from typing import Any
+import math
+import os
+from collections.abc import AsyncIterator
+from concurrent.futures import Executor
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any, Self
 
 import aioboto3
 import aiofiles
 from aiobotocore.config import AioConfig
+from botocore.exceptions import ClientError
+
+from modservice.constants import (
+    S3_DEFAULT_PART_SIZE,
+    S3_DELETE_BATCH_SIZE,
+    S3_DOWNLOAD_CHUNK_SIZE,
+    S3_MAX_PARTS,
+    S3_MIN_PART_SIZE,
+)
+from modservice.metrics import timed
+from modservice.s3_presigner import S3Presigner
 
 logger = logging.getLogger(__name__)
 
 
+_NOT_FOUND_CODES = frozenset({"404", "NoSuchKey", "NotFound"})
+
+
+@dataclass(frozen=True)
+class S3ObjectPage:
+    """
+    Страница листинга. next_token передаётся в iter_objects, чтобы
+    продолжить листинг с этой страницы; None — страница последняя.
+    """
+
+    objects: list[dict[str, Any]]
+    next_token: str | None
+
+
+def _object_info(obj: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "key": obj["Key"],
+        "size": obj["Size"],
+        "last_modified": obj["LastModified"],
+        "etag": obj["ETag"],
+    }
+
+
+def _file_md5(path: str, start: int = 0, length: int = -1) -> Any:
+    md5 = hashlib.md5(usedforsecurity=False)
+    with open(path, "rb") as file:
+        file.seek(start)
+        while length != 0:
+            size = S3_DOWNLOAD_CHUNK_SIZE
+            if length > 0:
+                size = min(size, length)
+            chunk = file.read(size)
+            if not chunk:
+                break
+            md5.update(chunk)
+            if length > 0:
+                length -= len(chunk)
+    return md5
+
+
+def _multipart_etag(path: str, part_size: int) -> str:
+    size = os.path.getsize(path)
+    digests = b"".join(
+        _file_md5(path, start, part_size).digest()
+        for start in range(0, size, part_size)
+    )
+    count = max(math.ceil(size / part_size), 1)
+    return f"{hashlib.md5(digests, usedforsecurity=False).hexdigest()}-{count}"
+
+
 class S3Client:
     def __init__(
         self,
@@ -16,20 +87,40 @@ class S3Client:
         endpoint_url: str,
         bucket_name: str,
         verify: bool,
+        max_pool_connections: int = 10,
+        local_presign: bool = True,
+        multipart_part_size: int = S3_DEFAULT_PART_SIZE,
+        multipart_concurrency: int = 4,
     ) -> None:
         self.endpoint_url = endpoint_url
         self.access_key = access_key
         self.secret_key = secret_key
         self.bucket_name = bucket_name
         self.ssl_verify = verify
+        self.multipart_part_size = max(multipart_part_size, S3_MIN_PART_SIZE)
+        self.multipart_concurrency = max(multipart_concurrency, 1)
 
         self.config = AioConfig(
             signature_version="s3v4",
             s3={"addressing_style": "virtual"},
             region_name="ru-central-1",
+            max_pool_connections=max_pool_connections,
         )
 
         self.session = aioboto3.Session()
+        self._client: Any | None = None
+        self._client_stack: AsyncExitStack | None = None
+
+        # Presigned URL подписываются локально, без botocore клиента
+        self.presigner: S3Presigner | None = None
+        if local_presign:
+            self.presigner = S3Presigner(
+                access_key=self.access_key,
+                secret_key=self.secret_key,
+                endpoint_url=self.endpoint_url,
+                bucket_name=self.bucket_name,
+                region_name="ru-central-1",
+            )
 
         logger.info(f"Инициализирован S3Client для бакета: {self.bucket_name}")
         logger.info(f"Endpoint: {self.endpoint_url}")
@@ -48,18 +139,89 @@ class S3Client:
             region_name="ru-central-1",
         )
 
-    async def upload_file(self, file_path: str, s3_key: str) -> bool:
+    async def start(self) -> None:
+        """
+        Открывает долгоживущий клиент S3, который переиспользуется всеми
+        вызовами до close(). Без start() каждый вызов создаёт свой клиент.
+        """
+        if self._client is not None:
+            return
+
+        stack = AsyncExitStack()
+        self._client = await stack.enter_async_context(self.get_client())
+        self._client_stack = stack
+        logger.info("Открыт долгоживущий S3 клиент")
+
+    async def close(self) -> None:
+        if self._client_stack is None:
+            return
+
+        stack = self._client_stack
+        self._client_stack = None
+        self._client = None
+        await stack.aclose()
+        logger.info("Долгоживущий S3 клиент закрыт")
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    @asynccontextmanager
+    async def _client_context(self) -> AsyncIterator[Any]:
+        if self._client is not None:
+            yield self._client
+            return
+
+        async with self.get_client() as client:
+            yield client
+
+    async def upload_file(
+        self,
+        file_path: str,
+        s3_key: str,
+        part_size: int | None = None,
+        concurrency: int | None = None,
+    ) -> bool:
+        """
+        Загружает файл в S3 потоково.
+
+        Файл не больше part_size уходит одним put_object, больший —
+        multipart upload: части читаются по очереди и отправляются не более
+        чем по concurrency одновременно, поэтому в памяти держится не больше
+        part_size × concurrency байт. При ошибке multipart upload
+        прерывается, и S3 удаляет уже загруженные части.
+
+        Args:
+            file_path: Путь к локальному файлу
+            s3_key: Ключ объекта в S3
+            part_size: Размер части (по умолчанию multipart_part_size)
+            concurrency: Число одновременно загружаемых частей
+        """
+        part_size = max(
+            part_size or self.multipart_part_size, S3_MIN_PART_SIZE
+        )
+        concurrency = max(concurrency or self.multipart_concurrency, 1)
         try:
             logger.info(f"Загружаем файл {file_path} как {s3_key}")
 
-            async with (
-                self.get_client() as client,
-                aiofiles.open(file_path, "rb") as file,
-            ):
-                payload = await file.read()
-                await client.put_object(
-                    Bucket=self.bucket_name, Key=s3_key, Body=payload
-                )
+            size = os.path.getsize(file_path)
+            async with self._client_context() as client:
+                if size <= part_size:
+                    async with aiofiles.open(file_path, "rb") as file:
+                        payload = await file.read()
+                    await client.put_object(
+                        Bucket=self.bucket_name, Key=s3_key, Body=payload
+                    )
+                else:
+                    # Частей не больше S3_MAX_PARTS: для огромных файлов
+                    # часть увеличивается
+                    part_size = max(part_size, math.ceil(size / S3_MAX_PARTS))
+                    await self._upload_multipart(
+                        client, file_path, s3_key, part_size, concurrency
+                    )
 
             logger.info(f"Файл успешно загружен: {s3_key}")
             return True
@@ -68,29 +230,356 @@ class S3Client:
             logger.error(f"Ошибка при загрузке файла {file_path}: {e!s}")
             return False
 
-    async def download_file(self, s3_key: str, local_path: str) -> bool:
+    async def _upload_multipart(
+        self,
+        client: Any,
+        file_path: str,
+        s3_key: str,
+        part_size: int,
+        concurrency: int,
+    ) -> None:
+        response = await client.create_multipart_upload(
+            Bucket=self.bucket_name, Key=s3_key
+        )
+        upload_id = response["UploadId"]
         try:
-            import os
+            parts = await self._upload_parts(
+                client, file_path, s3_key, upload_id, part_size, concurrency
+            )
+            await client.complete_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=s3_key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except BaseException:
+            logger.warning(f"Прерываем multipart upload {upload_id}: {s3_key}")
+            try:
+                await client.abort_multipart_upload(
+                    Bucket=self.bucket_name, Key=s3_key, UploadId=upload_id
+                )
+            except Exception as e:
+                # Незавершённые части удалит lifecycle-правило бакета
+                logger.error(
+                    f"Не удалось прервать multipart upload {upload_id}: {e!s}"
+                )
+            raise
 
+    async def _upload_parts(
+        self,
+        client: Any,
+        file_path: str,
+        s3_key: str,
+        upload_id: str,
+        part_size: int,
+        concurrency: int,
+    ) -> list[dict[str, Any]]:
+        # Слот берётся до чтения части: прочитанных, но не отправленных
+        # частей не больше concurrency
+        slots = asyncio.Semaphore(concurrency)
+        parts: list[dict[str, Any]] = []
+
+        async def upload_part(part_number: int, body: bytes) -> None:
+            try:
+                response = await client.upload_part(
+                    Bucket=self.bucket_name,
+                    Key=s3_key,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    Body=body,
+                )
+                parts.append(
+                    {"ETag": response["ETag"], "PartNumber": part_number}
+                )
+            finally:
+                slots.release()
+
+        async with (
+            aiofiles.open(file_path, "rb") as file,
+            asyncio.TaskGroup() as tasks,
+        ):
+            part_number = 0
+            while True:
+                await slots.acquire()
+                body = await file.read(part_size)
+                if not body:
+                    slots.release()
+                    break
+                part_number += 1
+                tasks.create_task(upload_part(part_number, body))
+
+        logger.info(f"Загружено {part_number} частей для {s3_key}")
+        return sorted(parts, key=lambda part: part["PartNumber"])
+
+    async def download_file(
+        self,
+        s3_key: str,
+        local_path: str,
+        parallel: bool = False,
+        part_size: int | None = None,
+        concurrency: int | None = None,
+    ) -> bool:
+        """
+        Скачивает объект из S3 потоково, записывая куски по мере прихода.
+
+        С parallel=True объект больше part_size делится на диапазоны,
+        которые скачиваются по concurrency одновременно и пишутся
+        os.pwrite по своим смещениям в заранее выделенный файл. Диапазоны
+        запрашиваются с IfMatch на ETag из HEAD, поэтому объект не может
+        смениться посреди скачивания. Результат сверяется с ETag; файл
+        пишется во временный local_path + ".part" и переименовывается
+        только после успешной проверки.
+
+        Args:
+            s3_key: Ключ объекта в S3
+            local_path: Куда сохранить файл
+            parallel: Скачивать большой объект диапазонами параллельно
+            part_size: Размер диапазона (по умолчанию multipart_part_size)
+            concurrency: Число одновременно скачиваемых диапазонов
+        """
+        part_size = part_size or self.multipart_part_size
+        concurrency = max(concurrency or self.multipart_concurrency, 1)
+        tmp_path = local_path + ".part"
+        try:
             dir_path = os.path.dirname(local_path)
             if dir_path:
                 os.makedirs(dir_path, exist_ok=True)
 
-            async with self.get_client() as client:
+            async with self._client_context() as client:
+                head = None
+                if parallel:
+                    head = await client.head_object(
+                        Bucket=self.bucket_name, Key=s3_key
+                    )
+
+                if head is not None and head["ContentLength"] > part_size:
+                    etag = head["ETag"]
+                    await self._download_ranges(
+                        client,
+                        s3_key,
+                        tmp_path,
+                        head["ContentLength"],
+                        etag,
+                        part_size,
+                        concurrency,
+                    )
+                    md5 = None
+                else:
+                    etag, md5 = await self._download_stream(
+                        client, s3_key, tmp_path
+                    )
+
+                await self._verify_etag(client, s3_key, tmp_path, etag, md5)
+
+            os.replace(tmp_path, local_path)
+            return True
+
+        except Exception as e:
+            logger.error(f"Ошибка при скачивании файла {s3_key}: {e!s}")
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tmp_path)
+            return False
+
+    async def _download_stream(
+        self, client: Any, s3_key: str, path: str
+    ) -> tuple[str, Any]:
+        response = await client.get_object(Bucket=self.bucket_name, Key=s3_key)
+        md5 = hashlib.md5(usedforsecurity=False)
+        async with (
+            response["Body"] as stream,
+            aiofiles.open(path, "wb") as file,
+        ):
+            while chunk := await stream.read(S3_DOWNLOAD_CHUNK_SIZE):
+                md5.update(chunk)
+                await file.write(chunk)
+        return str(response["ETag"]), md5
+
+    async def _download_ranges(
+        self,
+        client: Any,
+        s3_key: str,
+        path: str,
+        size: int,
+        etag: str,
+        part_size: int,
+        concurrency: int,
+    ) -> None:
+        slots = asyncio.Semaphore(concurrency)
+
+        async def download_range(fd: int, start: int) -> None:
+            end = min(start + part_size, size) - 1
+            async with slots:
                 response = await client.get_object(
-                    Bucket=self.bucket_name, Key=s3_key
+                    Bucket=self.bucket_name,
+                    Key=s3_key,
+                    Range=f"bytes={start}-{end}",
+                    IfMatch=etag,
                 )
+                offset = start
                 async with response["Body"] as stream:
-                    content = await stream.read()
+                    while chunk := await stream.read(S3_DOWNLOAD_CHUNK_SIZE):
+                        await asyncio.to_thread(os.pwrite, fd, chunk, offset)
+                        offset += len(chunk)
+            if offset != end + 1:
+                raise ValueError(
+                    f"Диапазон {start}-{end} получен не полностью: {offset}"
+                )
 
-                async with aiofiles.open(local_path, "wb") as file:
-                    await file.write(content)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            # Место под файл выделяется сразу: диапазоны пишутся вразнобой
+            if hasattr(os, "posix_fallocate"):
+                os.posix_fallocate(fd, 0, size)
+            else:
+                os.ftruncate(fd, size)
+            async with asyncio.TaskGroup() as tasks:
+                for start in range(0, size, part_size):
+                    tasks.create_task(download_range(fd, start))
+        finally:
+            os.close(fd)
+
+        logger.info(
+            f"Скачано {math.ceil(size / part_size)} диапазонов для {s3_key}"
+        )
 
-            return True
+    async def _verify_etag(
+        self, client: Any, s3_key: str, path: str, etag: str, md5: Any
+    ) -> None:
+        """
+        ETag обычного объекта — MD5 содержимого, multipart объекта — MD5
+        от MD5 частей с суффиксом -N. Размер части берётся из HEAD первой
+        части. ETag других форм (например при SSE-KMS) не проверяется.
+        """
+        etag = etag.strip('"')
+        value, _, parts = etag.partition("-")
+        if len(value) != 32:
+            logger.warning(f"ETag {etag} не MD5, проверка пропущена: {s3_key}")
+            return
+
+        if not parts:
+            if md5 is None:
+                md5 = await asyncio.to_thread(_file_md5, path)
+            actual = md5.hexdigest()
+        else:
+            head = await client.head_object(
+                Bucket=self.bucket_name, Key=s3_key, PartNumber=1
+            )
+            actual = await asyncio.to_thread(
+                _multipart_etag, path, head["ContentLength"]
+            )
 
-        except Exception as e:
-            logger.error(f"Ошибка при скачивании файла {s3_key}: {e!s}")
-            return False
+        if actual != etag:
+            raise ValueError(f"ETag не совпадает: ожидался {etag}, {actual}")
+
+    async def head_object(self, s3_key: str) -> dict[str, Any] | None:
+        """
+        Метаданные объекта через HEAD или None, если объекта нет.
+        Остальные ошибки S3 пробрасываются.
+        """
+        try:
+            async with self._client_context() as client:
+                response = await client.head_object(
+                    Bucket=self.bucket_name, Key=s3_key
+                )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in _NOT_FOUND_CODES:
+                return None
+            raise
+
+        return {
+            "key": s3_key,
+            "size": response["ContentLength"],
+            "last_modified": response["LastModified"],
+            "etag": response["ETag"],
+        }
+
+    async def object_sha256(
+        self, s3_key: str, executor: Executor | None = None
+    ) -> str:
+        """
+        SHA-256 объекта (hex) по мере чтения тела кусками
+        S3_DOWNLOAD_CHUNK_SIZE: в памяти не больше двух кусков. Хеш
+        считается в executor (по умолчанию — пул потоков loop), пока
+        читается следующий кусок, и не занимает event loop.
+        """
+        loop = asyncio.get_running_loop()
+        digest = hashlib.sha256()
+        async with self._client_context() as client:
+            response = await client.get_object(
+                Bucket=self.bucket_name, Key=s3_key
+            )
+            hashing: asyncio.Future[None] | None = None
+            async with response["Body"] as stream:
+                while chunk := await stream.read(S3_DOWNLOAD_CHUNK_SIZE):
+                    if hashing is not None:
+                        await hashing
+                    hashing = loop.run_in_executor(
+                        executor, digest.update, chunk
+                    )
+            if hashing is not None:
+                await hashing
+        return digest.hexdigest()
+
+    async def get_object_range(
+        self, s3_key: str, start: int, end: int | None = None
+    ) -> tuple[bytes, int]:
+        """
+        Читает диапазон байт объекта одним ranged GET.
+
+        Args:
+            s3_key: Ключ объекта
+            start: Первый байт; отрицательный — последние -start байт
+            end: Последний байт включительно; None — до конца объекта
+
+        Returns:
+            tuple[bytes, int]: Байты диапазона и полный размер объекта
+        """
+        byte_range = f"bytes={start}"
+        if start >= 0:
+            byte_range += f"-{'' if end is None else end}"
+
+        async with self._client_context() as client:
+            response = await client.get_object(
+                Bucket=self.bucket_name, Key=s3_key, Range=byte_range
+            )
+            async with response["Body"] as stream:
+                data = await stream.read()
+
+        # ContentRange: "bytes 100-199/200"
+        content_range = response.get("ContentRange")
+        if not content_range:
+            return data, len(data)
+        return data, int(content_range.rsplit("/", 1)[1])
+
+    async def delete_objects(self, s3_keys: list[str]) -> list[str]:
+        """
+        Удаляет объекты запросами DeleteObjects по S3_DELETE_BATCH_SIZE
+        ключей. Удаление отсутствующего ключа S3 считает успешным.
+
+        Returns:
+            list[str]: Ключи, которые S3 не удалил (Errors в ответе).
+            Ошибка запроса целиком пробрасывается.
+        """
+        failed: list[str] = []
+        async with self._client_context() as client:
+            for start in range(0, len(s3_keys), S3_DELETE_BATCH_SIZE):
+                batch = s3_keys[start : start + S3_DELETE_BATCH_SIZE]
+                response = await client.delete_objects(
+                    Bucket=self.bucket_name,
+                    Delete={
+                        "Objects": [{"Key": key} for key in batch],
+                        "Quiet": True,
+                    },
+                )
+                for error in response.get("Errors", []):
+                    logger.warning(
+                        f"Не удалось удалить {error['Key']}: "
+                        f"{error.get('Code')} {error.get('Message')}"
+                    )
+                    failed.append(error["Key"])
+
+        logger.info(f"Удалено {len(s3_keys) - len(failed)} объектов")
+        return failed
 
     def time_format(self, seconds: int | None) -> str:
         if seconds is not None:
@@ -109,6 +598,7 @@ class S3Client:
                 return f"{s:02d}s"
         return "-"
 
+    @timed("s3")
     async def generate_presigned_put_url(
         self,
         s3_key: str,
@@ -135,7 +625,12 @@ class S3Client:
 
             logger.info(f"Генерируем presigned PUT URL для {s3_key}")
 
-            async with self.get_client() as client:
+            if self.presigner is not None:
+                return self.presigner.presign(
+                    "PUT", s3_key, expiration, content_type
+                )
+
+            async with self._client_context() as client:
                 params: dict[str, Any] = {
                     "Bucket": self.bucket_name,
                     "Key": s3_key,
@@ -158,6 +653,7 @@ class S3Client:
             logger.error(error_msg)
             raise Exception(error_msg) from e
 
+    @timed("s3")
     async def generate_presigned_get_url(
         self,
         s3_key: str,
@@ -182,7 +678,10 @@ class S3Client:
 
             logger.info(f"Генерируем presigned GET URL для {s3_key}")
 
-            async with self.get_client() as client:
+            if self.presigner is not None:
+                return self.presigner.presign("GET", s3_key, expiration)
+
+            async with self._client_context() as client:
                 url = await client.generate_presigned_url(
                     "get_object",
                     Params={"Bucket": self.bucket_name, "Key": s3_key},
@@ -199,6 +698,58 @@ class S3Client:
             logger.error(error_msg)
             raise Exception(error_msg) from e
 
+    @timed("s3")
+    async def generate_presigned_get_urls(
+        self,
+        s3_keys: list[str],
+        expiration: int = 3600,
+    ) -> list[str]:
+        """
+        Генерирует presigned GET URL для набора ключей за один проход
+
+        Args:
+            s3_keys: Ключи файлов в S3
+            expiration: Время жизни ссылок в секундах (по умолчанию 1 час)
+
+        Returns:
+            list[str]: Presigned URL в порядке s3_keys
+
+        Raises:
+            Exception: В случае ошибки генерации URL
+        """
+        try:
+            keys = [s3_key.lstrip("/") for s3_key in s3_keys]
+
+            logger.info(f"Генерируем {len(keys)} presigned GET URL")
+
+            if self.presigner is not None:
+                # Одна метка времени на весь пакет
+                now = datetime.now(UTC)
+                return [
+                    self.presigner.presign("GET", key, expiration, now=now)
+                    for key in keys
+                ]
+
+            urls = []
+            async with self._client_context() as client:
+                for key in keys:
+                    url = await client.generate_presigned_url(
+                        "get_object",
+                        Params={"Bucket": self.bucket_name, "Key": key},
+                        ExpiresIn=expiration,
+                    )
+                    urls.append(str(url))
+
+            logger.info(f"Сгенерировано {len(urls)} presigned GET URL")
+            return urls
+
+        except Exception as e:
+            error_msg = (
+                f"Ошибка при пакетной генерации presigned GET URL: {e!s}"
+            )
+            logger.error(error_msg)
+            raise Exception(error_msg) from e
+
     async def list_objects(self, prefix: str = "") -> list[dict[str, Any]]:
         """
         Получает список всех объектов в бакете
@@ -214,7 +765,7 @@ class S3Client:
 
             objects = []
 
-            async with self.get_client() as client:
+            async with self._client_context() as client:
                 paginator = client.get_paginator("list_objects_v2")
 
                 async for page in paginator.paginate(
@@ -222,14 +773,7 @@ class S3Client:
                 ):
                     if "Contents" in page:
                         for obj in page["Contents"]:
-                            objects.append(
-                                {
-                                    "key": obj["Key"],
-                                    "size": obj["Size"],
-                                    "last_modified": obj["LastModified"],
-                                    "etag": obj["ETag"],
-                                }
-                            )
+                            objects.append(_object_info(obj))
 
             logger.info(f"Найдено {len(objects)} объектов")
             return objects
@@ -237,3 +781,49 @@ class S3Client:
         except Exception as e:
             logger.error(f"Ошибка при получении списка объектов: {e!s}")
             return []
+
+    async def iter_objects(
+        self,
+        prefix: str = "",
+        page_size: int = 1000,
+        continuation_token: str | None = None,
+    ) -> AsyncIterator[S3ObjectPage]:
+        """
+        Листинг объектов по страницам без накопления в памяти.
+
+        В отличие от list_objects ошибки S3 пробрасываются. Чтобы
+        продолжить прерванный листинг, передайте next_token последней
+        обработанной страницы как continuation_token.
+
+        Args:
+            prefix: Префикс для фильтрации объектов
+            page_size: Объектов на странице (MaxKeys, не больше 1000)
+            continuation_token: Токен, с которого продолжить листинг
+        """
+        logger.info(f"Листинг объектов с префиксом: '{prefix}'")
+
+        async with self._client_context() as client:
+            while True:
+                params: dict[str, Any] = {
+                    "Bucket": self.bucket_name,
+                    "Prefix": prefix,
+                    "MaxKeys": page_size,
+                }
+                if continuation_token is not None:
+                    params["ContinuationToken"] = continuation_token
+
+                response = await client.list_objects_v2(**params)
+                continuation_token = (
+                    response.get("NextContinuationToken")
+                    if response.get("IsTruncated")
+                    else None
+                )
+                yield S3ObjectPage(
+                    objects=[
+                        _object_info(obj)
+                        for obj in response.get("Contents", [])
+                    ],
+                    next_token=continuation_token,
+                )
+                if continuation_token is None:
+                    return
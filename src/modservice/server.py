@@ -1,29 +1,90 @@
+import argparse
 import asyncio
+import contextlib
 import logging
-from concurrent import futures
+import signal
+import socket
+from collections.abc import Callable, Coroutine
+from typing import Any
 
-import asyncpg
 import grpc
 from grpc_reflection.v1alpha import reflection
 
 from modservice.grpc import mod_pb2, mod_pb2_grpc
+from modservice.handler.get_mods_cache import GetModsResponseCache
 from modservice.handler.handler import ModHandler
+from modservice.handler.interceptors import (
+    ErrorInterceptor,
+    MetricsInterceptor,
+    SerializedResponseInterceptor,
+)
+from modservice.http_server import HttpServer
+from modservice.metrics import metrics_response
+from modservice.repository.mod_status_listener import ModStatusListener
+from modservice.repository.pool import create_pool
 from modservice.repository.repository import ModRepository
+from modservice.repository.s3_key_cache import S3KeyCache
 from modservice.s3_client import S3Client
+from modservice.service.content_dedup import ContentDeduplicator
+from modservice.service.download_link_cache import DownloadLinkCache
+from modservice.service.mod_inspector import ModInspector
+from modservice.service.orphan_gc import OrphanCollector
+from modservice.service.s3_notifications import S3NotificationIngester
 from modservice.service.s3_service import S3Service
 from modservice.service.service import ModService
+from modservice.service.upload_reconciler import UploadReconciler
 from modservice.settings import Settings
+from modservice.workers import WorkerSupervisor
 
 
-async def serve() -> None:
+def create_grpc_server(
+    handler: ModHandler, settings: Settings, reuse_port: bool = False
+) -> grpc.aio.Server:
+    """gRPC сервер с интерцепторами и опциями из Settings, без порта"""
+    options = settings.grpc_server_options()
+    if reuse_port:
+        options.append(("grpc.so_reuseport", 1))
+    # Все обработчики асинхронные: пул потоков для них не нужен
+    server = grpc.aio.server(
+        interceptors=[
+            MetricsInterceptor(),
+            ErrorInterceptor(),
+            SerializedResponseInterceptor(),
+        ],
+        options=options,
+        maximum_concurrent_rpcs=settings.grpc_maximum_concurrent_rpcs,
+    )
+    mod_pb2_grpc.add_ModServiceServicer_to_server(
+        handler, server
+    )  # type: ignore[no-untyped-call]
+
+    SERVICE_NAMES = (
+        mod_pb2.DESCRIPTOR.services_by_name["ModService"].full_name,
+        reflection.SERVICE_NAME,
+    )
+    reflection.enable_server_reflection(SERVICE_NAMES, server)
+    return server
+
+
+async def serve(worker_index: int = 0, reuse_port: bool = False) -> None:
     settings = Settings()
     settings.configure_logging()
     logger = logging.getLogger(__name__)
 
-    db_pool = await asyncpg.create_pool(
-        dsn=settings.database_url,
-        min_size=1,
-        max_size=10,
+    db_pool = await create_pool(
+        settings.database_url,
+        min_size=settings.db_pool_min_size,
+        max_size=settings.db_pool_max_size,
+        acquire_timeout=settings.db_acquire_timeout,
+        command_timeout=settings.db_command_timeout,
+        max_inactive_connection_lifetime=(
+            settings.db_max_inactive_connection_lifetime
+        ),
+        statement_cache_size=settings.db_statement_cache_size,
+        max_cached_statement_lifetime=(
+            settings.db_max_cached_statement_lifetime
+        ),
+        prepared_statements=settings.db_prepared_statements,
     )
 
     s3_client = S3Client(
@@ -32,33 +93,218 @@ async def serve() -> None:
         endpoint_url=settings.s3_api_endpoint,
         bucket_name=settings.s3_bucket_name,
         verify=settings.s3_verify,
+        max_pool_connections=settings.s3_max_pool_connections,
+        local_presign=settings.s3_local_presign,
+        multipart_part_size=settings.s3_multipart_part_size,
+        multipart_concurrency=settings.s3_multipart_concurrency,
     )
+    await s3_client.start()
 
     s3_service = S3Service(s3_client)
 
-    repo = ModRepository(db_pool)
-    service = ModService(repo, s3_service)
-    handler = ModHandler(service)
+    s3_key_cache = (
+        S3KeyCache(max_size=settings.s3_key_cache_size)
+        if settings.s3_key_cache_size > 0
+        else None
+    )
+    repo = ModRepository(db_pool, s3_key_cache)
+    download_link_cache = (
+        DownloadLinkCache(max_size=settings.download_link_cache_size)
+        if settings.download_link_cache_size > 0
+        else None
+    )
+    service = ModService(repo, s3_service, download_link_cache)
+    get_mods_cache = (
+        GetModsResponseCache(
+            lambda: service.catalogue_version,
+            max_size=settings.get_mods_cache_size,
+        )
+        if settings.get_mods_cache_size > 0
+        else None
+    )
 
-    server = grpc.aio.server(futures.ThreadPoolExecutor(max_workers=5))
-    mod_pb2_grpc.add_ModServiceServicer_to_server(
-        handler, server
-    )  # type: ignore[no-untyped-call]
+    status_listener = None
+    if (
+        s3_key_cache is not None
+        or download_link_cache is not None
+        or get_mods_cache is not None
+    ):
+        status_listener = ModStatusListener(
+            db_pool, service.invalidate_mod, service.reset_caches
+        )
+        await status_listener.start()
 
-    SERVICE_NAMES = (
-        mod_pb2.DESCRIPTOR.services_by_name["ModService"].full_name,
-        reflection.SERVICE_NAME,
-    )
-    reflection.enable_server_reflection(SERVICE_NAMES, server)
+    upload_reconciler = None
+    # В pre-fork режиме реконсилер один на все процессы: в воркере 0
+    if settings.upload_reconciler_interval > 0 and worker_index == 0:
+        upload_reconciler = UploadReconciler(
+            service,
+            s3_service,
+            interval=settings.upload_reconciler_interval,
+            batch_size=settings.upload_reconciler_batch_size,
+            concurrency=settings.upload_reconciler_concurrency,
+            max_age=settings.upload_reconciler_max_age,
+        )
+        upload_reconciler.start()
+
+    content_deduplicator = None
+    if settings.content_dedup_interval > 0 and worker_index == 0:
+        content_deduplicator = ContentDeduplicator(
+            service,
+            s3_service,
+            interval=settings.content_dedup_interval,
+            batch_size=settings.content_dedup_batch_size,
+            workers=settings.content_dedup_workers,
+            min_age=settings.content_dedup_min_age,
+            max_archives=settings.content_dedup_max_archives,
+            delete_delay=settings.content_dedup_delete_delay,
+        )
+        content_deduplicator.start()
+
+    mod_inspector = None
+    if settings.mod_inspector_interval > 0 and worker_index == 0:
+        mod_inspector = ModInspector(
+            service,
+            s3_service,
+            interval=settings.mod_inspector_interval,
+            batch_size=settings.mod_inspector_batch_size,
+            concurrency=settings.mod_inspector_concurrency,
+        )
+        mod_inspector.start()
 
+    orphan_collector = None
+    if settings.s3_gc_interval > 0 and worker_index == 0:
+        orphan_collector = OrphanCollector(
+            service,
+            s3_service,
+            interval=settings.s3_gc_interval,
+            dry_run=settings.s3_gc_dry_run,
+            rate_limit=settings.s3_gc_rate_limit,
+            min_age=settings.s3_gc_min_age,
+            checkpoint_path=settings.s3_gc_checkpoint_path,
+        )
+        orphan_collector.start()
+
+    server = create_grpc_server(
+        ModHandler(service, get_mods_cache), settings, reuse_port
+    )
     server.add_insecure_port(f"{settings.host}:{settings.port}")
     await server.start()
     logger.info(f"gRPC server listening on {settings.host}:{settings.port}")
-    await server.wait_for_termination()
+
+    http_server = None
+    if settings.metrics_port > 0:
+        # У каждого воркера свой порт: METRICS_PORT + номер воркера
+        http_server = HttpServer(
+            settings.metrics_host, settings.metrics_port + worker_index
+        )
+        http_server.add_route("GET", "/metrics", metrics_response)
+        await http_server.start()
+
+    notification_server = None
+    notification_ingester = None
+    if settings.s3_notify_enabled:
+        notification_ingester = S3NotificationIngester(
+            service,
+            bucket_name=settings.s3_bucket_name,
+            window=settings.s3_notify_window,
+            max_batch=settings.s3_notify_max_batch,
+        )
+        notification_server = HttpServer(
+            settings.s3_notify_host, settings.s3_notify_port, reuse_port
+        )
+        notification_server.add_route(
+            "POST",
+            "/s3/events",
+            notification_ingester.handle,
+            settings.s3_notify_token,
+        )
+        await notification_server.start()
+
+    stop_requested = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        # На Windows сигналы через цикл событий не поддерживаются
+        with contextlib.suppress(NotImplementedError):
+            loop.add_signal_handler(sig, stop_requested.set)
+
+    try:
+        await stop_requested.wait()
+        logger.info("Останавливаем gRPC сервер")
+        await server.stop(settings.shutdown_grace)
+    finally:
+        if upload_reconciler is not None:
+            await upload_reconciler.close()
+        if orphan_collector is not None:
+            await orphan_collector.close()
+        if content_deduplicator is not None:
+            await content_deduplicator.close()
+        if mod_inspector is not None:
+            await mod_inspector.close()
+        if http_server is not None:
+            await http_server.close()
+        if notification_server is not None:
+            await notification_server.close()
+        if notification_ingester is not None:
+            await notification_ingester.close()
+        if status_listener is not None:
+            await status_listener.close()
+        await s3_client.close()
+        await db_pool.close()
+
+
+def loop_factory(
+    use_uvloop: bool,
+) -> Callable[[], asyncio.AbstractEventLoop] | None:
+    if not use_uvloop:
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        logging.getLogger(__name__).warning(
+            "USE_UVLOOP включён, но uvloop не установлен "
+            "(extra modservice[uvloop]): используется стандартный цикл asyncio"
+        )
+        return None
+    return uvloop.new_event_loop
 
 
-def main() -> None:
-    asyncio.run(serve())
+def run(coro: Coroutine[Any, Any, None], use_uvloop: bool = False) -> None:
+    with asyncio.Runner(loop_factory=loop_factory(use_uvloop)) as runner:
+        runner.run(coro)
+
+
+def run_worker(worker_index: int) -> None:
+    run(serve(worker_index, reuse_port=True), Settings().use_uvloop)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="run-server")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="число процессов сервера (по умолчанию WORKERS или 1)",
+    )
+    args = parser.parse_args(argv)
+
+    settings = Settings()
+    workers = args.workers if args.workers is not None else settings.workers
+    if workers <= 1:
+        run(serve(), settings.use_uvloop)
+        return
+
+    if not hasattr(socket, "SO_REUSEPORT"):
+        parser.error("--workers > 1 requires SO_REUSEPORT support")
+
+    settings.configure_logging()
+    supervisor = WorkerSupervisor(
+        run_worker,
+        workers,
+        # Воркеру даётся grace на RPC и ещё время на закрытие пулов
+        shutdown_timeout=settings.shutdown_grace + 5.0,
+    )
+    supervisor.run()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,198 @@
+import asyncio
+import contextlib
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from modservice.metrics import Counter, Histogram
+from modservice.repository.model import ReplacedObject, UnhashedMod
+from modservice.service.s3_service import S3Service
+from modservice.service.service import ModService
+
+logger = logging.getLogger(__name__)
+
+DEDUP_RUNS = Counter(
+    "content_dedup_runs_total",
+    "Content deduplication passes, by result",
+    ("result",),
+)
+DEDUP_RUN_SECONDS = Histogram(
+    "content_dedup_run_seconds",
+    "Duration of one content deduplication pass",
+    buckets=(0.1, 1.0, 5.0, 30.0, 60.0, 300.0, 900.0),
+)
+DEDUP_ARCHIVES = Counter(
+    "content_dedup_archives_total",
+    "Hashed mod archives, by outcome",
+    ("result",),
+)
+DEDUP_DELETES = Counter(
+    "content_dedup_deletes_total",
+    "Deletes of duplicate mod archive copies, by result",
+    ("result",),
+)
+
+
+class ContentDeduplicator:
+    """
+    Фоновая задача: считает SHA-256 mod.zip загруженных модов и
+    склеивает побайтно одинаковые архивы.
+
+    Раз в interval секунд обходит UPLOADED моды без content_sha256
+    пачками по batch_size, не больше max_archives за проход (0 — без
+    ограничения): следующий проход продолжает с того же места. Моды
+    моложе min_age секунд не трогаются, пока ссылка на загрузку жива и
+    mod.zip ещё можно перезаписать. Архив читается из S3 потоком, хеш
+    считается в собственном пуле из workers потоков, одновременно
+    хешируется не больше workers архивов.
+
+    Если такой хеш уже есть у другого мода, s3_key мода переводится на
+    его объект, а прежний запоминается в replaced_s3_key. Копия под
+    replaced_s3_key удаляется в конце прохода, когда с перевода прошло
+    больше delete_delay секунд и выданные на неё ссылки на скачивание
+    истекли; неудавшиеся удаления повторяются в следующем.
+    """
+
+    def __init__(
+        self,
+        service: ModService,
+        s3_service: S3Service,
+        interval: float = 30.0,
+        batch_size: int = 100,
+        workers: int = 4,
+        min_age: float = 7200.0,
+        max_archives: int = 1000,
+        delete_delay: float = 7200.0,
+    ) -> None:
+        self._service = service
+        self._s3_service = s3_service
+        self._interval = interval
+        self._batch_size = batch_size
+        self._min_age = min_age
+        self._max_archives = max_archives
+        self._delete_delay = delete_delay
+        self._after_id = 0
+        self._slots = asyncio.Semaphore(workers)
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="mod-sha256"
+        )
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info(
+                f"Дедупликация архивов запущена, период {self._interval}s"
+            )
+
+    async def close(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def run_once(self) -> int:
+        """
+        Один проход по модам без хеша и неудалённым копиям. Возвращает
+        число модов, переведённых на уже существующий объект.
+        """
+        started = time.perf_counter()
+        merged = 0
+        hashed = 0
+        try:
+            while not self._max_archives or hashed < self._max_archives:
+                limit = self._batch_size
+                if self._max_archives:
+                    limit = min(limit, self._max_archives - hashed)
+                batch = await self._service.get_unhashed_mods(
+                    limit, self._after_id, self._min_age
+                )
+                if not batch:
+                    self._after_id = 0
+                    break
+                self._after_id = batch[-1].id
+
+                results = await asyncio.gather(
+                    *(self._deduplicate(mod) for mod in batch)
+                )
+                merged += sum(results)
+                hashed += len(batch)
+
+                if len(batch) < limit:
+                    self._after_id = 0
+                    break
+
+            await self._delete_replaced()
+        except Exception:
+            DEDUP_RUNS.inc(labels=("error",))
+            raise
+        finally:
+            DEDUP_RUN_SECONDS.observe(time.perf_counter() - started)
+
+        DEDUP_RUNS.inc(labels=("ok",))
+        return merged
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"Ошибка прохода дедупликации архивов: {e!s}")
+            await asyncio.sleep(self._interval)
+
+    async def _deduplicate(self, mod: UnhashedMod) -> bool:
+        async with self._slots:
+            try:
+                sha256 = await self._s3_service.hash_mod_object(
+                    mod.s3_key, self._executor
+                )
+            except Exception as e:
+                # Мод останется без хеша и попадёт в следующий проход
+                logger.warning(f"SHA-256 {mod.s3_key}/mod.zip: {e!s}")
+                DEDUP_ARCHIVES.inc(labels=("error",))
+                return False
+
+        s3_key = await self._service.record_content_hash(
+            mod.id, mod.s3_key, sha256
+        )
+        if s3_key is None or s3_key == mod.s3_key:
+            DEDUP_ARCHIVES.inc(labels=("unique",))
+            return False
+
+        logger.info(f"Мод {mod.id} — дубликат {s3_key}")
+        DEDUP_ARCHIVES.inc(labels=("duplicate",))
+        return True
+
+    async def _delete_replaced(self) -> None:
+        after_id = 0
+        while True:
+            objects = await self._service.get_replaced_objects(
+                self._batch_size, after_id, self._delete_delay
+            )
+            if not objects:
+                return
+            after_id = objects[-1].id
+
+            results = await asyncio.gather(
+                *(self._delete(obj) for obj in objects)
+            )
+            deleted = [
+                obj for obj, ok in zip(objects, results, strict=True) if ok
+            ]
+            if deleted:
+                await self._service.clear_replaced_objects(deleted)
+
+            if len(objects) < self._batch_size:
+                return
+
+    async def _delete(self, obj: ReplacedObject) -> bool:
+        async with self._slots:
+            try:
+                deleted = await self._s3_service.delete_mod_object(obj.s3_key)
+            except Exception as e:
+                logger.warning(f"Удаление {obj.s3_key}/mod.zip: {e!s}")
+                deleted = False
+        DEDUP_DELETES.inc(labels=("ok" if deleted else "failed",))
+        return deleted
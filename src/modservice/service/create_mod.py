@@ -9,9 +9,7 @@ async def create_mod(
     author_id: int,
     description: str,
 ) -> tuple[int, str, str]:
-    mod_id = await repo.create_mod(title, author_id, description)
-
-    s3_key = await repo.insert_s3_key(mod_id, author_id)
+    mod_id, s3_key = await repo.create_mod(title, author_id, description)
 
     upload_url = await s3_service.generate_mod_upload_url(s3_key_prefix=s3_key)
 
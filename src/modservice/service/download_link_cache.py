@@ -0,0 +1,90 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+
+class DownloadLinkCache:
+    """
+    LRU-кеш presigned ссылок на скачивание по ключу (mod_id, expiration).
+
+    Ссылка переиспользуется, пока у неё осталось больше чем
+    min_remaining_ratio от полного времени жизни. Запись, подготовленная
+    до invalidate(), отбрасывается: put() принимает version, снятую до
+    похода в БД, и игнорирует её, если с тех пор была инвалидация.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10_000,
+        min_remaining_ratio: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_size = max_size
+        self._min_remaining_ratio = min_remaining_ratio
+        self._clock = clock
+        self._entries: OrderedDict[tuple[int, int], tuple[str, float]] = (
+            OrderedDict()
+        )
+        self._expirations_by_mod: dict[int, set[int]] = {}
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, mod_id: int, expiration: int) -> str | None:
+        key = (mod_id, expiration)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        url, signed_at = entry
+        reusable_for = expiration * (1 - self._min_remaining_ratio)
+        if self._clock() - signed_at >= reusable_for:
+            self._remove(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return url
+
+    def put(
+        self,
+        mod_id: int,
+        expiration: int,
+        url: str,
+        version: int | None = None,
+    ) -> None:
+        if version is not None and version != self.version:
+            return
+
+        key = (mod_id, expiration)
+        self._entries[key] = (url, self._clock())
+        self._entries.move_to_end(key)
+        self._expirations_by_mod.setdefault(mod_id, set()).add(expiration)
+
+        while len(self._entries) > self._max_size:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+
+    def invalidate(self, mod_id: int) -> None:
+        self.version += 1
+        for expiration in self._expirations_by_mod.pop(mod_id, set()):
+            self._entries.pop((mod_id, expiration), None)
+
+    def clear(self) -> None:
+        self.version += 1
+        self._entries.clear()
+        self._expirations_by_mod.clear()
+
+    def _remove(self, key: tuple[int, int]) -> None:
+        del self._entries[key]
+        mod_id, expiration = key
+        expirations = self._expirations_by_mod.get(mod_id)
+        if expirations is not None:
+            expirations.discard(expiration)
+            if not expirations:
+                del self._expirations_by_mod[mod_id]
@@ -0,0 +1,72 @@
+import logging
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from modservice.metrics import Counter, Histogram
+from modservice.repository.repository import ModRepository
+
+logger = logging.getLogger(__name__)
+
+UPLOADS_FINALIZED = Counter(
+    "uploads_finalized_total",
+    "Mods moved from UPLOADING to UPLOADED",
+    ("source",),
+)
+UPLOAD_FINALIZE_LAG = Histogram(
+    "upload_finalize_lag_seconds",
+    "Time from mod.zip landing in S3 to the mod becoming UPLOADED",
+    ("source",),
+    buckets=(1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0, 3600.0),
+)
+
+
+@dataclass(frozen=True)
+class UploadedObject:
+    """
+    mod.zip мода, найденный в S3 под <s3_key>/mod.zip; uploaded_at —
+    LastModified объекта. size None — источник размер не сообщил, в БД
+    он не меняется.
+    """
+
+    mod_id: int
+    s3_key: str
+    size: int | None
+    uploaded_at: datetime
+
+
+async def finalize_uploads(
+    repo: ModRepository, uploads: list[UploadedObject], source: str
+) -> list[int]:
+    """
+    Переводит моды из UPLOADING в UPLOADED одним UPDATE и записывает
+    размер. Загрузка, чей s3_key не совпадает с s3_key мода, не
+    применяется. Возвращает id модов, статус которых действительно
+    сменился.
+    """
+    if not uploads:
+        return []
+
+    # При повторах (несколько уведомлений на объект) побеждает последнее
+    by_object = {(upload.mod_id, upload.s3_key): upload for upload in uploads}
+    updated = await repo.mark_uploaded(
+        [upload.mod_id for upload in by_object.values()],
+        [upload.s3_key for upload in by_object.values()],
+        [upload.size for upload in by_object.values()],
+    )
+
+    # Обновиться может только запись с настоящим s3_key мода; если у
+    # мода их несколько, задержка считается по последней
+    uploaded_at = {
+        upload.mod_id: upload.uploaded_at for upload in by_object.values()
+    }
+    now = datetime.now(UTC)
+    for mod_id in updated:
+        lag = (now - uploaded_at[mod_id]).total_seconds()
+        UPLOAD_FINALIZE_LAG.observe(max(lag, 0.0), (source,))
+    UPLOADS_FINALIZED.inc(len(updated), (source,))
+
+    if updated:
+        logger.info(
+            f"Загрузка подтверждена для {len(updated)} модов ({source})"
+        )
+    return updated
@@ -1,4 +1,6 @@
+from modservice.constants import S3_KEY_NOT_FOUND
 from modservice.repository.repository import ModRepository
+from modservice.service.download_link_cache import DownloadLinkCache
 from modservice.service.s3_service import S3Service
 
 
@@ -7,11 +9,21 @@ async def get_mod_download_link(
     s3_service: S3Service,
     mod_id: int,
     expiration: int = 3600,
+    cache: DownloadLinkCache | None = None,
 ) -> str:
+    if cache is not None:
+        cached_url = cache.get(mod_id, expiration)
+        if cached_url is not None:
+            return cached_url
+        version = cache.version
+
     s3_key = await repo.get_mod_s3_key(mod_id)
 
     download_url = await s3_service.generate_mod_download_url(
-        s3_key_prefix=s3_key, expiration=expiration
+        s3_key, expiration
     )
 
+    if cache is not None and s3_key != S3_KEY_NOT_FOUND:
+        cache.put(mod_id, expiration, download_url, version)
+
     return download_url
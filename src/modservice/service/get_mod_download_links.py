@@ -0,0 +1,50 @@
+from modservice.constants import MAX_DOWNLOAD_LINKS_BATCH
+from modservice.repository.repository import ModRepository
+from modservice.service.download_link_cache import DownloadLinkCache
+from modservice.service.s3_service import S3Service
+
+
+async def get_mod_download_links(
+    repo: ModRepository,
+    s3_service: S3Service,
+    mod_ids: list[int],
+    expiration: int = 3600,
+    cache: DownloadLinkCache | None = None,
+) -> dict[int, str]:
+    unique_ids = list(dict.fromkeys(mod_ids))
+    if len(unique_ids) > MAX_DOWNLOAD_LINKS_BATCH:
+        raise ValueError(
+            f"mod_ids must contain at most {MAX_DOWNLOAD_LINKS_BATCH} ids"
+        )
+
+    links: dict[int, str] = {}
+    missing_ids = unique_ids
+    if cache is not None:
+        missing_ids = []
+        for mod_id in unique_ids:
+            cached_url = cache.get(mod_id, expiration)
+            if cached_url is None:
+                missing_ids.append(mod_id)
+            else:
+                links[mod_id] = cached_url
+        version = cache.version
+
+    if not missing_ids:
+        return links
+
+    # Не найденные и не UPLOADED моды в ответ БД не попадают
+    s3_keys = await repo.get_mod_s3_keys(missing_ids)
+    if not s3_keys:
+        return links
+
+    found_ids = list(s3_keys)
+    download_urls = await s3_service.generate_mod_download_urls(
+        [s3_keys[mod_id] for mod_id in found_ids], expiration
+    )
+
+    for mod_id, download_url in zip(found_ids, download_urls, strict=True):
+        links[mod_id] = download_url
+        if cache is not None:
+            cache.put(mod_id, expiration, download_url, version)
+
+    return links
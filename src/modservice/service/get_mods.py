@@ -1,9 +1,33 @@
-from typing import Any
-
+from modservice.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from modservice.repository.model import ModFilter, ModRow
 from modservice.repository.repository import ModRepository
+from modservice.service.page_token import decode_page_token, encode_page_token
 
 
 async def get_mods(
     repo: ModRepository,
-) -> list[dict[str, Any]]:
-    return await repo.get_mods()
+    page_size: int = 0,
+    page_token: str = "",
+    mod_filter: ModFilter | None = None,
+) -> tuple[list[ModRow], str]:
+    if page_size < 0:
+        raise ValueError("page_size must not be negative")
+    if (
+        mod_filter is not None
+        and mod_filter.created_after is not None
+        and mod_filter.created_before is not None
+        and mod_filter.created_after >= mod_filter.created_before
+    ):
+        raise ValueError("created_after must be earlier than created_before")
+    page_size = min(page_size or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE)
+
+    after = decode_page_token(page_token) if page_token else None
+
+    # Лишняя строка показывает, есть ли следующая страница
+    mods = await repo.get_mods(page_size + 1, after, mod_filter)
+    if len(mods) <= page_size:
+        return mods, ""
+
+    mods = mods[:page_size]
+    last = mods[-1]
+    return mods, encode_page_token(last.created_at, last.id)
@@ -0,0 +1,179 @@
+import asyncio
+import contextlib
+import logging
+import time
+
+from modservice.metrics import Counter, Histogram
+from modservice.repository.model import ModManifest, UninspectedMod
+from modservice.service.s3_service import S3Service
+from modservice.service.service import ModService
+from modservice.zip_manifest import ZipFormatError
+
+logger = logging.getLogger(__name__)
+
+INSPECTOR_RUNS = Counter(
+    "mod_inspector_runs_total",
+    "Mod archive inspection passes, by result",
+    ("result",),
+)
+INSPECTOR_RUN_SECONDS = Histogram(
+    "mod_inspector_run_seconds",
+    "Duration of one mod archive inspection pass",
+    buckets=(0.1, 0.5, 1.0, 5.0, 15.0, 60.0, 300.0),
+)
+INSPECTIONS = Counter(
+    "mod_inspections_total",
+    "Inspected mod archives, by outcome",
+    ("result",),
+)
+ARCHIVE_COMPRESSION_RATIO = Histogram(
+    "mod_archive_compression_ratio",
+    "Uncompressed to compressed size of inspected mod archives",
+    buckets=(1.0, 2.0, 5.0, 10.0, 20.0, 50.0, 100.0, 1000.0),
+)
+
+
+class ModInspector:
+    """
+    Фоновая задача: читает оглавление mod.zip загруженных модов и
+    сохраняет его в mod_manifests.
+
+    Раз в interval секунд обходит UPLOADED моды без оглавления пачками
+    по batch_size. Из S3 читается только хвост архива с central
+    directory (S3Service.read_mod_manifest), не больше concurrency
+    архивов одновременно; оглавления пачки пишутся одним INSERT.
+    Повреждённый архив сохраняется с error и больше не читается,
+    ошибка S3 — повторяется в следующем проходе. Если INSERT пачки не
+    прошёл, оглавления пишутся по одному, а мод, чьё оглавление БД не
+    принимает, получает строку с error: один архив не останавливает
+    инспекцию остальных.
+    """
+
+    def __init__(
+        self,
+        service: ModService,
+        s3_service: S3Service,
+        interval: float = 30.0,
+        batch_size: int = 100,
+        concurrency: int = 16,
+    ) -> None:
+        self._service = service
+        self._s3_service = s3_service
+        self._interval = interval
+        self._batch_size = batch_size
+        self._slots = asyncio.Semaphore(concurrency)
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info(
+                f"Инспекция архивов модов запущена, период {self._interval}s"
+            )
+
+    async def close(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    async def run_once(self) -> int:
+        """
+        Один проход по модам без оглавления. Возвращает число
+        сохранённых оглавлений.
+        """
+        started = time.perf_counter()
+        saved = 0
+        after_id = 0
+        try:
+            while True:
+                batch = await self._service.get_uninspected_mods(
+                    self._batch_size, after_id
+                )
+                if not batch:
+                    break
+                after_id = batch[-1].id
+
+                results = await asyncio.gather(
+                    *(self._inspect(mod) for mod in batch)
+                )
+                manifests = [m for m in results if m is not None]
+                if manifests:
+                    await self._save(manifests)
+                saved += len(manifests)
+
+                if len(batch) < self._batch_size:
+                    break
+        except Exception:
+            INSPECTOR_RUNS.inc(labels=("error",))
+            raise
+        finally:
+            INSPECTOR_RUN_SECONDS.observe(time.perf_counter() - started)
+
+        INSPECTOR_RUNS.inc(labels=("ok",))
+        return saved
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"Ошибка прохода инспекции архивов: {e!s}")
+            await asyncio.sleep(self._interval)
+
+    async def _save(self, manifests: list[ModManifest]) -> None:
+        try:
+            await self._service.save_mod_manifests(manifests)
+            return
+        except Exception as e:
+            logger.warning(
+                f"Пачка оглавлений не сохранена, пишем по одному: {e!s}"
+            )
+
+        for manifest in manifests:
+            try:
+                await self._service.save_mod_manifests([manifest])
+            except Exception as e:
+                logger.warning(
+                    f"Оглавление мода {manifest.mod_id} не сохранено: {e!s}"
+                )
+                INSPECTIONS.inc(labels=("save_failed",))
+                # Если БД недоступна, упадёт и эта запись: проход
+                # завершится ошибкой и повторится
+                await self._service.save_mod_manifests(
+                    [
+                        ModManifest(
+                            manifest.mod_id,
+                            0,
+                            0,
+                            0,
+                            [],
+                            f"Оглавление не сохранено: {e!s}",
+                        )
+                    ]
+                )
+
+    async def _inspect(self, mod: UninspectedMod) -> ModManifest | None:
+        async with self._slots:
+            try:
+                manifest = await self._s3_service.read_mod_manifest(mod.s3_key)
+            except ZipFormatError as e:
+                logger.warning(f"mod.zip мода {mod.id} не разобран: {e!s}")
+                INSPECTIONS.inc(labels=("invalid",))
+                return ModManifest(mod.id, 0, 0, 0, [], str(e))
+            except Exception as e:
+                logger.warning(f"Оглавление {mod.s3_key}/mod.zip: {e!s}")
+                INSPECTIONS.inc(labels=("error",))
+                return None
+
+        INSPECTIONS.inc(labels=("ok",))
+        ARCHIVE_COMPRESSION_RATIO.observe(manifest.compression_ratio)
+        return ModManifest(
+            mod.id,
+            manifest.file_count,
+            manifest.compressed_size,
+            manifest.uncompressed_size,
+            manifest.entries,
+        )
@@ -0,0 +1,245 @@
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+from modservice.metrics import Counter, Gauge, Histogram
+from modservice.s3_client import S3ObjectPage
+from modservice.service.s3_service import S3Service
+from modservice.service.service import ModService
+
+logger = logging.getLogger(__name__)
+
+GC_RUNS = Counter(
+    "s3_gc_runs_total",
+    "Orphaned object GC passes, by result",
+    ("result",),
+)
+GC_RUN_SECONDS = Histogram(
+    "s3_gc_run_seconds",
+    "Duration of one orphaned object GC pass",
+    buckets=(1.0, 10.0, 60.0, 300.0, 900.0, 3600.0, 14400.0),
+)
+GC_OBJECTS = Counter(
+    "s3_gc_objects_total",
+    "Objects seen by the orphaned object GC, by outcome",
+    ("result",),
+)
+GC_LAST_SUCCESS = Gauge(
+    "s3_gc_last_success_timestamp_seconds",
+    "Unix time of the last completed orphaned object GC pass",
+)
+
+
+def _s3_key_prefix(key: str) -> str:
+    """author_id/mod_id/<файл> -> author_id/mod_id, как в mods.s3_key"""
+    return "/".join(key.split("/", 2)[:2])
+
+
+@dataclass
+class GcStats:
+    scanned: int = 0
+    skipped: int = 0
+    orphaned: int = 0
+    deleted: int = 0
+    failed: int = 0
+
+
+class OrphanCollector:
+    """
+    Сборщик мусора бакета: удаляет объекты <author_id>/<mod_id>/...,
+    для которых в mods нет строки (брошенные загрузки, недосозданные и
+    удалённые моды).
+
+    Бакет обходится страницами list_objects_v2, ключи каждой страницы
+    сверяются с mods одним запросом id = ANY($1), сироты удаляются
+    одним DeleteObjects на страницу. Объект без строки мода, на который
+    ссылается s3_key дубликата, сиротой не считается. Не трогает ключи
+    без mod_id и объекты моложе min_age: их строка может быть ещё не
+    видна.
+
+    dry_run только пишет сирот в лог. rate_limit ограничивает удаления
+    в секунду (0 — без ограничения). После каждой страницы токен
+    продолжения сохраняется в checkpoint_path, и прерванный проход
+    продолжается с него, а не с начала бакета.
+    """
+
+    def __init__(
+        self,
+        service: ModService,
+        s3_service: S3Service,
+        interval: float = 86400.0,
+        dry_run: bool = True,
+        rate_limit: float = 500.0,
+        min_age: float = 86400.0,
+        checkpoint_path: str | None = None,
+        page_size: int = 1000,
+    ) -> None:
+        self._service = service
+        self._s3_service = s3_service
+        self._interval = interval
+        self._dry_run = dry_run
+        self._rate_limit = rate_limit
+        self._min_age = timedelta(seconds=min_age)
+        self._checkpoint_path = checkpoint_path
+        self._page_size = page_size
+        self._next_delete_at = 0.0
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            mode = "dry-run" if self._dry_run else "удаление"
+            logger.info(
+                f"Сборщик осиротевших объектов запущен ({mode}), "
+                f"период {self._interval}s"
+            )
+
+    async def close(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    async def run_once(self) -> GcStats:
+        """Один проход по бакету, с чекпоинта, если он есть"""
+        started = time.perf_counter()
+        stats = GcStats()
+        token = await asyncio.to_thread(self._load_checkpoint)
+        if token is not None:
+            logger.info("Продолжаем сборку мусора с чекпоинта")
+        try:
+            async for page in self._s3_service.iter_file_pages(
+                page_size=self._page_size, continuation_token=token
+            ):
+                await self._collect_page(page, stats)
+                if page.next_token is not None:
+                    await asyncio.to_thread(
+                        self._save_checkpoint, page.next_token
+                    )
+            await asyncio.to_thread(self._clear_checkpoint)
+        except Exception:
+            GC_RUNS.inc(labels=("error",))
+            raise
+        finally:
+            GC_RUN_SECONDS.observe(time.perf_counter() - started)
+
+        GC_RUNS.inc(labels=("ok",))
+        GC_LAST_SUCCESS.set(time.time())
+        logger.info(
+            f"Сборка мусора завершена: просмотрено {stats.scanned}, "
+            f"сирот {stats.orphaned}, удалено {stats.deleted}, "
+            f"ошибок {stats.failed}"
+        )
+        return stats
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"Ошибка прохода сборщика мусора: {e!s}")
+            await asyncio.sleep(self._interval)
+
+    async def _collect_page(self, page: S3ObjectPage, stats: GcStats) -> None:
+        cutoff = datetime.now(UTC) - self._min_age
+        candidates: dict[str, int] = {}
+        for obj in page.objects:
+            info = self._s3_service.get_file_info_from_s3_key(obj["key"])
+            mod_id = info.get("mod_id")
+            if mod_id is None or obj["last_modified"] > cutoff:
+                stats.skipped += 1
+                continue
+            candidates[obj["key"]] = mod_id
+        stats.scanned += len(page.objects)
+        GC_OBJECTS.inc(
+            len(page.objects) - len(candidates), labels=("skipped",)
+        )
+        if not candidates:
+            return
+
+        existing = await self._service.get_existing_mod_ids(
+            sorted(set(candidates.values()))
+        )
+        orphans = [
+            key for key, mod_id in candidates.items() if mod_id not in existing
+        ]
+        if orphans:
+            # Дубликаты после дедупликации ссылаются на объект
+            # первого мода: он живёт, пока на него есть s3_key
+            referenced = await self._service.get_referenced_s3_keys(
+                sorted({_s3_key_prefix(key) for key in orphans})
+            )
+            orphans = [
+                key for key in orphans if _s3_key_prefix(key) not in referenced
+            ]
+        stats.orphaned += len(orphans)
+        GC_OBJECTS.inc(len(candidates) - len(orphans), labels=("kept",))
+        if not orphans:
+            return
+
+        if self._dry_run:
+            for key in orphans:
+                logger.info(f"[dry-run] Осиротевший объект: {key}")
+            GC_OBJECTS.inc(len(orphans), labels=("dry_run",))
+            return
+
+        await self._throttle(len(orphans))
+        failed = await self._s3_service.delete_files(orphans)
+        stats.deleted += len(orphans) - len(failed)
+        stats.failed += len(failed)
+        GC_OBJECTS.inc(len(orphans) - len(failed), labels=("deleted",))
+        GC_OBJECTS.inc(len(failed), labels=("failed",))
+
+    async def _throttle(self, count: int) -> None:
+        # Пачка из count удалений «занимает» count / rate_limit секунд:
+        # следующая ждёт, пока это время не пройдёт
+        if self._rate_limit <= 0:
+            return
+        now = time.monotonic()
+        if self._next_delete_at > now:
+            await asyncio.sleep(self._next_delete_at - now)
+            now = self._next_delete_at
+        self._next_delete_at = now + count / self._rate_limit
+
+    def _load_checkpoint(self) -> str | None:
+        if self._checkpoint_path is None:
+            return None
+        try:
+            with open(self._checkpoint_path) as file:
+                checkpoint = json.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Чекпоинт сборщика мусора не прочитан: {e!s}")
+            return None
+
+        # Чекпоинт dry-run прохода не должен пропускать страницы
+        # настоящего удаления, и наоборот
+        if (
+            not isinstance(checkpoint, dict)
+            or checkpoint.get("dry_run") != self._dry_run
+        ):
+            return None
+        token = checkpoint.get("next_token")
+        return token if isinstance(token, str) else None
+
+    def _save_checkpoint(self, token: str) -> None:
+        if self._checkpoint_path is None:
+            return
+        tmp_path = f"{self._checkpoint_path}.tmp"
+        with open(tmp_path, "w") as file:
+            json.dump({"next_token": token, "dry_run": self._dry_run}, file)
+        os.replace(tmp_path, self._checkpoint_path)
+
+    def _clear_checkpoint(self) -> None:
+        if self._checkpoint_path is None:
+            return
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self._checkpoint_path)
@@ -0,0 +1,18 @@
+import base64
+import binascii
+from datetime import datetime
+
+
+def encode_page_token(created_at: datetime, mod_id: int) -> str:
+    raw = f"{created_at.isoformat()}|{mod_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_page_token(token: str) -> tuple[datetime, int]:
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        raw = base64.urlsafe_b64decode(padded).decode()
+        created_at, mod_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(mod_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError("Invalid page_token") from e
@@ -0,0 +1,242 @@
+import asyncio
+import json
+import logging
+import re
+from datetime import UTC, datetime
+from typing import Any, NamedTuple
+from urllib.parse import unquote_plus
+
+from modservice.constants import MAX_DB_ID
+from modservice.http_server import HttpResponse
+from modservice.metrics import Counter, Histogram
+from modservice.service.finalize_uploads import UploadedObject
+from modservice.service.service import ModService
+
+logger = logging.getLogger(__name__)
+
+NOTIFICATIONS_RECEIVED = Counter(
+    "s3_notifications_received_total",
+    "S3 notification records, by outcome",
+    ("result",),
+)
+NOTIFICATION_BATCH_SIZE = Histogram(
+    "s3_notification_batch_size",
+    "Uploads finalized by one notification batch",
+    buckets=(1.0, 5.0, 10.0, 50.0, 100.0, 500.0, 1000.0),
+)
+
+SOURCE = "notification"
+
+# Ключ mod.zip: <s3_key мода>/mod.zip, s3_key = <author_id>/<mod_id>
+MOD_ARCHIVE_SUFFIX = "/mod.zip"
+MOD_ARCHIVE_KEY = re.compile(r"^(\d+)/(\d+)/mod\.zip$")
+
+_YANDEX_OBJECT_CREATE = "yandex.cloud.events.storage.ObjectCreate"
+
+
+_MAX_BIGINT = 2**63 - 1
+
+
+class ParsedNotification(NamedTuple):
+    """
+    Загрузки mod.zip из уведомления; ignored — чужие события, бакеты и
+    ключи, invalid — повреждённые записи
+    """
+
+    uploads: list[UploadedObject]
+    ignored: int
+    invalid: int
+
+
+def _parse_time(value: str | None) -> datetime:
+    if not value:
+        return datetime.now(UTC)
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=UTC)
+
+
+def _upload(
+    key: str, size: object, event_time: str | None
+) -> UploadedObject | None:
+    match = MOD_ARCHIVE_KEY.match(key)
+    if match is None:
+        return None
+    if any(int(group) > MAX_DB_ID for group in match.groups()):
+        raise ValueError(f"Id out of range in key: {key!r}")
+    if size is not None and (
+        not isinstance(size, int)
+        or isinstance(size, bool)
+        or not 0 <= size <= _MAX_BIGINT
+    ):
+        raise ValueError(f"Invalid object size: {size!r}")
+    return UploadedObject(
+        mod_id=int(match.group(2)),
+        s3_key=key.removesuffix(MOD_ARCHIVE_SUFFIX),
+        size=size,
+        uploaded_at=_parse_time(event_time),
+    )
+
+
+def _parse_aws_record(
+    record: Any, bucket_name: str | None
+) -> UploadedObject | None:
+    s3 = record["s3"]
+    # AWS пишет ObjectCreated:Put, MinIO — s3:ObjectCreated:Put
+    event = record["eventName"].removeprefix("s3:")
+    created = event.startswith("ObjectCreated:")
+    if not created or bucket_name not in (None, s3["bucket"]["name"]):
+        return None
+    return _upload(
+        unquote_plus(s3["object"]["key"]),
+        s3["object"].get("size"),
+        record.get("eventTime"),
+    )
+
+
+def _parse_yandex_message(
+    message: Any, bucket_name: str | None
+) -> UploadedObject | None:
+    metadata = message["event_metadata"]
+    details = message["details"]
+    created = metadata["event_type"] == _YANDEX_OBJECT_CREATE
+    if not created or bucket_name not in (None, details["bucket_id"]):
+        return None
+    # Yandex Cloud не передаёт размер объекта
+    return _upload(details["object_id"], None, metadata.get("created_at"))
+
+
+def parse_notification(
+    body: bytes, bucket_name: str | None = None
+) -> ParsedNotification:
+    """
+    Разбирает уведомление S3 в формате AWS/MinIO (Records) или Yandex
+    Cloud (messages). Каждая запись разбирается отдельно: повреждённая
+    попадает в invalid и не мешает остальным.
+
+    Raises:
+        ValueError: тело не JSON или не уведомление S3
+    """
+    try:
+        payload = json.loads(body)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON: {e!s}") from e
+    if not isinstance(payload, dict):
+        raise ValueError("Notification must be a JSON object")
+
+    records = payload.get("Records", [])
+    messages = payload.get("messages", [])
+    if not isinstance(records, list) or not isinstance(messages, list):
+        raise ValueError("Records and messages must be JSON arrays")
+
+    uploads: list[UploadedObject] = []
+    ignored = 0
+    invalid = 0
+    entries = [(record, _parse_aws_record) for record in records] + [
+        (message, _parse_yandex_message) for message in messages
+    ]
+    for entry, parse in entries:
+        try:
+            upload = parse(entry, bucket_name)
+        except (KeyError, TypeError, AttributeError, ValueError) as e:
+            logger.warning(f"Некорректная запись уведомления S3: {e!r}")
+            invalid += 1
+            continue
+        if upload is None:
+            ignored += 1
+        else:
+            uploads.append(upload)
+    return ParsedNotification(uploads, ignored, invalid)
+
+
+class S3NotificationIngester:
+    """
+    Принимает уведомления ObjectCreated и подтверждает загрузки модов.
+
+    Загрузки из всех запросов за окно window копятся и применяются одним
+    UPDATE ... FROM unnest(...) через ModService.finalize_uploads; пачка
+    уходит раньше, если набралось max_batch загрузок. Ответ на запрос
+    отдаётся только после записи его пачки в БД: при ошибке нотификатор
+    получает 500 и повторит доставку.
+    """
+
+    def __init__(
+        self,
+        service: ModService,
+        bucket_name: str | None = None,
+        window: float = 0.5,
+        max_batch: int = 1000,
+    ) -> None:
+        self._service = service
+        self._bucket_name = bucket_name
+        self._window = window
+        self._max_batch = max_batch
+        self._pending: list[UploadedObject] = []
+        self._batch_done: asyncio.Future[None] | None = None
+        self._timer: asyncio.TimerHandle | None = None
+        self._flushes: set[asyncio.Task[None]] = set()
+
+    async def handle(self, body: bytes) -> HttpResponse:
+        """POST-обработчик для HttpServer"""
+        try:
+            parsed = parse_notification(body, self._bucket_name)
+        except ValueError as e:
+            NOTIFICATIONS_RECEIVED.inc(labels=("invalid",))
+            logger.warning(f"Некорректное уведомление S3: {e!s}")
+            return 400, "text/plain", b"invalid notification\n"
+
+        # Повреждённую запись повторная доставка не исправит: остальные
+        # записи применяются, нотификатор получает 200
+        NOTIFICATIONS_RECEIVED.inc(parsed.invalid, labels=("invalid",))
+        NOTIFICATIONS_RECEIVED.inc(parsed.ignored, labels=("ignored",))
+        NOTIFICATIONS_RECEIVED.inc(len(parsed.uploads), labels=("accepted",))
+        await self.submit(parsed.uploads)
+        return 200, "text/plain", b"ok\n"
+
+    async def submit(self, uploads: list[UploadedObject]) -> None:
+        """Добавляет загрузки в текущую пачку и ждёт её записи"""
+        if not uploads:
+            return
+
+        loop = asyncio.get_running_loop()
+        if self._batch_done is None:
+            self._batch_done = loop.create_future()
+            self._timer = loop.call_later(self._window, self._flush)
+        done = self._batch_done
+        self._pending.extend(uploads)
+        if len(self._pending) >= self._max_batch:
+            self._flush()
+
+        await asyncio.shield(done)
+
+    async def close(self) -> None:
+        """Отправляет накопленную пачку и дожидается всех записей"""
+        self._flush()
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        done, self._batch_done = self._batch_done, None
+        if done is None:
+            return
+
+        task = asyncio.create_task(self._write(batch, done))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _write(
+        self, batch: list[UploadedObject], done: asyncio.Future[None]
+    ) -> None:
+        try:
+            await self._service.finalize_uploads(batch, SOURCE)
+        except Exception as e:
+            logger.error(f"Не удалось применить пачку уведомлений S3: {e!s}")
+            done.set_exception(e)
+            # Если все ожидающие отменены, исключение никто не заберёт
+            done.add_done_callback(lambda future: future.exception())
+            return
+        NOTIFICATION_BATCH_SIZE.observe(len(batch))
+        done.set_result(None)
@@ -1,14 +1,39 @@
 import logging
 import mimetypes
 import os
+from collections.abc import AsyncIterator
+from concurrent.futures import Executor
 from datetime import datetime
 from typing import Any
 
-from modservice.s3_client import S3Client
+from botocore.exceptions import ClientError
+
+from modservice.constants import MAX_CENTRAL_DIRECTORY_SIZE, MAX_DB_ID
+from modservice.s3_client import S3Client, S3ObjectPage
+from modservice.zip_manifest import (
+    ZIP64_EOCD_SIZE,
+    ZIP_TAIL_SIZE,
+    ZipFormatError,
+    ZipManifest,
+    find_end_of_central_directory,
+    parse_central_directory,
+    parse_zip64_end_of_central_directory,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def _db_id(part: str) -> int:
+    """
+    Raises:
+        ValueError: не число или не помещается в INT колонки mods
+    """
+    value = int(part)
+    if not 0 <= value <= MAX_DB_ID:
+        raise ValueError(f"id вне диапазона INT: {part}")
+    return value
+
+
 class S3Service:
     def __init__(self, s3_client: S3Client) -> None:
         self._s3_client = s3_client
@@ -81,6 +106,99 @@ class S3Service:
         logger.info(f"Presigned GET URL MOD сгенерирован для {full_s3_key}")
         return presigned_url
 
+    async def get_mod_object_info(
+        self, s3_key_prefix: str
+    ) -> dict[str, Any] | None:
+        return await self._s3_client.head_object(f"{s3_key_prefix}/mod.zip")
+
+    async def hash_mod_object(
+        self, s3_key_prefix: str, executor: Executor | None = None
+    ) -> str:
+        return await self._s3_client.object_sha256(
+            f"{s3_key_prefix}/mod.zip", executor
+        )
+
+    async def read_mod_manifest(self, s3_key_prefix: str) -> ZipManifest:
+        """
+        Оглавление mod.zip по central directory: ranged GET хвоста
+        архива и, если central directory в хвост не поместился, ещё
+        один GET на него. Содержимое файлов не скачивается.
+
+        Raises:
+            ZipFormatError: mod.zip не zip или повреждён
+        """
+        full_s3_key = f"{s3_key_prefix}/mod.zip"
+        try:
+            tail, size = await self._s3_client.get_object_range(
+                full_s3_key, -ZIP_TAIL_SIZE
+            )
+        except ClientError as e:
+            # На пустой объект S3 отвечает 416 InvalidRange
+            if e.response.get("Error", {}).get("Code") == "InvalidRange":
+                raise ZipFormatError("Пустой архив") from e
+            raise
+        tail_offset = size - len(tail)
+
+        async def read(offset: int, length: int) -> bytes:
+            if offset < 0 or offset + length > size:
+                raise ZipFormatError("Смещение за пределами архива")
+            if length == 0:
+                return b""
+            if offset >= tail_offset:
+                start = offset - tail_offset
+                return tail[start : start + length]
+            data, _ = await self._s3_client.get_object_range(
+                full_s3_key, offset, offset + length - 1
+            )
+            return data
+
+        directory = find_end_of_central_directory(tail, tail_offset)
+        if directory.zip64_eocd_offset is not None:
+            directory = parse_zip64_end_of_central_directory(
+                await read(directory.zip64_eocd_offset, ZIP64_EOCD_SIZE)
+            )
+        if directory.size > MAX_CENTRAL_DIRECTORY_SIZE:
+            raise ZipFormatError(
+                f"Central directory слишком большой: {directory.size} байт"
+            )
+
+        manifest = parse_central_directory(
+            await read(directory.offset, directory.size),
+            directory.entry_count,
+        )
+        logger.info(
+            f"Оглавление {full_s3_key}: {manifest.file_count} файлов, "
+            f"{manifest.uncompressed_size} байт после распаковки"
+        )
+        return manifest
+
+    async def delete_mod_object(self, s3_key_prefix: str) -> bool:
+        full_s3_key = f"{s3_key_prefix}/mod.zip"
+
+        failed = await self._s3_client.delete_objects([full_s3_key])
+
+        if failed:
+            logger.error(f"Ошибка удаления {full_s3_key}")
+        else:
+            logger.info(f"Удалён {full_s3_key}")
+        return not failed
+
+    async def generate_mod_download_urls(
+        self,
+        s3_key_prefixes: list[str],
+        expiration: int = 3600,
+    ) -> list[str]:
+        full_s3_keys = [f"{prefix}/mod.zip" for prefix in s3_key_prefixes]
+
+        presigned_urls = await self._s3_client.generate_presigned_get_urls(
+            s3_keys=full_s3_keys, expiration=expiration
+        )
+
+        logger.info(
+            f"Presigned GET URL MOD сгенерированы для {len(full_s3_keys)} модов"
+        )
+        return presigned_urls
+
     async def generate_upload_url(
         self,
         author_id: int,
@@ -171,28 +289,45 @@ class S3Service:
     async def list_files(self, prefix: str = "") -> list[dict[str, Any]]:
         logger.info(f"Получаем список файлов с префиксом: '{prefix}'")
 
-        files = await self._s3_client.list_objects(prefix)
+        files = []
+        async for page in self._s3_client.iter_objects(prefix):
+            files.extend(page.objects)
 
         logger.info(f"Найдено {len(files)} файлов")
         return files
 
+    def iter_file_pages(
+        self,
+        prefix: str = "",
+        page_size: int = 1000,
+        continuation_token: str | None = None,
+    ) -> AsyncIterator[S3ObjectPage]:
+        return self._s3_client.iter_objects(
+            prefix, page_size, continuation_token
+        )
+
+    async def delete_files(self, s3_keys: list[str]) -> list[str]:
+        logger.info(f"Удаляем {len(s3_keys)} объектов")
+
+        failed = await self._s3_client.delete_objects(s3_keys)
+
+        if failed:
+            logger.error(f"Не удалось удалить {len(failed)} объектов")
+
+        return failed
+
     def get_file_info_from_s3_key(self, s3_key: str) -> dict[str, Any]:
         try:
             parts = s3_key.split("/")
             if len(parts) >= 2:
-                author_id = int(parts[0])
+                author_id = _db_id(parts[0])
 
                 remaining_parts = parts[1:]
                 if len(remaining_parts) == 1:
                     mod_part = remaining_parts[0]
 
                     try:
-                        mod_id = int(mod_part)
-                        return {
-                            "author_id": author_id,
-                            "mod_id": mod_id,
-                            "full_s3_key": s3_key,
-                        }
+                        int(mod_part)
                     except ValueError:
                         timestamp_filename = mod_part
 
@@ -212,6 +347,21 @@ class S3Service:
                                     "filename": filename,
                                     "full_s3_key": s3_key,
                                 }
+                    else:
+                        return {
+                            "author_id": author_id,
+                            "mod_id": _db_id(mod_part),
+                            "full_s3_key": s3_key,
+                        }
+
+                elif remaining_parts[0].isdigit():
+                    # Файлы мода: author_id/mod_id/<файл>, например mod.zip
+                    return {
+                        "author_id": author_id,
+                        "mod_id": _db_id(remaining_parts[0]),
+                        "filename": "/".join(remaining_parts[1:]),
+                        "full_s3_key": s3_key,
+                    }
 
                 return {
                     "author_id": author_id,
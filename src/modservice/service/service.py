@@ -1,33 +1,87 @@
+from collections.abc import AsyncIterator
+from datetime import datetime
 from typing import Any
 
+from modservice.constants import STATUS_UPLOADED
+from modservice.metrics import timed
+from modservice.repository.model import (
+    ModFilter,
+    ModManifest,
+    ModRow,
+    PendingUpload,
+    ReplacedObject,
+    UnhashedMod,
+    UninspectedMod,
+)
 from modservice.repository.repository import ModRepository
 from modservice.service.create_mod import create_mod as _create_mod
+from modservice.service.download_link_cache import DownloadLinkCache
+from modservice.service.finalize_uploads import (
+    UploadedObject,
+)
+from modservice.service.finalize_uploads import (
+    finalize_uploads as _finalize_uploads,
+)
+from modservice.service.get_mod_download_link import (
+    get_mod_download_link as _get_mod_download_link,
+)
+from modservice.service.get_mod_download_links import (
+    get_mod_download_links as _get_mod_download_links,
+)
 from modservice.service.get_mods import get_mods as _get_mods
 from modservice.service.s3_service import S3Service
 from modservice.service.set_status import set_status as _set_status
+from modservice.service.single_flight import SingleFlight
 
 
 class ModService:
-    def __init__(self, repo: ModRepository, s3_service: S3Service) -> None:
+    def __init__(
+        self,
+        repo: ModRepository,
+        s3_service: S3Service,
+        download_link_cache: DownloadLinkCache | None = None,
+    ) -> None:
         self._repo = repo
         self._s3_service = s3_service
+        self._download_link_cache = download_link_cache
+        # Одновременные одинаковые запросы делят один поход в БД
+        self._download_link_flight: SingleFlight[tuple[int, int], str] = (
+            SingleFlight("get_mod_download_link")
+        )
+        self._get_mods_flight: SingleFlight[
+            tuple[int, int, str, ModFilter | None], tuple[list[ModRow], str]
+        ] = SingleFlight("get_mods")
+        self._catalogue_version = 0
 
+    @property
+    def catalogue_version(self) -> int:
+        """
+        Поколение каталога: растёт при любом изменении, видимом в GetMods
+        (создание мода, смена статуса, уведомление из БД)
+        """
+        return self._catalogue_version
+
+    @timed("service")
     async def create_mod(
         self, title: str, author_id: int, description: str
     ) -> tuple[int, str, str]:
-        return await _create_mod(
+        result = await _create_mod(
             self._repo,
             self._s3_service,
             title,
             author_id,
             description,
         )
+        self._catalogue_version += 1
+        return result
 
+    @timed("service")
     async def generate_s3_key(
         self, author_id: int, filename: str, title: str | None = None
     ) -> str:
         return self._s3_service.generate_s3_key(author_id, filename, title)
 
+    @timed("service")
     async def generate_upload_url(
         self,
         author_id: int,
@@ -40,9 +94,11 @@ class ModService:
             author_id, filename, title, expiration, content_type
         )
 
+    @timed("service")
     async def get_file_info_from_s3_key(self, s3_key: str) -> dict[str, Any]:
         return self._s3_service.get_file_info_from_s3_key(s3_key)
 
+    @timed("service")
     async def generate_mod_download_url(
         self,
         s3_key_prefix: str,
@@ -52,6 +108,7 @@ class ModService:
             s3_key_prefix, expiration
         )
 
+    @timed("service")
     async def generate_mod_upload_url(
         self,
         s3_key_prefix: str,
@@ -61,20 +118,152 @@ class ModService:
             s3_key_prefix, expiration
         )
 
+    @timed("service")
     async def get_mod_download_link(
         self,
         mod_id: int,
         expiration: int = 3600,
     ) -> str:
-        s3_key = await self._repo.get_mod_s3_key(mod_id)
-        return await self._s3_service.generate_mod_download_url(
-            s3_key, expiration
+        return await self._download_link_flight.do(
+            (mod_id, expiration),
+            lambda: _get_mod_download_link(
+                self._repo,
+                self._s3_service,
+                mod_id,
+                expiration,
+                self._download_link_cache,
+            ),
         )
 
+    @timed("service")
+    async def get_mod_download_links(
+        self,
+        mod_ids: list[int],
+        expiration: int = 3600,
+    ) -> dict[int, str]:
+        return await _get_mod_download_links(
+            self._repo,
+            self._s3_service,
+            mod_ids,
+            expiration,
+            self._download_link_cache,
+        )
+
+    @timed("service")
     async def set_status(self, mod_id: int, status: str) -> bool:
-        return await _set_status(self._repo, mod_id, status)
+        success = await _set_status(self._repo, mod_id, status)
+        self._catalogue_version += 1
+        if status != STATUS_UPLOADED:
+            # После записи в БД: invalidate() поднимает version, и ссылки,
+            # подписанные параллельными запросами по старым данным,
+            # в кеш уже не попадут. Другие реплики узнают о смене статуса
+            # через ModStatusListener
+            self.invalidate_mod(mod_id)
+        return success
+
+    @timed("service")
+    async def get_pending_uploads(
+        self,
+        limit: int,
+        after: tuple[datetime, int] | None = None,
+    ) -> list[PendingUpload]:
+        return await self._repo.get_pending_uploads(limit, after)
+
+    @timed("service")
+    async def mark_failed_uploads(
+        self, mod_ids: list[int], max_age: float
+    ) -> list[int]:
+        """
+        Переводит в FAILED те из mod_ids, что ещё UPLOADING и созданы
+        больше max_age секунд назад. Возвращает их id.
+        """
+        return await self._repo.mark_failed_uploads(mod_ids, max_age)
 
+    @timed("service")
+    async def finalize_uploads(
+        self, uploads: list[UploadedObject], source: str
+    ) -> list[int]:
+        updated = await _finalize_uploads(self._repo, uploads, source)
+        # Новые UPLOADED моды появляются в каталоге и отдают ссылки
+        for mod_id in updated:
+            self.invalidate_mod(mod_id)
+        return updated
+
+    @timed("service")
+    async def get_existing_mod_ids(self, mod_ids: list[int]) -> set[int]:
+        return await self._repo.get_existing_mod_ids(mod_ids)
+
+    @timed("service")
+    async def get_referenced_s3_keys(self, s3_keys: list[str]) -> set[str]:
+        return await self._repo.get_referenced_s3_keys(s3_keys)
+
+    @timed("service")
+    async def get_unhashed_mods(
+        self, limit: int, after_id: int = 0, min_age: float = 0.0
+    ) -> list[UnhashedMod]:
+        return await self._repo.get_unhashed_mods(limit, after_id, min_age)
+
+    @timed("service")
+    async def get_replaced_objects(
+        self, limit: int, after_id: int = 0, min_age: float = 0.0
+    ) -> list[ReplacedObject]:
+        return await self._repo.get_replaced_objects(limit, after_id, min_age)
+
+    @timed("service")
+    async def clear_replaced_objects(
+        self, objects: list[ReplacedObject]
+    ) -> None:
+        await self._repo.clear_replaced_objects(objects)
+
+    @timed("service")
+    async def record_content_hash(
+        self, mod_id: int, s3_key: str, sha256: str
+    ) -> str | None:
+        """
+        Записывает SHA-256 mod.zip. Возвращает s3_key, которым мод
+        пользуется дальше: чужой, если такой архив уже загружен другим
+        модом, или None, если хеш уже был записан.
+        """
+        new_s3_key = await self._repo.set_content_hash(mod_id, sha256)
+        if new_s3_key is not None and new_s3_key != s3_key:
+            self.invalidate_mod(mod_id)
+        return new_s3_key
+
+    @timed("service")
+    async def get_uninspected_mods(
+        self, limit: int, after_id: int = 0
+    ) -> list[UninspectedMod]:
+        return await self._repo.get_uninspected_mods(limit, after_id)
+
+    @timed("service")
+    async def save_mod_manifests(self, manifests: list[ModManifest]) -> None:
+        await self._repo.save_mod_manifests(manifests)
+
+    def invalidate_mod(self, mod_id: int) -> None:
+        self._catalogue_version += 1
+        self._repo.invalidate_s3_key(mod_id)
+        if self._download_link_cache is not None:
+            self._download_link_cache.invalidate(mod_id)
+
+    def reset_caches(self) -> None:
+        self._catalogue_version += 1
+        self._repo.clear_s3_keys()
+        if self._download_link_cache is not None:
+            self._download_link_cache.clear()
+
+    @timed("service")
     async def get_mods(
         self,
-    ) -> list[dict[str, Any]]:
-        return await _get_mods(self._repo)
+        page_size: int = 0,
+        page_token: str = "",
+        mod_filter: ModFilter | None = None,
+    ) -> tuple[list[ModRow], str]:
+        # Поколение в ключе: запрос, пришедший после изменения каталога,
+        # не присоединится к выборке, начатой до него
+        return await self._get_mods_flight.do(
+            (self._catalogue_version, page_size, page_token, mod_filter),
+            lambda: _get_mods(self._repo, page_size, page_token, mod_filter),
+        )
+
+    def stream_mods(self) -> AsyncIterator[ModRow]:
+        return self._repo.stream_mods()
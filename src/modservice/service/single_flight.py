@@ -0,0 +1,47 @@
+import asyncio
+from collections.abc import Callable, Coroutine, Hashable
+from functools import partial
+from typing import Any
+
+from modservice.metrics import Counter
+
+SINGLE_FLIGHT_SHARED = Counter(
+    "single_flight_shared_total",
+    "Calls served by an identical call already in flight",
+    ("operation",),
+)
+
+
+class SingleFlight[K: Hashable, V]:
+    """
+    Объединяет одновременные вызовы с одинаковым ключом.
+
+    Первый вызов запускает fn() отдельной задачей, остальные ждут её
+    результат или исключение. Задача защищена shield: отмена одного
+    ожидающего (клиент отменил RPC) не ломает остальных. Результат
+    общий для всех ожидающих — его нельзя изменять.
+    """
+
+    def __init__(self, operation: str) -> None:
+        self._operation = operation
+        self._in_flight: dict[K, asyncio.Task[V]] = {}
+
+    def __len__(self) -> int:
+        return len(self._in_flight)
+
+    async def do(self, key: K, fn: Callable[[], Coroutine[Any, Any, V]]) -> V:
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.create_task(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(partial(self._forget, key))
+        else:
+            SINGLE_FLIGHT_SHARED.inc(labels=(self._operation,))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: K, task: asyncio.Task[V]) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Если все ожидающие отменены, исключение никто не заберёт
+        if not task.cancelled():
+            task.exception()
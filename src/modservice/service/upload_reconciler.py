@@ -0,0 +1,176 @@
+import asyncio
+import contextlib
+import logging
+import time
+from datetime import datetime
+from typing import Any
+
+from modservice.metrics import Counter, Gauge, Histogram
+from modservice.repository.model import PendingUpload
+from modservice.service.finalize_uploads import UploadedObject
+from modservice.service.s3_service import S3Service
+from modservice.service.service import ModService
+
+logger = logging.getLogger(__name__)
+
+RECONCILER_RUNS = Counter(
+    "upload_reconciler_runs_total",
+    "Upload reconciler passes, by result",
+    ("result",),
+)
+RECONCILER_RUN_SECONDS = Histogram(
+    "upload_reconciler_run_seconds",
+    "Duration of one upload reconciler pass",
+    buckets=(0.1, 0.5, 1.0, 5.0, 15.0, 30.0, 60.0, 300.0),
+)
+RECONCILER_PENDING = Gauge(
+    "upload_reconciler_pending",
+    "UPLOADING mods without mod.zip after the last pass",
+)
+RECONCILER_FAILED = Counter(
+    "upload_reconciler_failed_total",
+    "UPLOADING mods marked FAILED after max_age without mod.zip",
+)
+RECONCILER_LAST_SUCCESS = Gauge(
+    "upload_reconciler_last_success_timestamp_seconds",
+    "Unix time of the last successful upload reconciler pass",
+)
+
+SOURCE = "reconciler"
+
+
+class UploadReconciler:
+    """
+    Фоновая задача: переводит моды из UPLOADING в UPLOADED, когда
+    mod.zip появился в S3.
+
+    Раз в interval секунд обходит UPLOADING моды пачками по batch_size,
+    проверяет <s3_key>/mod.zip запросами HEAD (не больше concurrency
+    одновременно) и найденные подтверждает одним UPDATE на пачку.
+    Моды, у которых mod.zip так и не появился за max_age секунд,
+    переводятся в FAILED и больше не проверяются (0 — не переводить).
+    Отставание видно по upload_finalize_lag_seconds{source="reconciler"}
+    и upload_reconciler_last_success_timestamp_seconds.
+    """
+
+    def __init__(
+        self,
+        service: ModService,
+        s3_service: S3Service,
+        interval: float = 30.0,
+        batch_size: int = 500,
+        concurrency: int = 32,
+        max_age: float = 86400.0,
+    ) -> None:
+        self._service = service
+        self._s3_service = s3_service
+        self._interval = interval
+        self._batch_size = batch_size
+        self._max_age = max_age
+        self._slots = asyncio.Semaphore(concurrency)
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info(
+                f"Реконсилер загрузок запущен, период {self._interval}s"
+            )
+
+    async def close(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    async def run_once(self) -> int:
+        """
+        Один проход по всем UPLOADING модам. Возвращает число модов,
+        переведённых в UPLOADED.
+        """
+        started = time.perf_counter()
+        pending = 0
+        finalized = 0
+        failed = 0
+        after: tuple[datetime, int] | None = None
+        try:
+            while True:
+                batch = await self._service.get_pending_uploads(
+                    self._batch_size, after
+                )
+                if not batch:
+                    break
+                after = (batch[-1].created_at, batch[-1].id)
+                pending += len(batch)
+
+                uploads, missing = await self._check_batch(batch)
+                updated = await self._service.finalize_uploads(uploads, SOURCE)
+                finalized += len(updated)
+                if missing and self._max_age > 0:
+                    expired = await self._service.mark_failed_uploads(
+                        missing, self._max_age
+                    )
+                    if expired:
+                        logger.warning(
+                            f"mod.zip не загружен за {self._max_age}s, "
+                            f"моды переведены в FAILED: {expired}"
+                        )
+                        RECONCILER_FAILED.inc(len(expired))
+                    failed += len(expired)
+
+                if len(batch) < self._batch_size:
+                    break
+        except Exception:
+            RECONCILER_RUNS.inc(labels=("error",))
+            raise
+        finally:
+            RECONCILER_RUN_SECONDS.observe(time.perf_counter() - started)
+
+        RECONCILER_RUNS.inc(labels=("ok",))
+        RECONCILER_PENDING.set(pending - finalized - failed)
+        RECONCILER_LAST_SUCCESS.set(time.time())
+        return finalized
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"Ошибка прохода реконсилера загрузок: {e!s}")
+            await asyncio.sleep(self._interval)
+
+    async def _check_batch(
+        self, batch: list[PendingUpload]
+    ) -> tuple[list[UploadedObject], list[int]]:
+        """
+        Возвращает найденные в S3 загрузки и id модов, у которых
+        mod.zip нет. Моды с ошибкой HEAD не попадают ни туда, ни туда.
+        """
+        results = await asyncio.gather(
+            *(self._head(pending) for pending in batch),
+            return_exceptions=True,
+        )
+        uploads: list[UploadedObject] = []
+        missing: list[int] = []
+        for pending, info in zip(batch, results, strict=True):
+            if isinstance(info, BaseException):
+                # Ошибка по одному моду не должна срывать всю пачку
+                logger.warning(f"HEAD {pending.s3_key}/mod.zip: {info!s}")
+            elif info is None:
+                missing.append(pending.id)
+            else:
+                uploads.append(
+                    UploadedObject(
+                        mod_id=pending.id,
+                        s3_key=pending.s3_key,
+                        size=info["size"],
+                        uploaded_at=info["last_modified"],
+                    )
+                )
+        return uploads, missing
+
+    async def _head(self, pending: PendingUpload) -> dict[str, Any] | None:
+        async with self._slots:
+            return await self._s3_service.get_mod_object_info(pending.s3_key)
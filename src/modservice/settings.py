@@ -1,8 +1,10 @@
 import logging
 
-from pydantic import Field
+from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from modservice.constants import S3_DEFAULT_PART_SIZE
+
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
@@ -13,6 +15,84 @@ class Settings(BaseSettings):
     port: int = Field(validation_alias="PORT")
     database_url: str = Field(validation_alias="DATABASE_URL")
 
+    # Процессов run-server, слушающих PORT через SO_REUSEPORT
+    workers: int = Field(default=1, validation_alias="WORKERS")
+    shutdown_grace: float = Field(
+        default=10.0, validation_alias="SHUTDOWN_GRACE"
+    )
+    # Нужен extra uvloop: pip install modservice[uvloop]
+    use_uvloop: bool = Field(default=False, validation_alias="USE_UVLOOP")
+
+    # gRPC сервер; None — значение по умолчанию gRPC
+    grpc_maximum_concurrent_rpcs: int | None = Field(
+        default=None, validation_alias="GRPC_MAXIMUM_CONCURRENT_RPCS"
+    )
+    grpc_max_concurrent_streams: int | None = Field(
+        default=None, validation_alias="GRPC_MAX_CONCURRENT_STREAMS"
+    )
+    grpc_max_receive_message_length: int | None = Field(
+        default=None, validation_alias="GRPC_MAX_RECEIVE_MESSAGE_LENGTH"
+    )
+    grpc_max_send_message_length: int | None = Field(
+        default=None, validation_alias="GRPC_MAX_SEND_MESSAGE_LENGTH"
+    )
+    grpc_keepalive_time_ms: int | None = Field(
+        default=None, validation_alias="GRPC_KEEPALIVE_TIME_MS"
+    )
+    grpc_keepalive_timeout_ms: int | None = Field(
+        default=None, validation_alias="GRPC_KEEPALIVE_TIMEOUT_MS"
+    )
+    grpc_keepalive_permit_without_calls: bool | None = Field(
+        default=None, validation_alias="GRPC_KEEPALIVE_PERMIT_WITHOUT_CALLS"
+    )
+    grpc_min_ping_interval_without_data_ms: int | None = Field(
+        default=None,
+        validation_alias="GRPC_HTTP2_MIN_PING_INTERVAL_WITHOUT_DATA_MS",
+    )
+    grpc_max_connection_idle_ms: int | None = Field(
+        default=None, validation_alias="GRPC_MAX_CONNECTION_IDLE_MS"
+    )
+    grpc_max_connection_age_ms: int | None = Field(
+        default=None, validation_alias="GRPC_MAX_CONNECTION_AGE_MS"
+    )
+    grpc_max_connection_age_grace_ms: int | None = Field(
+        default=None, validation_alias="GRPC_MAX_CONNECTION_AGE_GRACE_MS"
+    )
+
+    db_pool_min_size: int = Field(
+        default=1, validation_alias="DB_POOL_MIN_SIZE"
+    )
+    db_pool_max_size: int = Field(
+        default=10, validation_alias="DB_POOL_MAX_SIZE"
+    )
+    db_acquire_timeout: float = Field(
+        default=5.0, validation_alias="DB_ACQUIRE_TIMEOUT"
+    )
+    db_command_timeout: float | None = Field(
+        default=60.0, validation_alias="DB_COMMAND_TIMEOUT"
+    )
+    db_max_inactive_connection_lifetime: float = Field(
+        default=300.0, validation_alias="DB_MAX_INACTIVE_CONNECTION_LIFETIME"
+    )
+    db_statement_cache_size: int = Field(
+        default=100, validation_alias="DB_STATEMENT_CACHE_SIZE"
+    )
+    db_max_cached_statement_lifetime: int = Field(
+        default=300, validation_alias="DB_MAX_CACHED_STATEMENT_LIFETIME"
+    )
+    # false для PgBouncer в transaction mode
+    db_prepared_statements: bool = Field(
+        default=True, validation_alias="DB_PREPARED_STATEMENTS"
+    )
+
+    # По умолчанию /metrics доступен только локально; для сбора метрик
+    # из другого пода нужен адрес интерфейса
+    metrics_host: str = Field(
+        default="127.0.0.1", validation_alias="METRICS_HOST"
+    )
+    # 0 отключает HTTP сервер с /metrics
+    metrics_port: int = Field(default=9100, validation_alias="METRICS_PORT")
+
     log_level: str = Field(validation_alias="LOG_LEVEL")
     log_format: str = Field(validation_alias="LOG_FORMAT")
     log_datefmt: str = Field(validation_alias="LOG_DATEFMT")
@@ -22,6 +102,153 @@ class Settings(BaseSettings):
     s3_secret_key: str = Field(validation_alias="S3_SECRET_KEY")
     s3_bucket_name: str = Field(validation_alias="S3_BUCKET_NAME")
     s3_verify: bool = Field(validation_alias="S3_VERIFY")
+    s3_max_pool_connections: int = Field(
+        default=10, validation_alias="S3_MAX_POOL_CONNECTIONS"
+    )
+    s3_local_presign: bool = Field(
+        default=True, validation_alias="S3_LOCAL_PRESIGN"
+    )
+    s3_multipart_part_size: int = Field(
+        default=S3_DEFAULT_PART_SIZE, validation_alias="S3_MULTIPART_PART_SIZE"
+    )
+    s3_multipart_concurrency: int = Field(
+        default=4, validation_alias="S3_MULTIPART_CONCURRENCY"
+    )
+
+    download_link_cache_size: int = Field(
+        default=10_000, validation_alias="DOWNLOAD_LINK_CACHE_SIZE"
+    )
+    s3_key_cache_size: int = Field(
+        default=100_000, validation_alias="S3_KEY_CACHE_SIZE"
+    )
+    get_mods_cache_size: int = Field(
+        default=256, validation_alias="GET_MODS_CACHE_SIZE"
+    )
+
+    # 0 отключает реконсилер загрузок
+    upload_reconciler_interval: float = Field(
+        default=30.0, validation_alias="UPLOAD_RECONCILER_INTERVAL"
+    )
+    upload_reconciler_batch_size: int = Field(
+        default=500, validation_alias="UPLOAD_RECONCILER_BATCH_SIZE"
+    )
+    upload_reconciler_concurrency: int = Field(
+        default=32, validation_alias="UPLOAD_RECONCILER_CONCURRENCY"
+    )
+    # Через сколько секунд мод без mod.zip переводится в FAILED и
+    # больше не проверяется; 0 — проверять, пока не загрузят
+    upload_reconciler_max_age: float = Field(
+        default=86400.0, validation_alias="UPLOAD_RECONCILER_MAX_AGE"
+    )
+
+    # POST /s3/events на отдельном HTTP сервере: приём уведомлений
+    # ObjectCreated от MinIO/S3/Yandex Cloud. Без S3_NOTIFY_TOKEN и
+    # S3_NOTIFY_PORT включить нельзя: любой клиент подтверждал бы
+    # загрузки или уведомления некому было бы принять. Воркеры делят
+    # порт через SO_REUSEPORT
+    s3_notify_enabled: bool = Field(
+        default=False, validation_alias="S3_NOTIFY_ENABLED"
+    )
+    s3_notify_host: str = Field(
+        default="0.0.0.0", validation_alias="S3_NOTIFY_HOST"
+    )
+    s3_notify_port: int = Field(default=0, validation_alias="S3_NOTIFY_PORT")
+    s3_notify_token: str | None = Field(
+        default=None, validation_alias="S3_NOTIFY_TOKEN"
+    )
+    s3_notify_window: float = Field(
+        default=0.5, validation_alias="S3_NOTIFY_WINDOW"
+    )
+    s3_notify_max_batch: int = Field(
+        default=1000, validation_alias="S3_NOTIFY_MAX_BATCH"
+    )
+
+    # SHA-256 mod.zip и склейка дубликатов; 0 — выключено
+    content_dedup_interval: float = Field(
+        default=0.0, validation_alias="CONTENT_DEDUP_INTERVAL"
+    )
+    content_dedup_batch_size: int = Field(
+        default=100, validation_alias="CONTENT_DEDUP_BATCH_SIZE"
+    )
+    content_dedup_workers: int = Field(
+        default=4, validation_alias="CONTENT_DEDUP_WORKERS"
+    )
+    # Больше срока жизни ссылки на загрузку (1 ч): моложе mod.zip ещё
+    # могут перезаписать
+    content_dedup_min_age: float = Field(
+        default=7200.0, validation_alias="CONTENT_DEDUP_MIN_AGE"
+    )
+    # Копия дубликата удаляется не раньше: дольше жизни ссылки на
+    # скачивание (1 ч), выданной до перевода на оригинал
+    content_dedup_delete_delay: float = Field(
+        default=7200.0, validation_alias="CONTENT_DEDUP_DELETE_DELAY"
+    )
+    # Архивов за проход; 0 — без ограничения
+    content_dedup_max_archives: int = Field(
+        default=1000, validation_alias="CONTENT_DEDUP_MAX_ARCHIVES"
+    )
+
+    # Оглавления mod.zip в mod_manifests; 0 — выключено
+    mod_inspector_interval: float = Field(
+        default=0.0, validation_alias="MOD_INSPECTOR_INTERVAL"
+    )
+    mod_inspector_batch_size: int = Field(
+        default=100, validation_alias="MOD_INSPECTOR_BATCH_SIZE"
+    )
+    mod_inspector_concurrency: int = Field(
+        default=16, validation_alias="MOD_INSPECTOR_CONCURRENCY"
+    )
+
+    # Сборщик осиротевших объектов бакета; 0 — выключен
+    s3_gc_interval: float = Field(
+        default=0.0, validation_alias="S3_GC_INTERVAL"
+    )
+    s3_gc_dry_run: bool = Field(default=True, validation_alias="S3_GC_DRY_RUN")
+    # Удалений в секунду; 0 — без ограничения
+    s3_gc_rate_limit: float = Field(
+        default=500.0, validation_alias="S3_GC_RATE_LIMIT"
+    )
+    s3_gc_min_age: float = Field(
+        default=86400.0, validation_alias="S3_GC_MIN_AGE"
+    )
+    s3_gc_checkpoint_path: str | None = Field(
+        default=None, validation_alias="S3_GC_CHECKPOINT_PATH"
+    )
+
+    @model_validator(mode="after")
+    def _require_s3_notify_listener(self) -> "Settings":
+        if self.s3_notify_enabled and not self.s3_notify_token:
+            raise ValueError("S3_NOTIFY_ENABLED requires S3_NOTIFY_TOKEN")
+        if self.s3_notify_enabled and self.s3_notify_port <= 0:
+            raise ValueError("S3_NOTIFY_ENABLED requires S3_NOTIFY_PORT")
+        return self
+
+    def grpc_server_options(self) -> list[tuple[str, int]]:
+        options = {
+            "grpc.max_concurrent_streams": self.grpc_max_concurrent_streams,
+            "grpc.max_receive_message_length": (
+                self.grpc_max_receive_message_length
+            ),
+            "grpc.max_send_message_length": self.grpc_max_send_message_length,
+            "grpc.keepalive_time_ms": self.grpc_keepalive_time_ms,
+            "grpc.keepalive_timeout_ms": self.grpc_keepalive_timeout_ms,
+            "grpc.keepalive_permit_without_calls": (
+                self.grpc_keepalive_permit_without_calls
+            ),
+            "grpc.http2.min_ping_interval_without_data_ms": (
+                self.grpc_min_ping_interval_without_data_ms
+            ),
+            "grpc.max_connection_idle_ms": self.grpc_max_connection_idle_ms,
+            "grpc.max_connection_age_ms": self.grpc_max_connection_age_ms,
+            "grpc.max_connection_age_grace_ms": (
+                self.grpc_max_connection_age_grace_ms
+            ),
+        }
+        return [
+            (name, int(value))
+            for name, value in options.items()
+            if value is not None
+        ]
 
     def configure_logging(self) -> None:
         logging.basicConfig(
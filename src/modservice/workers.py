@@ -0,0 +1,128 @@
+import logging
+import multiprocessing
+import signal
+import time
+from collections.abc import Callable
+from multiprocessing.connection import wait
+from multiprocessing.process import BaseProcess
+from types import FrameType
+
+logger = logging.getLogger(__name__)
+
+POLL_INTERVAL = 0.5
+RESTART_BACKOFF_MAX = 30.0
+# Воркер, проживший дольше, считается здоровым: backoff сбрасывается
+HEALTHY_UPTIME = 60.0
+
+
+class WorkerSupervisor:
+    """
+    Pre-fork супервизор: держит workers процессов target(index).
+
+    Упавший воркер перезапускается с экспоненциальной паузой. По SIGTERM
+    или SIGINT воркерам отправляется SIGTERM; те, что не завершились за
+    shutdown_timeout, убиваются.
+    """
+
+    def __init__(
+        self,
+        target: Callable[[int], None],
+        workers: int,
+        shutdown_timeout: float = 15.0,
+        start_method: str = "spawn",
+    ) -> None:
+        self._target = target
+        self._workers = workers
+        self._shutdown_timeout = shutdown_timeout
+        self._context = multiprocessing.get_context(start_method)
+        self._processes: dict[int, BaseProcess] = {}
+        self._started_at: dict[int, float] = {}
+        self._failures: dict[int, int] = {}
+        self._restart_at: dict[int, float] = {}
+        self._stopping = False
+
+    def stop(self) -> None:
+        self._stopping = True
+
+    def run(self) -> None:
+        previous = {
+            sig: signal.signal(sig, self._handle_signal)
+            for sig in (signal.SIGTERM, signal.SIGINT)
+        }
+        try:
+            for index in range(self._workers):
+                self._start(index)
+            while not self._stopping:
+                self._poll()
+        finally:
+            self._shutdown()
+            for sig, handler in previous.items():
+                signal.signal(sig, handler)
+
+    def _handle_signal(
+        self,
+        signum: int,
+        frame: FrameType | None,  # noqa: ARG002
+    ) -> None:
+        logger.info(f"Супервизор получил сигнал {signum}, останавливаем")
+        self._stopping = True
+
+    def _start(self, index: int) -> None:
+        process = self._context.Process(  # type: ignore[attr-defined]
+            target=self._target,
+            args=(index,),
+            name=f"modservice-worker-{index}",
+        )
+        process.start()
+        self._processes[index] = process
+        self._started_at[index] = time.monotonic()
+        logger.info(f"Воркер {index} запущен, pid {process.pid}")
+
+    def _poll(self) -> None:
+        sentinels = {
+            process.sentinel: index
+            for index, process in self._processes.items()
+        }
+        for sentinel in wait(list(sentinels), timeout=POLL_INTERVAL):
+            if self._stopping:
+                return
+            index = sentinels[sentinel]  # type: ignore[index]
+            self._schedule_restart(index)
+
+        now = time.monotonic()
+        for index, restart_at in list(self._restart_at.items()):
+            if now >= restart_at and not self._stopping:
+                del self._restart_at[index]
+                self._start(index)
+
+    def _schedule_restart(self, index: int) -> None:
+        process = self._processes.pop(index)
+        process.join()
+        uptime = time.monotonic() - self._started_at.pop(index)
+        if uptime >= HEALTHY_UPTIME:
+            self._failures[index] = 0
+        failures = self._failures.get(index, 0)
+        self._failures[index] = failures + 1
+
+        delay = min(RESTART_BACKOFF_MAX, 0.5 * 2**failures)
+        logger.error(
+            f"Воркер {index} (pid {process.pid}) завершился с кодом "
+            f"{process.exitcode}, перезапуск через {delay:.1f}s"
+        )
+        self._restart_at[index] = time.monotonic() + delay
+
+    def _shutdown(self) -> None:
+        self._restart_at.clear()
+        for process in self._processes.values():
+            if process.is_alive():
+                process.terminate()
+
+        deadline = time.monotonic() + self._shutdown_timeout
+        for index, process in self._processes.items():
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                logger.warning(f"Воркер {index} не остановился, kill")
+                process.kill()
+                process.join()
+        self._processes.clear()
+        logger.info("Все воркеры остановлены")
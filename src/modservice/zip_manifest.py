@@ -0,0 +1,234 @@
+import struct
+from dataclasses import dataclass
+from typing import NamedTuple
+
+# End of central directory: 22 байта и комментарий до 65535 байт
+EOCD_SIGNATURE = b"PK\x05\x06"
+EOCD_SIZE = 22
+EOCD_MAX_SIZE = EOCD_SIZE + 0xFFFF
+ZIP64_LOCATOR_SIGNATURE = b"PK\x06\x07"
+ZIP64_LOCATOR_SIZE = 20
+ZIP64_EOCD_SIGNATURE = b"PK\x06\x06"
+ZIP64_EOCD_SIZE = 56
+CENTRAL_HEADER_SIGNATURE = b"PK\x01\x02"
+CENTRAL_HEADER_SIZE = 46
+
+# Хвост архива, в котором гарантированно лежат EOCD и локатор ZIP64;
+# у небольших архивов туда же попадает и весь central directory
+ZIP_TAIL_SIZE = EOCD_MAX_SIZE + ZIP64_LOCATOR_SIZE
+
+_EOCD = struct.Struct("<4sHHHHIIH")
+_ZIP64_LOCATOR = struct.Struct("<4sIQI")
+_ZIP64_EOCD = struct.Struct("<4sQHHIIQQQQ")
+_CENTRAL_HEADER = struct.Struct("<4sHHHHHHIIIHHHHHII")
+_EXTRA_HEADER = struct.Struct("<HH")
+
+_ZIP64_EXTRA_ID = 0x0001
+_UTF8_FLAG = 0x800
+_MAX_16 = 0xFFFF
+_MAX_32 = 0xFFFFFFFF
+
+
+class ZipFormatError(ValueError):
+    """Архив повреждён или не является zip"""
+
+
+class ZipEntry(NamedTuple):
+    name: str
+    compressed_size: int
+    uncompressed_size: int
+
+    @property
+    def is_dir(self) -> bool:
+        return self.name.endswith("/")
+
+
+@dataclass(frozen=True)
+class ZipManifest:
+    """Оглавление архива из central directory, без содержимого файлов"""
+
+    entries: list[ZipEntry]
+
+    @property
+    def file_count(self) -> int:
+        return sum(1 for entry in self.entries if not entry.is_dir)
+
+    @property
+    def compressed_size(self) -> int:
+        return sum(entry.compressed_size for entry in self.entries)
+
+    @property
+    def uncompressed_size(self) -> int:
+        return sum(entry.uncompressed_size for entry in self.entries)
+
+    @property
+    def compression_ratio(self) -> float:
+        """Во сколько раз архив вырастет при распаковке"""
+        return self.uncompressed_size / max(self.compressed_size, 1)
+
+
+@dataclass(frozen=True)
+class CentralDirectory:
+    """
+    Положение central directory в архиве. zip64_eocd_offset задан,
+    если offset/size/entry_count нужно прочитать из записи ZIP64 EOCD
+    по этому смещению (parse_zip64_end_of_central_directory).
+    """
+
+    offset: int
+    size: int
+    entry_count: int
+    zip64_eocd_offset: int | None = None
+
+
+def find_end_of_central_directory(
+    tail: bytes, tail_offset: int
+) -> CentralDirectory:
+    """
+    Ищет EOCD в хвосте архива, начинающемся со смещения tail_offset.
+
+    Raises:
+        ZipFormatError: EOCD не найден
+    """
+    position = len(tail)
+    while True:
+        position = tail.rfind(EOCD_SIGNATURE, 0, position)
+        if position < 0:
+            raise ZipFormatError("End of central directory не найден")
+        if len(tail) - position < EOCD_SIZE:
+            continue
+        (
+            _,
+            disk,
+            cd_disk,
+            _,
+            entry_count,
+            size,
+            offset,
+            comment_length,
+        ) = _EOCD.unpack_from(tail, position)
+        # Сигнатура может встретиться в данных или комментарии:
+        # настоящий EOCD заканчивается своим комментарием
+        if position + EOCD_SIZE + comment_length <= len(tail):
+            break
+
+    if (disk, cd_disk) not in ((0, 0), (_MAX_16, _MAX_16)):
+        raise ZipFormatError("Многотомные архивы не поддерживаются")
+
+    locator = position - ZIP64_LOCATOR_SIZE
+    if locator >= 0 and tail.startswith(ZIP64_LOCATOR_SIGNATURE, locator):
+        _, _, zip64_eocd_offset, _ = _ZIP64_LOCATOR.unpack_from(tail, locator)
+        return CentralDirectory(offset, size, entry_count, zip64_eocd_offset)
+
+    if offset + size > tail_offset + position:
+        raise ZipFormatError("Central directory выходит за EOCD")
+    return CentralDirectory(offset, size, entry_count)
+
+
+def parse_zip64_end_of_central_directory(data: bytes) -> CentralDirectory:
+    """
+    Raises:
+        ZipFormatError: запись ZIP64 EOCD повреждена
+    """
+    if len(data) < ZIP64_EOCD_SIZE:
+        raise ZipFormatError("Запись ZIP64 EOCD обрезана")
+    (
+        signature,
+        _,
+        _,
+        _,
+        _,
+        _,
+        _,
+        entry_count,
+        size,
+        offset,
+    ) = _ZIP64_EOCD.unpack_from(data)
+    if signature != ZIP64_EOCD_SIGNATURE:
+        raise ZipFormatError("Неверная сигнатура ZIP64 EOCD")
+    return CentralDirectory(offset, size, entry_count)
+
+
+def _zip64_sizes(
+    extra: bytes, compressed_size: int, uncompressed_size: int
+) -> tuple[int, int]:
+    # В поле ZIP64 лежат только те значения, что в заголовке равны
+    # 0xFFFFFFFF, и всегда в порядке: распакованный, сжатый размер
+    position = 0
+    while position + _EXTRA_HEADER.size <= len(extra):
+        field_id, field_size = _EXTRA_HEADER.unpack_from(extra, position)
+        position += _EXTRA_HEADER.size
+        if position + field_size > len(extra):
+            raise ZipFormatError("Дополнительное поле обрезано")
+        if field_id == _ZIP64_EXTRA_ID:
+            values = iter(
+                struct.unpack_from(f"<{field_size // 8}Q", extra, position)
+            )
+            try:
+                if uncompressed_size == _MAX_32:
+                    uncompressed_size = next(values)
+                if compressed_size == _MAX_32:
+                    compressed_size = next(values)
+            except StopIteration:
+                raise ZipFormatError("Поле ZIP64 обрезано") from None
+            break
+        position += field_size
+    return compressed_size, uncompressed_size
+
+
+def parse_central_directory(data: bytes, entry_count: int) -> ZipManifest:
+    """
+    Разбирает central directory из entry_count заголовков.
+
+    Raises:
+        ZipFormatError: заголовок повреждён или их меньше entry_count
+    """
+    entries: list[ZipEntry] = []
+    position = 0
+    for _ in range(entry_count):
+        if position + CENTRAL_HEADER_SIZE > len(data):
+            raise ZipFormatError("Central directory обрезан")
+        (
+            signature,
+            _,
+            _,
+            flags,
+            _,
+            _,
+            _,
+            _,
+            compressed_size,
+            uncompressed_size,
+            name_length,
+            extra_length,
+            comment_length,
+            _,
+            _,
+            _,
+            _,
+        ) = _CENTRAL_HEADER.unpack_from(data, position)
+        if signature != CENTRAL_HEADER_SIGNATURE:
+            raise ZipFormatError(
+                f"Неверная сигнатура заголовка на смещении {position}"
+            )
+
+        name_start = position + CENTRAL_HEADER_SIZE
+        extra_start = name_start + name_length
+        position = extra_start + extra_length + comment_length
+        if position > len(data):
+            raise ZipFormatError("Central directory обрезан")
+
+        raw_name = data[name_start:extra_start]
+        # NUL из имени не принимают ни jsonb, ни text в PostgreSQL
+        name = raw_name.decode(
+            "utf-8" if flags & _UTF8_FLAG else "cp437", errors="replace"
+        ).replace("\x00", "\ufffd")
+        if _MAX_32 in (compressed_size, uncompressed_size):
+            compressed_size, uncompressed_size = _zip64_sizes(
+                data[extra_start : extra_start + extra_length],
+                compressed_size,
+                uncompressed_size,
+            )
+        entries.append(ZipEntry(name, compressed_size, uncompressed_size))
+
+    return ZipManifest(entries)
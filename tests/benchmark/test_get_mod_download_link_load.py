@@ -0,0 +1,132 @@
+import asyncio
+import os
+import statistics
+import time
+from collections.abc import Callable
+
+import grpc
+import pytest
+from pytest_mock import MockerFixture
+
+from modservice.grpc import mod_pb2, mod_pb2_grpc
+from modservice.handler.handler import ModHandler
+from modservice.repository.pool import MeteredPool
+from modservice.repository.repository import ModRepository
+from modservice.s3_client import S3Client
+from modservice.server import create_grpc_server, loop_factory
+from modservice.service.s3_service import S3Service
+from modservice.service.service import ModService
+from modservice.settings import Settings
+
+# host:port запущенного сервера; без него поднимается сервер в процессе
+LOAD_TEST_TARGET = os.environ.get("LOAD_TEST_TARGET", "")
+DURATION = float(os.environ.get("LOAD_TEST_DURATION", "1.0"))
+CONCURRENCY = int(os.environ.get("LOAD_TEST_CONCURRENCY", "32"))
+
+# Обязательные настройки, не влияющие на сервер; GRPC_* берутся из
+# окружения, как у run-server
+REQUIRED_SETTINGS = {
+    "HOST": "127.0.0.1",
+    "PORT": "0",
+    "DATABASE_URL": "postgresql://bench",
+    "LOG_LEVEL": "WARNING",
+    "LOG_FORMAT": "%(message)s",
+    "LOG_DATEFMT": "%H:%M:%S",
+    "S3_API_ENDPOINT": "https://s3.example.com",
+    "S3_ACCESS_KEY": "bench-access",
+    "S3_SECRET_KEY": "bench-secret",
+    "S3_BUCKET_NAME": "bench",
+    "S3_VERIFY": "true",
+}
+
+
+class _Repo(ModRepository):
+    """s3_key без БД: нагрузка приходится на gRPC и подпись URL"""
+
+    async def get_mod_s3_key(self, mod_id: int) -> str:
+        await asyncio.sleep(0)
+        return f"{mod_id % 500}/{mod_id}"
+
+
+async def _start_server(
+    settings: Settings, db_pool: MeteredPool
+) -> tuple[grpc.aio.Server, str]:
+    s3_client = S3Client(
+        access_key=settings.s3_access_key,
+        secret_key=settings.s3_secret_key,
+        endpoint_url=settings.s3_api_endpoint,
+        bucket_name=settings.s3_bucket_name,
+        verify=settings.s3_verify,
+    )
+    service = ModService(_Repo(db_pool), S3Service(s3_client))
+    server = create_grpc_server(ModHandler(service), settings)
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+    return server, f"127.0.0.1:{port}"
+
+
+async def _load(target: str) -> list[float]:
+    latencies: list[float] = []
+    deadline = time.monotonic() + DURATION
+
+    async with grpc.aio.insecure_channel(target) as channel:
+        stub = mod_pb2_grpc.ModServiceStub(channel)  # type: ignore[no-untyped-call]
+        await stub.GetModDownloadLink(
+            mod_pb2.GetModDownloadLinkRequest(mod_id=1)
+        )
+
+        async def client(offset: int) -> None:
+            mod_id = offset
+            while time.monotonic() < deadline:
+                started = time.perf_counter()
+                await stub.GetModDownloadLink(
+                    mod_pb2.GetModDownloadLinkRequest(mod_id=mod_id)
+                )
+                latencies.append(time.perf_counter() - started)
+                mod_id += CONCURRENCY
+
+        await asyncio.gather(*(client(i) for i in range(CONCURRENCY)))
+    return latencies
+
+
+async def _run_load(settings: Settings, db_pool: MeteredPool) -> list[float]:
+    if LOAD_TEST_TARGET:
+        return await _load(LOAD_TEST_TARGET)
+
+    server, target = await _start_server(settings, db_pool)
+    try:
+        return await _load(target)
+    finally:
+        await server.stop(None)
+
+
+def _measure(
+    factory: Callable[[], asyncio.AbstractEventLoop] | None,
+    settings: Settings,
+    db_pool: MeteredPool,
+) -> tuple[float, float]:
+    with asyncio.Runner(loop_factory=factory) as runner:
+        latencies = runner.run(_run_load(settings, db_pool))
+    p99 = statistics.quantiles(latencies, n=100)[98]
+    return len(latencies) / DURATION, p99
+
+
+@pytest.mark.benchmark
+def test_get_mod_download_link_throughput_and_p99(
+    mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    for name, value in REQUIRED_SETTINGS.items():
+        if name not in os.environ:
+            monkeypatch.setenv(name, value)
+    settings = Settings()
+    # Пул не используется: _Repo отдаёт s3_key без запросов
+    db_pool = mocker.Mock(spec=MeteredPool)
+
+    results = {"asyncio": _measure(None, settings, db_pool)}
+    uvloop_factory = loop_factory(use_uvloop=True)
+    if uvloop_factory is not None:
+        results["uvloop"] = _measure(uvloop_factory, settings, db_pool)
+
+    print(f"\nGetModDownloadLink, {CONCURRENCY} clients, {DURATION:.1f}s:")
+    for name, (rps, p99) in results.items():
+        print(f"  {name:8} {rps:8.0f} rps, p99 {p99 * 1e3:.2f} ms")
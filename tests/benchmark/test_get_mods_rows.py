@@ -0,0 +1,107 @@
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Any
+
+import pytest
+
+from modservice.grpc import mod_pb2
+from modservice.handler.get_mods import STATUS_TO_PROTO, mod_to_proto
+from modservice.repository.model import ModRow
+
+ROWS = 10_000
+
+COLUMN_INDEX = {name: i for i, name in enumerate(ModRow._fields)}
+
+
+class _Record(tuple[Any, ...]):
+    """Как asyncpg.Record: доступ по имени колонки и итерация по значениям"""
+
+    def __getitem__(self, key: Any) -> Any:
+        if isinstance(key, str):
+            key = COLUMN_INDEX[key]
+        return super().__getitem__(key)
+
+
+def _records() -> list[_Record]:
+    created_at = datetime(2025, 10, 9, 9, 30, 17)
+    return [
+        _Record(
+            (
+                i,
+                i % 500,
+                f"Mod title {i}",
+                "Some description " * 4,
+                1,
+                f"{i % 500}/{i}",
+                "UPLOADED",
+                created_at - timedelta(seconds=i),
+            )
+        )
+        for i in range(ROWS)
+    ]
+
+
+def _via_dicts(records: list[_Record]) -> list[mod_pb2.Mod]:
+    mods = []
+    for row in records:
+        mods.append(
+            {
+                "id": row["id"],
+                "author_id": row["author_id"],
+                "title": row["title"],
+                "description": row["description"],
+                "version": row["version"],
+                "s3_key": row["s3_key"],
+                "status": row["status"],
+                "created_at": row["created_at"],
+            }
+        )
+    return [
+        mod_pb2.Mod(
+            id=mod["id"],
+            author_id=mod["author_id"],
+            title=mod["title"],
+            description=mod["description"],
+            version=mod["version"],
+            status=STATUS_TO_PROTO[mod["status"]],
+            created_at=(mod["created_at"] if mod.get("created_at") else None),
+        )
+        for mod in mods
+    ]
+
+
+def _via_mod_rows(records: list[_Record]) -> list[mod_pb2.Mod]:
+    rows = list(map(ModRow._make, records))
+    return [mod_to_proto(row) for row in rows]
+
+
+def _measure(
+    convert: Callable[[list[_Record]], list[mod_pb2.Mod]],
+    records: list[_Record],
+) -> tuple[float, int]:
+    convert(records)
+    started = time.perf_counter()
+    convert(records)
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    convert(records)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+@pytest.mark.benchmark
+def test_mod_rows_skip_dict_layer() -> None:
+    records = _records()
+
+    dict_time, dict_peak = _measure(_via_dicts, records)
+    row_time, row_peak = _measure(_via_mod_rows, records)
+
+    print(
+        f"\n{ROWS} rows -> mod_pb2.Mod: "
+        f"dicts {dict_time * 1e3:.1f} ms / {dict_peak / 1024:.0f} KiB peak, "
+        f"ModRow {row_time * 1e3:.1f} ms / {row_peak / 1024:.0f} KiB peak"
+    )
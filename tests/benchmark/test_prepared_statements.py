@@ -0,0 +1,56 @@
+import os
+import time
+
+import pytest
+
+from modservice.repository.get_mod_s3_key import get_mod_s3_key
+from modservice.repository.get_mods import get_mods
+from modservice.repository.pool import create_pool
+
+DATABASE_URL = os.environ.get("BENCHMARK_DATABASE_URL", "")
+ITERATIONS = 2_000
+
+
+async def _measure(prepared_statements: bool) -> tuple[float, float]:
+    pool = await create_pool(
+        DATABASE_URL,
+        min_size=1,
+        max_size=1,
+        prepared_statements=prepared_statements,
+    )
+    try:
+        # Прогрев: кеш asyncpg и кеш типов
+        await get_mod_s3_key(pool, 1)
+        await get_mods(pool, 100)
+
+        started = time.perf_counter()
+        for i in range(ITERATIONS):
+            await get_mod_s3_key(pool, i)
+        s3_key_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for _ in range(ITERATIONS // 10):
+            await get_mods(pool, 100)
+        get_mods_time = time.perf_counter() - started
+    finally:
+        await pool.close()
+    return s3_key_time, get_mods_time
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+@pytest.mark.skipif(
+    not DATABASE_URL, reason="BENCHMARK_DATABASE_URL is not set"
+)
+async def test_statement_cache_vs_unprepared_fallback() -> None:
+    fallback_s3_key, fallback_get_mods = await _measure(False)
+    prepared_s3_key, prepared_get_mods = await _measure(True)
+
+    print(
+        f"\nget_mod_s3_key x{ITERATIONS}: "
+        f"fallback {fallback_s3_key * 1e3:.0f} ms, "
+        f"prepared {prepared_s3_key * 1e3:.0f} ms"
+        f"\nget_mods(100) x{ITERATIONS // 10}: "
+        f"fallback {fallback_get_mods * 1e3:.0f} ms, "
+        f"prepared {prepared_get_mods * 1e3:.0f} ms"
+    )
@@ -0,0 +1,42 @@
+import time
+
+import pytest
+
+from modservice.s3_client import S3Client
+
+CALLS = 50
+
+
+def _make_client() -> S3Client:
+    return S3Client(
+        access_key="access",
+        secret_key="secret",
+        endpoint_url="https://s3.example.com",
+        bucket_name="bucket",
+        verify=True,
+        local_presign=False,
+    )
+
+
+async def _per_call_latency(s3_client: S3Client) -> float:
+    started = time.perf_counter()
+    for i in range(CALLS):
+        await s3_client.generate_presigned_get_url(f"1/{i}/mod.zip")
+    return (time.perf_counter() - started) / CALLS
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_long_lived_client_cuts_per_call_latency() -> None:
+    s3_client = _make_client()
+    per_call_client = await _per_call_latency(s3_client)
+
+    async with s3_client:
+        await s3_client.generate_presigned_get_url("warmup")
+        shared_client = await _per_call_latency(s3_client)
+
+    print(
+        f"\npresigned GET, {CALLS} calls: "
+        f"client per call {per_call_client * 1e3:.3f} ms/call, "
+        f"shared client {shared_client * 1e3:.3f} ms/call"
+    )
@@ -0,0 +1,41 @@
+import time
+
+import pytest
+
+from modservice.s3_client import S3Client
+
+CALLS = 2000
+
+
+def _make_client(local_presign: bool) -> S3Client:
+    return S3Client(
+        access_key="access",
+        secret_key="secret",
+        endpoint_url="https://s3.example.com",
+        bucket_name="bucket",
+        verify=True,
+        local_presign=local_presign,
+    )
+
+
+async def _urls_per_second(s3_client: S3Client) -> float:
+    started = time.perf_counter()
+    for i in range(CALLS):
+        await s3_client.generate_presigned_get_url(f"1/{i}/mod.zip")
+    return CALLS / (time.perf_counter() - started)
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_local_presigner_vs_botocore_rate() -> None:
+    async with _make_client(local_presign=False) as botocore_client:
+        await botocore_client.generate_presigned_get_url("warmup")
+        botocore_rate = await _urls_per_second(botocore_client)
+
+    local_rate = await _urls_per_second(_make_client(local_presign=True))
+
+    print(
+        f"\npresigned GET, {CALLS} calls: "
+        f"botocore {botocore_rate:,.0f} urls/s, "
+        f"local SigV4 {local_rate:,.0f} urls/s"
+    )
@@ -0,0 +1,46 @@
+from unittest.mock import AsyncMock
+
+import grpc
+import pytest
+from faker import Faker
+from pytest_mock import MockerFixture
+
+from modservice.grpc import mod_pb2
+from modservice.handler.get_mod_download_links import GetModDownloadLinks
+from modservice.service.service import ModService
+
+
+@pytest.mark.asyncio
+async def test_get_mod_download_links_keeps_request_order(
+    mocker: MockerFixture, faker: Faker
+) -> None:
+    context = mocker.Mock(spec=grpc.ServicerContext)
+    service = mocker.Mock(spec=ModService)
+    url = faker.uri()
+    service.get_mod_download_links = AsyncMock(return_value={7: url})
+
+    request = mod_pb2.GetModDownloadLinksRequest(mod_ids=[5, 7, 5])
+    response = await GetModDownloadLinks(service, request, context)
+
+    assert [
+        (link.mod_id, link.link_url, link.found) for link in response.links
+    ] == [(5, "", False), (7, url, True), (5, "", False)]
+    service.get_mod_download_links.assert_awaited_once_with([5, 7, 5])
+
+
+@pytest.mark.asyncio
+async def test_get_mod_download_links_invalid_argument(
+    mocker: MockerFixture,
+) -> None:
+    context = mocker.Mock(spec=grpc.ServicerContext)
+    service = mocker.Mock(spec=ModService)
+    service.get_mod_download_links = AsyncMock(
+        side_effect=ValueError("too many")
+    )
+
+    request = mod_pb2.GetModDownloadLinksRequest(mod_ids=[1])
+    response = await GetModDownloadLinks(service, request, context)
+
+    assert list(response.links) == []
+    context.set_code.assert_called_once_with(grpc.StatusCode.INVALID_ARGUMENT)
+    context.set_details.assert_called_once_with("too many")
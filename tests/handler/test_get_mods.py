@@ -10,6 +10,8 @@ from pytest_mock import MockerFixture
 from modservice.constants import STATUS_BANNED, STATUS_UPLOADED
 from modservice.grpc import mod_pb2
 from modservice.handler.get_mods import GetMods
+from modservice.handler.get_mods_cache import GetModsResponseCache
+from modservice.repository.model import ModFilter, ModRow
 from modservice.service.service import ModService
 
 
@@ -30,46 +32,169 @@ async def test_get_mods_converts_models(
     created_at_second = faker.date_time(tzinfo=UTC)
 
     mods_data = [
-        {
-            "id": faker.random_int(min=1, max=100000),
-            "author_id": faker.random_int(min=1, max=100000),
-            "title": faker.sentence(nb_words=3),
-            "description": faker.text(),
-            "version": faker.random_int(min=1, max=10),
-            "s3_key": faker.file_path(depth=2),
-            "status": STATUS_UPLOADED,
-            "created_at": _ts_from_datetime(created_at_first),
-        },
-        {
-            "id": faker.random_int(min=1, max=100000),
-            "author_id": faker.random_int(min=1, max=100000),
-            "title": faker.sentence(nb_words=4),
-            "description": faker.text(),
-            "version": faker.random_int(min=1, max=10),
-            "s3_key": faker.file_path(depth=2),
-            "status": STATUS_BANNED,
-            "created_at": _ts_from_datetime(created_at_second),
-        },
+        ModRow(
+            id=faker.random_int(min=1, max=100000),
+            author_id=faker.random_int(min=1, max=100000),
+            title=faker.sentence(nb_words=3),
+            description=faker.text(),
+            version=faker.random_int(min=1, max=10),
+            s3_key=faker.file_path(depth=2),
+            status=STATUS_UPLOADED,
+            created_at=created_at_first,
+        ),
+        ModRow(
+            id=faker.random_int(min=1, max=100000),
+            author_id=faker.random_int(min=1, max=100000),
+            title=faker.sentence(nb_words=4),
+            description=faker.text(),
+            version=faker.random_int(min=1, max=10),
+            s3_key=faker.file_path(depth=2),
+            status=STATUS_BANNED,
+            created_at=created_at_second,
+        ),
     ]
-    service.get_mods = AsyncMock(return_value=mods_data)
+    next_page_token = faker.pystr()
+    service.get_mods = AsyncMock(return_value=(mods_data, next_page_token))
 
-    request = mod_pb2.GetModsRequest()
+    request = mod_pb2.GetModsRequest(page_size=2, page_token=faker.pystr())
     response = await GetMods(service, request, context)
 
     assert isinstance(response, mod_pb2.GetModsResponse)
     assert len(response.mods) == 2
 
     first_mod = response.mods[0]
-    assert first_mod.id == mods_data[0]["id"]
-    assert first_mod.author_id == mods_data[0]["author_id"]
-    assert first_mod.title == mods_data[0]["title"]
-    assert first_mod.description == mods_data[0]["description"]
-    assert first_mod.version == mods_data[0]["version"]
+    assert first_mod.id == mods_data[0].id
+    assert first_mod.author_id == mods_data[0].author_id
+    assert first_mod.title == mods_data[0].title
+    assert first_mod.description == mods_data[0].description
+    assert first_mod.version == mods_data[0].version
     assert first_mod.status == mod_pb2.ModStatus.MOD_STATUS_UPLOADED
-    assert first_mod.created_at == mods_data[0]["created_at"]
+    assert first_mod.created_at == _ts_from_datetime(created_at_first)
 
     second_mod = response.mods[1]
     assert second_mod.status == mod_pb2.ModStatus.MOD_STATUS_BANNED
-    assert second_mod.created_at == mods_data[1]["created_at"]
+    assert second_mod.created_at == _ts_from_datetime(created_at_second)
 
-    service.get_mods.assert_awaited_once_with()
+    assert response.next_page_token == next_page_token
+
+    service.get_mods.assert_awaited_once_with(
+        request.page_size, request.page_token, None
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_mods_invalid_page_token_sets_error(
+    mocker: MockerFixture, faker: Faker
+) -> None:
+    context = mocker.Mock(spec=grpc.ServicerContext)
+    service = mocker.Mock(spec=ModService)
+    service.get_mods = AsyncMock(side_effect=ValueError("Invalid page_token"))
+
+    request = mod_pb2.GetModsRequest(page_token=faker.pystr())
+    response = await GetMods(service, request, context)
+
+    assert isinstance(response, mod_pb2.GetModsResponse)
+    assert len(response.mods) == 0
+    context.set_code.assert_called_once_with(grpc.StatusCode.INVALID_ARGUMENT)
+    context.set_details.assert_called_once_with("Invalid page_token")
+
+
+@pytest.mark.asyncio
+async def test_get_mods_builds_filter_from_request(
+    mocker: MockerFixture, faker: Faker
+) -> None:
+    context = mocker.Mock(spec=grpc.ServicerContext)
+    service = mocker.Mock(spec=ModService)
+    service.get_mods = AsyncMock(return_value=([], ""))
+
+    author_id = faker.random_int(min=1, max=100000)
+    created_after = datetime(2025, 1, 1, 12, 0, 0)
+    request = mod_pb2.GetModsRequest(
+        author_id=author_id,
+        statuses=[
+            mod_pb2.ModStatus.MOD_STATUS_UPLOADED,
+            mod_pb2.ModStatus.MOD_STATUS_HIDDEN,
+        ],
+        created_after=_ts_from_datetime(created_after.replace(tzinfo=UTC)),
+    )
+    await GetMods(service, request, context)
+
+    service.get_mods.assert_awaited_once_with(
+        0,
+        "",
+        ModFilter(
+            author_id=author_id,
+            statuses=(STATUS_UPLOADED, "HIDDEN"),
+            created_after=created_after,
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_mods_unspecified_status_filter_sets_error(
+    mocker: MockerFixture,
+) -> None:
+    context = mocker.Mock(spec=grpc.ServicerContext)
+    service = mocker.Mock(spec=ModService)
+    service.get_mods = AsyncMock()
+
+    request = mod_pb2.GetModsRequest(
+        statuses=[mod_pb2.ModStatus.MOD_STATUS_UNSPECIFIED]
+    )
+    await GetMods(service, request, context)
+
+    service.get_mods.assert_not_called()
+    context.set_code.assert_called_once_with(grpc.StatusCode.INVALID_ARGUMENT)
+
+
+@pytest.mark.asyncio
+async def test_get_mods_serves_unfiltered_page_from_cache(
+    mocker: MockerFixture, faker: Faker
+) -> None:
+    context = mocker.Mock(spec=grpc.ServicerContext)
+    service = mocker.Mock(spec=ModService)
+    mod = ModRow(
+        id=faker.random_int(min=1, max=100000),
+        author_id=faker.random_int(min=1, max=100000),
+        title=faker.sentence(nb_words=3),
+        description=faker.text(),
+        version=1,
+        s3_key=None,
+        status=STATUS_UPLOADED,
+        created_at=faker.date_time(tzinfo=UTC),
+    )
+    service.get_mods = AsyncMock(return_value=([mod], "next"))
+    generation = 0
+    cache = GetModsResponseCache(lambda: generation)
+    request = mod_pb2.GetModsRequest(page_size=10)
+
+    first = await GetMods(service, request, context, cache)
+    second = await GetMods(service, request, context, cache)
+
+    assert isinstance(first, bytes)
+    assert second is first
+    service.get_mods.assert_awaited_once()
+    response = mod_pb2.GetModsResponse.FromString(first)
+    assert [m.id for m in response.mods] == [mod.id]
+    assert response.next_page_token == "next"
+
+    generation += 1
+    await GetMods(service, request, context, cache)
+
+    assert service.get_mods.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_mods_does_not_cache_filtered_requests(
+    mocker: MockerFixture,
+) -> None:
+    context = mocker.Mock(spec=grpc.ServicerContext)
+    service = mocker.Mock(spec=ModService)
+    service.get_mods = AsyncMock(return_value=([], ""))
+    cache = GetModsResponseCache(lambda: 0)
+    request = mod_pb2.GetModsRequest(author_id=7)
+
+    response = await GetMods(service, request, context, cache)
+
+    assert isinstance(response, mod_pb2.GetModsResponse)
+    assert len(cache) == 0
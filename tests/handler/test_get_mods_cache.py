@@ -0,0 +1,55 @@
+from modservice.handler.get_mods_cache import GetModsResponseCache
+
+
+class _Generation:
+    def __init__(self) -> None:
+        self.value = 0
+
+    def __call__(self) -> int:
+        return self.value
+
+
+def test_cache_returns_bytes_of_current_generation() -> None:
+    generation = _Generation()
+    cache = GetModsResponseCache(generation)
+
+    cache.put(20, "", b"page", cache.generation)
+
+    assert cache.get(20, "") == b"page"
+    assert cache.get(20, "token") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cache_drops_entries_of_old_generation() -> None:
+    generation = _Generation()
+    cache = GetModsResponseCache(generation)
+    cache.put(20, "", b"page", cache.generation)
+
+    generation.value += 1
+
+    assert cache.get(20, "") is None
+    assert len(cache) == 0
+
+
+def test_cache_ignores_rebuild_started_before_change() -> None:
+    generation = _Generation()
+    cache = GetModsResponseCache(generation)
+    started_at = cache.generation
+
+    generation.value += 1
+    cache.put(20, "", b"stale", started_at)
+
+    assert len(cache) == 0
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    cache = GetModsResponseCache(_Generation(), max_size=2)
+    cache.put(1, "", b"one", 0)
+    cache.put(2, "", b"two", 0)
+    cache.get(1, "")
+
+    cache.put(3, "", b"three", 0)
+
+    assert cache.get(2, "") is None
+    assert cache.get(1, "") == b"one"
+    assert cache.get(3, "") == b"three"
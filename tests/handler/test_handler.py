@@ -44,6 +44,18 @@ def _build_download_link_pair(
     return request, response
 
 
+def _build_download_links_pair(
+    faker: Faker,
+) -> tuple[
+    mod_pb2.GetModDownloadLinksRequest, mod_pb2.GetModDownloadLinksResponse
+]:
+    mod_id = faker.random_int(min=1, max=100000)
+    response = mod_pb2.GetModDownloadLinksResponse()
+    response.links.add(mod_id=mod_id, link_url=faker.uri(), found=True)
+    request = mod_pb2.GetModDownloadLinksRequest(mod_ids=[mod_id])
+    return request, response
+
+
 def _build_set_status_pair(
     faker: Faker,
 ) -> tuple[mod_pb2.SetStatusRequest, mod_pb2.SetStatusResponse]:
@@ -76,6 +88,8 @@ class HandlerCase:
     method_name: str
     helper_attr: str
     builder: Callable[[Faker], tuple[Any, Any]]
+    # Дополнительные аргументы helper после context
+    extra_args: tuple[Any, ...] = ()
 
 
 CASES: tuple[HandlerCase, ...] = (
@@ -85,8 +99,13 @@ CASES: tuple[HandlerCase, ...] = (
         "_get_mod_download_link",
         _build_download_link_pair,
     ),
+    HandlerCase(
+        "GetModDownloadLinks",
+        "_get_mod_download_links",
+        _build_download_links_pair,
+    ),
     HandlerCase("SetStatus", "_set_status", _build_set_status_pair),
-    HandlerCase("GetMods", "_get_mods", _build_get_mods_pair),
+    HandlerCase("GetMods", "_get_mods", _build_get_mods_pair, (None,)),
 )
 
 
@@ -112,4 +131,6 @@ async def test_mod_handler_delegates_to_helper(
     result = await method(request, context)
 
     assert result is expected_response
-    helper.assert_awaited_once_with(service, request, context)
+    helper.assert_awaited_once_with(
+        service, request, context, *case.extra_args
+    )
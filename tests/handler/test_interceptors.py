@@ -0,0 +1,202 @@
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any, cast
+
+import grpc
+import pytest
+from pytest_mock import MockerFixture
+
+from modservice.handler.interceptors import (
+    GRPC_HANDLED,
+    GRPC_HANDLING_SECONDS,
+    GRPC_STARTED,
+    ErrorInterceptor,
+    MetricsInterceptor,
+    SerializedResponseInterceptor,
+)
+from modservice.repository.pool import PoolExhaustedError
+
+type Handler = grpc.RpcMethodHandler[Any, Any]
+
+
+async def _call_unary(handler: Handler, request: Any, context: Any) -> Any:
+    assert handler.unary_unary is not None
+    return await handler.unary_unary(request, context)
+
+
+async def _collect_stream(
+    handler: Handler, request: Any, context: Any
+) -> list[Any]:
+    assert handler.unary_stream is not None
+    # grpc-stubs описывает синхронные обработчики, в grpc.aio они async
+    stream = cast(AsyncIterator[Any], handler.unary_stream(request, context))
+    return [item async for item in stream]
+
+
+async def _intercept(mocker: MockerFixture, handler: Handler) -> Handler:
+    details = mocker.Mock(method="/mod.ModService/GetMods")
+    return await ErrorInterceptor().intercept_service(
+        mocker.AsyncMock(return_value=handler), details
+    )
+
+
+@pytest.mark.asyncio
+async def test_unary_pool_exhausted_maps_to_resource_exhausted(
+    mocker: MockerFixture,
+) -> None:
+    async def behavior(request: Any, context: Any) -> Any:
+        await asyncio.sleep(0)
+        raise PoolExhaustedError("busy")
+
+    handler = await _intercept(
+        mocker, grpc.unary_unary_rpc_method_handler(behavior)
+    )
+    context = mocker.Mock()
+    context.abort = mocker.AsyncMock()
+
+    await _call_unary(handler, object(), context)
+
+    context.abort.assert_awaited_once_with(
+        grpc.StatusCode.RESOURCE_EXHAUSTED, "busy"
+    )
+
+
+@pytest.mark.asyncio
+async def test_stream_pool_exhausted_maps_to_resource_exhausted(
+    mocker: MockerFixture,
+) -> None:
+    async def behavior(request: Any, context: Any) -> AsyncIterator[int]:
+        await asyncio.sleep(0)
+        yield 1
+        raise PoolExhaustedError("busy")
+
+    handler = await _intercept(
+        mocker, grpc.unary_stream_rpc_method_handler(behavior)
+    )
+    context = mocker.Mock()
+    context.abort = mocker.AsyncMock()
+
+    received = await _collect_stream(handler, None, context)
+
+    assert received == [1]
+    context.abort.assert_awaited_once_with(
+        grpc.StatusCode.RESOURCE_EXHAUSTED, "busy"
+    )
+
+
+@pytest.mark.asyncio
+async def test_unary_passes_result_through(mocker: MockerFixture) -> None:
+    async def behavior(request: Any, context: Any) -> Any:
+        await asyncio.sleep(0)
+        return request
+
+    handler = await _intercept(
+        mocker, grpc.unary_unary_rpc_method_handler(behavior)
+    )
+
+    assert await _call_unary(handler, "ok", mocker.Mock()) == "ok"
+
+
+@pytest.mark.asyncio
+async def test_serialized_response_passes_bytes_through(
+    mocker: MockerFixture,
+) -> None:
+    async def behavior(request: Any, context: Any) -> Any:
+        await asyncio.sleep(0)
+        return request
+
+    details = mocker.Mock(method="/mod.ModService/GetMods")
+    handler = await SerializedResponseInterceptor().intercept_service(
+        mocker.AsyncMock(
+            return_value=grpc.unary_unary_rpc_method_handler(
+                behavior, response_serializer=lambda r: r.encode()
+            )
+        ),
+        details,
+    )
+
+    assert handler.response_serializer is not None
+    assert handler.response_serializer(b"raw") == b"raw"
+    assert handler.response_serializer("text") == b"text"
+
+
+async def _measure(
+    mocker: MockerFixture, handler: Handler, method: str
+) -> Handler:
+    details = mocker.Mock(method=method)
+    return await MetricsInterceptor().intercept_service(
+        mocker.AsyncMock(return_value=handler), details
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("code", "expected"),
+    [(None, "OK"), (grpc.StatusCode.INVALID_ARGUMENT, "INVALID_ARGUMENT")],
+)
+async def test_metrics_records_unary_status_code(
+    mocker: MockerFixture, code: grpc.StatusCode | None, expected: str
+) -> None:
+    async def behavior(request: Any, context: Any) -> Any:
+        await asyncio.sleep(0)
+        return request
+
+    method = f"/test.Metrics/Unary{expected}"
+    handler = await _measure(
+        mocker, grpc.unary_unary_rpc_method_handler(behavior), method
+    )
+    context = mocker.Mock()
+    context.code.return_value = code
+
+    assert await _call_unary(handler, "ok", context) == "ok"
+
+    labels = ("test.Metrics", f"Unary{expected}")
+    assert GRPC_STARTED.value(labels) == 1
+    assert GRPC_HANDLED.value((*labels, expected)) == 1
+    assert GRPC_HANDLING_SECONDS.count(labels) == 1
+
+
+@pytest.mark.asyncio
+async def test_metrics_records_unhandled_exception_as_unknown(
+    mocker: MockerFixture,
+) -> None:
+    async def behavior(request: Any, context: Any) -> Any:
+        await asyncio.sleep(0)
+        raise RuntimeError("boom")
+
+    handler = await _measure(
+        mocker,
+        grpc.unary_unary_rpc_method_handler(behavior),
+        "/test.Metrics/Fails",
+    )
+    context = mocker.Mock()
+    context.code.return_value = None
+
+    with pytest.raises(RuntimeError):
+        await _call_unary(handler, None, context)
+
+    assert GRPC_HANDLED.value(("test.Metrics", "Fails", "UNKNOWN")) == 1
+
+
+@pytest.mark.asyncio
+async def test_metrics_records_stream_after_last_message(
+    mocker: MockerFixture,
+) -> None:
+    async def behavior(request: Any, context: Any) -> AsyncIterator[int]:
+        await asyncio.sleep(0)
+        yield 1
+        yield 2
+
+    handler = await _measure(
+        mocker,
+        grpc.unary_stream_rpc_method_handler(behavior),
+        "/test.Metrics/Stream",
+    )
+    context = mocker.Mock()
+    context.code.return_value = None
+
+    received = await _collect_stream(handler, None, context)
+
+    assert received == [1, 2]
+    assert GRPC_HANDLED.value(("test.Metrics", "Stream", "OK")) == 1
+    assert GRPC_HANDLING_SECONDS.count(("test.Metrics", "Stream")) == 1
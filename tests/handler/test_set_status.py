@@ -1,3 +1,4 @@
+from typing import Any
 from unittest.mock import AsyncMock
 
 import grpc
@@ -6,7 +7,9 @@ from faker import Faker
 from pytest_mock import MockerFixture
 
 from modservice.grpc import mod_pb2
+from modservice.handler.interceptors import ErrorInterceptor
 from modservice.handler.set_status import SetStatus
+from modservice.repository.pool import PoolExhaustedError
 from modservice.service.service import ModService
 
 
@@ -74,3 +77,37 @@ async def test_set_status_internal_error_sets_context(
         context.set_details.call_args.args[0]
         == f"Failed to set status: {error!s}"
     )
+
+
+@pytest.mark.asyncio
+async def test_set_status_pool_exhausted_maps_to_resource_exhausted(
+    mocker: MockerFixture, faker: Faker
+) -> None:
+    service = mocker.Mock(spec=ModService)
+    service.set_status = AsyncMock(side_effect=PoolExhaustedError("busy"))
+
+    async def behavior(
+        request: mod_pb2.SetStatusRequest, context: Any
+    ) -> mod_pb2.SetStatusResponse:
+        return await SetStatus(service, request, context)
+
+    handler = await ErrorInterceptor().intercept_service(
+        mocker.AsyncMock(
+            return_value=grpc.unary_unary_rpc_method_handler(behavior)
+        ),
+        mocker.Mock(method="/mod.ModService/SetStatus"),
+    )
+    context = mocker.Mock()
+    context.abort = mocker.AsyncMock()
+    request = mod_pb2.SetStatusRequest(
+        mod_id=faker.random_int(min=1, max=100000),
+        status=mod_pb2.ModStatus.MOD_STATUS_BANNED,
+    )
+
+    assert handler.unary_unary is not None
+    await handler.unary_unary(request, context)
+
+    context.abort.assert_awaited_once_with(
+        grpc.StatusCode.RESOURCE_EXHAUSTED, "busy"
+    )
+    context.set_code.assert_not_called()
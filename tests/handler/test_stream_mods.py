@@ -0,0 +1,71 @@
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import UTC
+
+import grpc
+import pytest
+from faker import Faker
+from pytest_mock import MockerFixture
+
+from modservice.constants import STATUS_HIDDEN, STATUS_UPLOADING
+from modservice.grpc import mod_pb2
+from modservice.handler.handler import ModHandler
+from modservice.handler.stream_mods import StreamMods
+from modservice.repository.model import ModRow
+from modservice.service.service import ModService
+
+
+async def _iterate(mods: list[ModRow]) -> AsyncIterator[ModRow]:
+    for mod in mods:
+        await asyncio.sleep(0)
+        yield mod
+
+
+def _mod_row(faker: Faker, status: str) -> ModRow:
+    return ModRow(
+        id=faker.random_int(min=1, max=100000),
+        author_id=faker.random_int(min=1, max=100000),
+        title=faker.sentence(nb_words=3),
+        description=faker.text(),
+        version=faker.random_int(min=1, max=10),
+        s3_key=faker.file_path(depth=2),
+        status=status,
+        created_at=faker.date_time(tzinfo=UTC),
+    )
+
+
+@pytest.mark.asyncio
+async def test_stream_mods_yields_protos(
+    mocker: MockerFixture, faker: Faker
+) -> None:
+    context = mocker.Mock(spec=grpc.ServicerContext)
+    service = mocker.Mock(spec=ModService)
+    mods_data = [
+        _mod_row(faker, STATUS_HIDDEN),
+        _mod_row(faker, STATUS_UPLOADING),
+    ]
+    service.stream_mods.return_value = _iterate(mods_data)
+
+    request = mod_pb2.StreamModsRequest()
+    result = [mod async for mod in StreamMods(service, request, context)]
+
+    assert [mod.id for mod in result] == [m.id for m in mods_data]
+    assert result[0].status == mod_pb2.ModStatus.MOD_STATUS_HIDDEN
+    assert result[1].status == mod_pb2.ModStatus.MOD_STATUS_UNSPECIFIED
+    service.stream_mods.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_mod_handler_stream_mods_delegates(
+    mocker: MockerFixture, faker: Faker
+) -> None:
+    service = mocker.Mock(spec=ModService)
+    context = mocker.Mock(spec=grpc.ServicerContext)
+    request = mod_pb2.StreamModsRequest()
+    mods_data = [_mod_row(faker, STATUS_HIDDEN)]
+    service.stream_mods.return_value = _iterate(mods_data)
+
+    handler = ModHandler(service)
+    result = [mod async for mod in handler.StreamMods(request, context)]
+
+    assert [mod.id for mod in result] == [mods_data[0].id]
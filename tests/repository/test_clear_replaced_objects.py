@@ -0,0 +1,32 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from modservice.repository.clear_replaced_objects import (
+    CLEAR_REPLACED_OBJECTS_QUERY,
+    clear_replaced_objects,
+)
+from modservice.repository.model import ReplacedObject
+
+
+@pytest.mark.asyncio
+async def test_clear_replaced_objects_matches_id_and_key(
+    mocker: MockerFixture,
+) -> None:
+    conn = mocker.Mock()
+    conn.execute = mocker.AsyncMock()
+    acquire_cm = mocker.AsyncMock()
+    acquire_cm.__aenter__.return_value = conn
+    acquire_cm.__aexit__.return_value = None
+    pool = mocker.Mock()
+    pool.acquire.return_value = acquire_cm
+
+    await clear_replaced_objects(
+        pool, [ReplacedObject(4, "1/4"), ReplacedObject(6, "2/6")]
+    )
+
+    conn.execute.assert_awaited_once_with(
+        CLEAR_REPLACED_OBJECTS_QUERY, [4, 6], ["1/4", "2/6"]
+    )
+    assert (
+        "mods.replaced_s3_key = deleted.s3_key" in CLEAR_REPLACED_OBJECTS_QUERY
+    )
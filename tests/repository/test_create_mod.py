@@ -8,12 +8,16 @@ from modservice.repository.repository import ModRepository
 
 
 @pytest.mark.asyncio
-async def test_repo_create_mod_inserts_row(
+async def test_repo_create_mod_inserts_row_with_s3_key(
     mocker: MockerFixture, faker: Faker
 ) -> None:
     mod_id = faker.random_int(min=1, max=100000)
+    author_id = faker.random_int(min=1, max=100000)
+    s3_key = f"{author_id}/{mod_id}"
     conn = mocker.Mock()
-    conn.fetchval = mocker.AsyncMock(return_value=mod_id)
+    conn.fetchrow = mocker.AsyncMock(
+        return_value={"id": mod_id, "s3_key": s3_key}
+    )
     acquire_cm = mocker.AsyncMock()
     acquire_cm.__aenter__.return_value = conn
     acquire_cm.__aexit__.return_value = None
@@ -23,23 +27,26 @@ async def test_repo_create_mod_inserts_row(
     repo = ModRepository(pool)
 
     title = faker.sentence(nb_words=3)
-    author_id = faker.random_int(min=1, max=100000)
     description = faker.text()
 
     result = await repo.create_mod(title, author_id, description)
 
-    assert result == mod_id
+    assert result == (mod_id, s3_key)
     expected_sql = """
-        INSERT INTO mods (author_id, title, description, version, status, created_at)
-        VALUES ($1, $2, $3, $4, 'UPLOADING', NOW())
-        RETURNING id
+        WITH new_mod AS (
+            SELECT nextval(pg_get_serial_sequence('mods', 'id')) AS id
+        )
+        INSERT INTO mods (id, author_id, title, description, version, s3_key, status, created_at)
+        SELECT id, $1::int, $2, $3, $4::int, $1::int || '/' || id, 'UPLOADING', NOW()
+        FROM new_mod
+        RETURNING id, s3_key
         """
-    actual_sql = conn.fetchval.await_args.args[0]
+    actual_sql = conn.fetchrow.await_args.args[0]
     assert (
         textwrap.dedent(actual_sql).strip()
         == textwrap.dedent(expected_sql).strip()
     )
-    assert conn.fetchval.await_args.args[1:] == (
+    assert conn.fetchrow.await_args.args[1:] == (
         author_id,
         title,
         description,
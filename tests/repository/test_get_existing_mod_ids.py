@@ -0,0 +1,25 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from modservice.repository.get_existing_mod_ids import (
+    GET_EXISTING_MOD_IDS_QUERY,
+    get_existing_mod_ids,
+)
+
+
+@pytest.mark.asyncio
+async def test_get_existing_mod_ids_returns_found_ids(
+    mocker: MockerFixture,
+) -> None:
+    conn = mocker.Mock()
+    conn.fetch = mocker.AsyncMock(return_value=[{"id": 1}, {"id": 3}])
+    acquire_cm = mocker.AsyncMock()
+    acquire_cm.__aenter__.return_value = conn
+    acquire_cm.__aexit__.return_value = None
+    pool = mocker.Mock()
+    pool.acquire.return_value = acquire_cm
+
+    result = await get_existing_mod_ids(pool, [1, 2, 3])
+
+    assert result == {1, 3}
+    conn.fetch.assert_awaited_once_with(GET_EXISTING_MOD_IDS_QUERY, [1, 2, 3])
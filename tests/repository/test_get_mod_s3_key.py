@@ -5,6 +5,8 @@ from faker import Faker
 from pytest_mock import MockerFixture
 
 from modservice.repository.get_mod_s3_key import get_mod_s3_key
+from modservice.repository.repository import ModRepository
+from modservice.repository.s3_key_cache import S3KeyCache
 
 
 @pytest.mark.asyncio
@@ -54,3 +56,25 @@ async def test_get_mod_s3_key_returns_zero_when_missing(
     result = await get_mod_s3_key(pool, mod_id)
 
     assert result == 0
+
+
+@pytest.mark.asyncio
+async def test_repository_get_mod_s3_key_reads_through_cache(
+    mocker: MockerFixture, faker: Faker
+) -> None:
+    s3_key = f"{faker.random_int(min=1, max=100000)}/1"
+    helper = mocker.patch(
+        "modservice.repository.repository._get_mod_s3_key",
+        mocker.AsyncMock(side_effect=[s3_key, 0, 0]),
+    )
+    repo = ModRepository(mocker.Mock(), S3KeyCache())
+
+    assert await repo.get_mod_s3_key(1) == s3_key
+    assert await repo.get_mod_s3_key(1) == s3_key
+    assert helper.await_count == 1
+
+    repo.invalidate_s3_key(1)
+
+    assert await repo.get_mod_s3_key(1) == "0"
+    assert await repo.get_mod_s3_key(1) == "0"
+    assert helper.await_count == 3
@@ -0,0 +1,64 @@
+import textwrap
+
+import pytest
+from faker import Faker
+from pytest_mock import MockerFixture
+
+from modservice.repository.get_mod_s3_keys import get_mod_s3_keys
+from modservice.repository.repository import ModRepository
+from modservice.repository.s3_key_cache import S3KeyCache
+
+
+@pytest.mark.asyncio
+async def test_get_mod_s3_keys_returns_mapping(
+    mocker: MockerFixture, faker: Faker
+) -> None:
+    mod_ids = [faker.random_int(min=1, max=100000) for _ in range(3)]
+    rows = [
+        {"id": mod_id, "s3_key": f"{faker.random_int()}/{mod_id}"}
+        for mod_id in mod_ids[:2]
+    ]
+    conn = mocker.Mock()
+    conn.fetch = mocker.AsyncMock(return_value=rows)
+    acquire_cm = mocker.AsyncMock()
+    acquire_cm.__aenter__.return_value = conn
+    acquire_cm.__aexit__.return_value = None
+    pool = mocker.Mock()
+    pool.acquire.return_value = acquire_cm
+
+    result = await get_mod_s3_keys(pool, mod_ids)
+
+    assert result == {row["id"]: row["s3_key"] for row in rows}
+    expected_sql = """
+        SELECT id, s3_key
+        FROM mods
+        WHERE id = ANY($1::int[])
+        AND status = 'UPLOADED'
+        AND s3_key IS NOT NULL;
+        """
+    actual_sql = conn.fetch.await_args.args[0]
+    assert (
+        textwrap.dedent(actual_sql).strip()
+        == textwrap.dedent(expected_sql).strip()
+    )
+    assert conn.fetch.await_args.args[1:] == (mod_ids,)
+
+
+@pytest.mark.asyncio
+async def test_repository_get_mod_s3_keys_queries_only_misses(
+    mocker: MockerFixture,
+) -> None:
+    helper = mocker.patch(
+        "modservice.repository.repository._get_mod_s3_keys",
+        mocker.AsyncMock(return_value={2: "20/2"}),
+    )
+    cache = S3KeyCache()
+    cache.put(1, "10/1")
+    pool = mocker.Mock()
+    repo = ModRepository(pool, cache)
+
+    result = await repo.get_mod_s3_keys([1, 2, 3])
+
+    assert result == {1: "10/1", 2: "20/2"}
+    helper.assert_awaited_once_with(pool, [2, 3])
+    assert cache.get(2) == "20/2"
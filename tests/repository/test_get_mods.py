@@ -5,7 +5,8 @@ import pytest
 from faker import Faker
 from pytest_mock import MockerFixture
 
-from modservice.repository.get_mods import get_mods
+from modservice.repository.get_mods import build_get_mods_query, get_mods
+from modservice.repository.model import ModFilter, ModRow
 
 
 @pytest.mark.asyncio
@@ -13,44 +14,47 @@ async def test_get_mods_maps_rows(mocker: MockerFixture, faker: Faker) -> None:
     created_at_first = faker.date_time(tzinfo=UTC)
     created_at_second = faker.date_time(tzinfo=UTC)
     rows = [
-        {
-            "id": faker.random_int(min=1, max=100000),
-            "author_id": faker.random_int(min=1, max=100000),
-            "title": faker.sentence(nb_words=3),
-            "description": faker.text(),
-            "version": 1,
-            "s3_key": faker.file_path(depth=2),
-            "status": "UPLOADED",
-            "created_at": created_at_first,
-        },
-        {
-            "id": faker.random_int(min=1, max=100000),
-            "author_id": faker.random_int(min=1, max=100000),
-            "title": faker.sentence(nb_words=4),
-            "description": faker.text(),
-            "version": 2,
-            "s3_key": faker.file_path(depth=2),
-            "status": "BANNED",
-            "created_at": created_at_second,
-        },
+        ModRow(
+            id=faker.random_int(min=1, max=100000),
+            author_id=faker.random_int(min=1, max=100000),
+            title=faker.sentence(nb_words=3),
+            description=faker.text(),
+            version=1,
+            s3_key=faker.file_path(depth=2),
+            status="UPLOADED",
+            created_at=created_at_first,
+        ),
+        ModRow(
+            id=faker.random_int(min=1, max=100000),
+            author_id=faker.random_int(min=1, max=100000),
+            title=faker.sentence(nb_words=4),
+            description=faker.text(),
+            version=2,
+            s3_key=faker.file_path(depth=2),
+            status="BANNED",
+            created_at=created_at_second,
+        ),
     ]
 
+    # asyncpg.Record итерируется по значениям в порядке колонок
+    records = [tuple(row) for row in rows]
+
     conn = mocker.Mock()
-    conn.fetch = mocker.AsyncMock(return_value=rows)
+    conn.fetch = mocker.AsyncMock(return_value=records)
     acquire_cm = mocker.AsyncMock()
     acquire_cm.__aenter__.return_value = conn
     acquire_cm.__aexit__.return_value = None
     pool = mocker.Mock()
     pool.acquire.return_value = acquire_cm
 
-    result = await get_mods(pool)
+    result = await get_mods(pool, 10)
 
-    assert len(result) == 2
-    assert result[0]["id"] == rows[0]["id"]
-    assert result[0]["status"] == rows[0]["status"]
-    assert result[0]["created_at"] == created_at_first
-    assert result[1]["id"] == rows[1]["id"]
-    assert result[1]["status"] == rows[1]["status"]
+    assert result == rows
+    assert result[0].id == rows[0].id
+    assert result[0].status == rows[0].status
+    assert result[0].created_at == created_at_first
+    assert result[1].id == rows[1].id
+    assert result[1].status == rows[1].status
 
     expected_sql = """
         SELECT
@@ -63,10 +67,81 @@ async def test_get_mods_maps_rows(mocker: MockerFixture, faker: Faker) -> None:
             status,
             created_at
         FROM mods
-        ORDER BY created_at DESC
+        ORDER BY created_at DESC, id DESC
+        LIMIT $1
         """
     actual_sql = conn.fetch.await_args.args[0]
     assert (
         textwrap.dedent(actual_sql).strip()
         == textwrap.dedent(expected_sql).strip()
     )
+    assert conn.fetch.await_args.args[1:] == (10,)
+
+
+@pytest.mark.asyncio
+async def test_get_mods_continues_after_keyset_cursor(
+    mocker: MockerFixture, faker: Faker
+) -> None:
+    conn = mocker.Mock()
+    conn.fetch = mocker.AsyncMock(return_value=[])
+    acquire_cm = mocker.AsyncMock()
+    acquire_cm.__aenter__.return_value = conn
+    acquire_cm.__aexit__.return_value = None
+    pool = mocker.Mock()
+    pool.acquire.return_value = acquire_cm
+
+    created_at = faker.date_time()
+    mod_id = faker.random_int(min=1, max=100000)
+
+    result = await get_mods(pool, 25, (created_at, mod_id))
+
+    assert result == []
+    actual_sql = textwrap.dedent(conn.fetch.await_args.args[0]).strip()
+    assert "WHERE (created_at, id) < ($1, $2)" in actual_sql
+    assert actual_sql.endswith("ORDER BY created_at DESC, id DESC\nLIMIT $3")
+    assert conn.fetch.await_args.args[1:] == (created_at, mod_id, 25)
+
+
+def test_build_get_mods_query_applies_filters(faker: Faker) -> None:
+    author_id = faker.random_int(min=1, max=100000)
+    created_after = faker.date_time()
+    created_before = faker.date_time()
+    cursor = (faker.date_time(), faker.random_int(min=1, max=100000))
+
+    query, args = build_get_mods_query(
+        50,
+        cursor,
+        ModFilter(
+            author_id=author_id,
+            statuses=("UPLOADED", "HIDDEN"),
+            created_after=created_after,
+            created_before=created_before,
+        ),
+    )
+
+    expected_tail = """
+        FROM mods
+        WHERE author_id = $1
+        AND status = ANY($2::mod_status[])
+        AND created_at >= $3
+        AND created_at < $4
+        AND (created_at, id) < ($5, $6)
+        ORDER BY created_at DESC, id DESC
+        LIMIT $7
+        """
+    assert query.strip().endswith(textwrap.dedent(expected_tail).strip())
+    assert args == [
+        author_id,
+        ["UPLOADED", "HIDDEN"],
+        created_after,
+        created_before,
+        *cursor,
+        50,
+    ]
+
+
+def test_build_get_mods_query_skips_empty_filter() -> None:
+    query, args = build_get_mods_query(10, None, ModFilter())
+
+    assert "WHERE" not in query
+    assert args == [10]
@@ -0,0 +1,56 @@
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+from faker import Faker
+from pytest_mock import MockerFixture
+
+from modservice.repository.get_pending_uploads import (
+    GET_PENDING_UPLOADS_QUERY,
+    get_pending_uploads,
+)
+from modservice.repository.model import PendingUpload
+
+
+def _pool(
+    mocker: MockerFixture, rows: list[tuple[object, ...]]
+) -> tuple[Mock, Mock]:
+    conn = mocker.Mock()
+    conn.fetch = mocker.AsyncMock(return_value=rows)
+    acquire_cm = mocker.AsyncMock()
+    acquire_cm.__aenter__.return_value = conn
+    acquire_cm.__aexit__.return_value = None
+    pool = mocker.Mock()
+    pool.acquire.return_value = acquire_cm
+    return pool, conn
+
+
+@pytest.mark.asyncio
+async def test_get_pending_uploads_starts_from_the_beginning(
+    mocker: MockerFixture, faker: Faker
+) -> None:
+    created_at = faker.date_time()
+    pool, conn = _pool(mocker, [(7, "1/7", created_at)])
+
+    result = await get_pending_uploads(pool, 50)
+
+    assert result == [PendingUpload(7, "1/7", created_at)]
+    conn.fetch.assert_awaited_once_with(
+        GET_PENDING_UPLOADS_QUERY, datetime.min, 0, 50
+    )
+    assert "status = 'UPLOADING'" in GET_PENDING_UPLOADS_QUERY
+    assert "ORDER BY created_at, id" in GET_PENDING_UPLOADS_QUERY
+
+
+@pytest.mark.asyncio
+async def test_get_pending_uploads_continues_after_cursor(
+    mocker: MockerFixture, faker: Faker
+) -> None:
+    created_at = faker.date_time()
+    pool, conn = _pool(mocker, [])
+
+    await get_pending_uploads(pool, 10, (created_at, 42))
+
+    conn.fetch.assert_awaited_once_with(
+        GET_PENDING_UPLOADS_QUERY, created_at, 42, 10
+    )
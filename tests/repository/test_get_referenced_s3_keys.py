@@ -0,0 +1,27 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from modservice.repository.get_referenced_s3_keys import (
+    GET_REFERENCED_S3_KEYS_QUERY,
+    get_referenced_s3_keys,
+)
+
+
+@pytest.mark.asyncio
+async def test_get_referenced_s3_keys_returns_used_keys(
+    mocker: MockerFixture,
+) -> None:
+    conn = mocker.Mock()
+    conn.fetch = mocker.AsyncMock(return_value=[{"s3_key": "1/2"}])
+    acquire_cm = mocker.AsyncMock()
+    acquire_cm.__aenter__.return_value = conn
+    acquire_cm.__aexit__.return_value = None
+    pool = mocker.Mock()
+    pool.acquire.return_value = acquire_cm
+
+    result = await get_referenced_s3_keys(pool, ["1/2", "1/3"])
+
+    assert result == {"1/2"}
+    conn.fetch.assert_awaited_once_with(
+        GET_REFERENCED_S3_KEYS_QUERY, ["1/2", "1/3"]
+    )
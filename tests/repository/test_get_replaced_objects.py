@@ -0,0 +1,29 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from modservice.repository.get_replaced_objects import (
+    GET_REPLACED_OBJECTS_QUERY,
+    get_replaced_objects,
+)
+from modservice.repository.model import ReplacedObject
+
+
+@pytest.mark.asyncio
+async def test_get_replaced_objects_pages_by_id(
+    mocker: MockerFixture,
+) -> None:
+    conn = mocker.Mock()
+    conn.fetch = mocker.AsyncMock(return_value=[(4, "1/4"), (6, "2/6")])
+    acquire_cm = mocker.AsyncMock()
+    acquire_cm.__aenter__.return_value = conn
+    acquire_cm.__aexit__.return_value = None
+    pool = mocker.Mock()
+    pool.acquire.return_value = acquire_cm
+
+    result = await get_replaced_objects(pool, 2, after_id=3, min_age=7200.0)
+
+    assert result == [ReplacedObject(4, "1/4"), ReplacedObject(6, "2/6")]
+    conn.fetch.assert_awaited_once_with(
+        GET_REPLACED_OBJECTS_QUERY, 3, 2, 7200.0
+    )
+    assert "replaced_at <" in GET_REPLACED_OBJECTS_QUERY
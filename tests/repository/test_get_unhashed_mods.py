@@ -0,0 +1,24 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from modservice.repository.get_unhashed_mods import (
+    GET_UNHASHED_MODS_QUERY,
+    get_unhashed_mods,
+)
+from modservice.repository.model import UnhashedMod
+
+
+@pytest.mark.asyncio
+async def test_get_unhashed_mods_pages_by_id(mocker: MockerFixture) -> None:
+    conn = mocker.Mock()
+    conn.fetch = mocker.AsyncMock(return_value=[(8, "1/8"), (9, "2/9")])
+    acquire_cm = mocker.AsyncMock()
+    acquire_cm.__aenter__.return_value = conn
+    acquire_cm.__aexit__.return_value = None
+    pool = mocker.Mock()
+    pool.acquire.return_value = acquire_cm
+
+    result = await get_unhashed_mods(pool, 2, after_id=7, min_age=7200.0)
+
+    assert result == [UnhashedMod(8, "1/8"), UnhashedMod(9, "2/9")]
+    conn.fetch.assert_awaited_once_with(GET_UNHASHED_MODS_QUERY, 7, 2, 7200.0)
@@ -0,0 +1,26 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from modservice.repository.get_uninspected_mods import (
+    GET_UNINSPECTED_MODS_QUERY,
+    get_uninspected_mods,
+)
+from modservice.repository.model import UninspectedMod
+
+
+@pytest.mark.asyncio
+async def test_get_uninspected_mods_pages_by_id(
+    mocker: MockerFixture,
+) -> None:
+    conn = mocker.Mock()
+    conn.fetch = mocker.AsyncMock(return_value=[(4, "1/4")])
+    acquire_cm = mocker.AsyncMock()
+    acquire_cm.__aenter__.return_value = conn
+    acquire_cm.__aexit__.return_value = None
+    pool = mocker.Mock()
+    pool.acquire.return_value = acquire_cm
+
+    result = await get_uninspected_mods(pool, 10, after_id=3)
+
+    assert result == [UninspectedMod(4, "1/4")]
+    conn.fetch.assert_awaited_once_with(GET_UNINSPECTED_MODS_QUERY, 3, 10)
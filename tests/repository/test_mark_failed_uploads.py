@@ -0,0 +1,29 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from modservice.repository.mark_failed_uploads import (
+    MARK_FAILED_UPLOADS_QUERY,
+    mark_failed_uploads,
+)
+
+
+@pytest.mark.asyncio
+async def test_mark_failed_uploads_only_touches_old_uploading_rows(
+    mocker: MockerFixture,
+) -> None:
+    conn = mocker.Mock()
+    conn.fetch = mocker.AsyncMock(return_value=[{"id": 4}])
+    acquire_cm = mocker.AsyncMock()
+    acquire_cm.__aenter__.return_value = conn
+    acquire_cm.__aexit__.return_value = None
+    pool = mocker.Mock()
+    pool.acquire.return_value = acquire_cm
+
+    result = await mark_failed_uploads(pool, [4, 5], 86400.0)
+
+    assert result == [4]
+    conn.fetch.assert_awaited_once_with(
+        MARK_FAILED_UPLOADS_QUERY, [4, 5], 86400.0
+    )
+    assert "status = 'UPLOADING'" in MARK_FAILED_UPLOADS_QUERY
+    assert "SET status = 'FAILED'" in MARK_FAILED_UPLOADS_QUERY
@@ -0,0 +1,45 @@
+import textwrap
+
+import pytest
+from pytest_mock import MockerFixture
+
+from modservice.repository.mark_uploaded import mark_uploaded
+
+
+@pytest.mark.asyncio
+async def test_mark_uploaded_updates_batch_with_unnest(
+    mocker: MockerFixture,
+) -> None:
+    conn = mocker.Mock()
+    conn.fetch = mocker.AsyncMock(return_value=[{"id": 1}, {"id": 3}])
+    acquire_cm = mocker.AsyncMock()
+    acquire_cm.__aenter__.return_value = conn
+    acquire_cm.__aexit__.return_value = None
+    pool = mocker.Mock()
+    pool.acquire.return_value = acquire_cm
+
+    result = await mark_uploaded(
+        pool, [1, 2, 3], ["7/1", "7/2", "7/3"], [10, 20, 30]
+    )
+
+    assert result == [1, 3]
+    expected_sql = """
+        UPDATE mods
+        SET status = 'UPLOADED', size = COALESCE(uploaded.size, mods.size)
+        FROM unnest($1::int[], $2::text[], $3::bigint[])
+            AS uploaded(id, s3_key, size)
+        WHERE mods.id = uploaded.id
+        AND mods.s3_key = uploaded.s3_key
+        AND mods.status = 'UPLOADING'
+        RETURNING mods.id
+        """
+    actual_sql = conn.fetch.await_args.args[0]
+    assert (
+        textwrap.dedent(actual_sql).strip()
+        == textwrap.dedent(expected_sql).strip()
+    )
+    assert conn.fetch.await_args.args[1:] == (
+        [1, 2, 3],
+        ["7/1", "7/2", "7/3"],
+        [10, 20, 30],
+    )
@@ -0,0 +1,62 @@
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from modservice.constants import MOD_STATUS_CHANNEL
+from modservice.repository.mod_status_listener import ModStatusListener
+
+
+def _make_pool(mocker: MockerFixture) -> tuple[Mock, Mock]:
+    conn = mocker.Mock()
+    conn.add_listener = mocker.AsyncMock()
+    conn.remove_listener = mocker.AsyncMock()
+    pool = mocker.Mock()
+    pool.acquire_connection = mocker.AsyncMock(return_value=conn)
+    pool.release = mocker.AsyncMock()
+    return pool, conn
+
+
+@pytest.mark.asyncio
+async def test_listener_forwards_notifications(mocker: MockerFixture) -> None:
+    pool, conn = _make_pool(mocker)
+    on_change = mocker.Mock()
+    listener = ModStatusListener(pool, on_change, mocker.Mock())
+
+    await listener.start()
+    callback = conn.add_listener.await_args.args[1]
+    callback(conn, 1, MOD_STATUS_CHANNEL, "42")
+    callback(conn, 1, MOD_STATUS_CHANNEL, "not-an-id")
+
+    conn.add_listener.assert_awaited_once_with(MOD_STATUS_CHANNEL, callback)
+    on_change.assert_called_once_with(42)
+
+    await listener.close()
+
+    conn.remove_listener.assert_awaited_once_with(MOD_STATUS_CHANNEL, callback)
+    pool.release.assert_awaited_once_with(conn)
+
+
+@pytest.mark.asyncio
+async def test_listener_resets_and_resubscribes_after_disconnect(
+    mocker: MockerFixture,
+) -> None:
+    pool, conn = _make_pool(mocker)
+    on_reset = mocker.Mock()
+    listener = ModStatusListener(pool, mocker.Mock(), on_reset, retry_delay=0)
+
+    await listener.start()
+    terminated = conn.add_termination_listener.call_args.args[0]
+    terminated(conn)
+
+    on_reset.assert_called_once_with()
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+    assert pool.acquire_connection.await_count == 2
+    pool.release.assert_awaited_once_with(conn)
+    # Второй сброс — за уведомления, пропущенные без подписки
+    assert on_reset.call_count == 2
+
+    await listener.close()
@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+from pytest_mock import MockerFixture
+
+from modservice.repository import pool as pool_module
+from modservice.repository.pool import (
+    MeteredPool,
+    PoolExhaustedError,
+    create_pool,
+    register_pool_metrics,
+)
+
+
+@pytest.mark.asyncio
+async def test_acquire_timeout_raises_pool_exhausted(
+    mocker: MockerFixture,
+) -> None:
+    async def never_acquires(*, timeout: float | None) -> None:
+        await asyncio.wait_for(asyncio.Event().wait(), timeout)
+
+    asyncpg_pool = mocker.Mock()
+    asyncpg_pool.acquire = mocker.Mock(side_effect=never_acquires)
+    pool = MeteredPool(asyncpg_pool, acquire_timeout=0.01)
+    timeouts = pool_module.POOL_ACQUIRE_TIMEOUTS.value()
+    waits = pool_module.POOL_ACQUIRE_WAIT.count()
+
+    with pytest.raises(PoolExhaustedError):
+        async with pool.acquire():
+            pass
+
+    assert pool_module.POOL_ACQUIRE_TIMEOUTS.value() == timeouts + 1
+    assert pool_module.POOL_ACQUIRE_WAIT.count() == waits + 1
+    asyncpg_pool.release.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_acquire_releases_connection_and_honours_timeout(
+    mocker: MockerFixture,
+) -> None:
+    asyncpg_pool = mocker.Mock()
+    asyncpg_pool.acquire = mocker.AsyncMock(return_value="conn")
+    asyncpg_pool.release = mocker.AsyncMock()
+    pool = MeteredPool(asyncpg_pool, acquire_timeout=5.0)
+
+    async with pool.acquire(1.0) as conn:
+        assert conn is asyncpg_pool.acquire.return_value
+    with pytest.raises(RuntimeError):
+        async with pool.acquire():
+            raise RuntimeError("query failed")
+
+    assert [call.kwargs for call in asyncpg_pool.acquire.await_args_list] == [
+        {"timeout": 1.0},
+        {"timeout": 5.0},
+    ]
+    assert asyncpg_pool.release.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_create_pool_disables_statement_cache_for_pgbouncer(
+    mocker: MockerFixture,
+) -> None:
+    asyncpg_create_pool = mocker.patch(
+        "asyncpg.create_pool", mocker.AsyncMock()
+    )
+
+    await create_pool("postgresql://db", statement_cache_size=100)
+    await create_pool(
+        "postgresql://db", statement_cache_size=100, prepared_statements=False
+    )
+
+    assert [
+        call.kwargs["statement_cache_size"]
+        for call in asyncpg_create_pool.await_args_list
+    ] == [100, 0]
+
+
+def test_register_pool_metrics_reads_live_pool_state(
+    mocker: MockerFixture,
+) -> None:
+    asyncpg_pool = mocker.Mock()
+    asyncpg_pool.get_size.return_value = 7
+    asyncpg_pool.get_idle_size.return_value = 2
+
+    register_pool_metrics(MeteredPool(asyncpg_pool))
+
+    assert pool_module.POOL_SIZE.value() == 7
+    assert pool_module.POOL_IDLE.value() == 2
+    assert pool_module.POOL_IN_USE.value() == 5
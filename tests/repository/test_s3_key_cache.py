@@ -0,0 +1,45 @@
+from modservice.repository.s3_key_cache import S3KeyCache
+
+
+def test_get_returns_cached_key() -> None:
+    cache = S3KeyCache()
+    cache.put(1, "10/1")
+
+    assert cache.get(1) == "10/1"
+    assert cache.get(2) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_put_evicts_least_recently_used() -> None:
+    cache = S3KeyCache(max_size=2)
+    cache.put(1, "10/1")
+    cache.put(2, "10/2")
+    cache.get(1)
+    cache.put(3, "10/3")
+
+    assert len(cache) == 2
+    assert cache.get(2) is None
+    assert cache.get(1) == "10/1"
+
+
+def test_put_with_stale_version_is_ignored() -> None:
+    cache = S3KeyCache()
+    version = cache.version
+    cache.invalidate(1)
+
+    cache.put(1, "10/1", version)
+
+    assert cache.get(1) is None
+
+
+def test_invalidate_and_clear_drop_entries() -> None:
+    cache = S3KeyCache()
+    cache.put(1, "10/1")
+    cache.put(2, "10/2")
+
+    cache.invalidate(1)
+    assert cache.get(1) is None
+    assert cache.get(2) == "10/2"
+
+    cache.clear()
+    assert len(cache) == 0
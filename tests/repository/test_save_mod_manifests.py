@@ -0,0 +1,41 @@
+import json
+
+import pytest
+from pytest_mock import MockerFixture
+
+from modservice.repository.model import ModManifest
+from modservice.repository.save_mod_manifests import (
+    SAVE_MOD_MANIFESTS_QUERY,
+    save_mod_manifests,
+)
+from modservice.zip_manifest import ZipEntry
+
+
+@pytest.mark.asyncio
+async def test_save_mod_manifests_inserts_batch_with_unnest(
+    mocker: MockerFixture,
+) -> None:
+    conn = mocker.Mock()
+    conn.execute = mocker.AsyncMock()
+    acquire_cm = mocker.AsyncMock()
+    acquire_cm.__aenter__.return_value = conn
+    acquire_cm.__aexit__.return_value = None
+    pool = mocker.Mock()
+    pool.acquire.return_value = acquire_cm
+
+    await save_mod_manifests(
+        pool,
+        [
+            ModManifest(1, 1, 10, 40, [ZipEntry("мод/a.txt", 10, 40)]),
+            ModManifest(2, 0, 0, 0, [], "End of central directory не найден"),
+        ],
+    )
+
+    query, *columns = conn.execute.await_args.args
+    assert query == SAVE_MOD_MANIFESTS_QUERY
+    assert columns[:4] == [[1, 2], [1, 0], [10, 0], [40, 0]]
+    assert [json.loads(entries) for entries in columns[4]] == [
+        [{"name": "мод/a.txt", "size": 40, "compressed_size": 10}],
+        [],
+    ]
+    assert columns[5] == [None, "End of central directory не найден"]
@@ -0,0 +1,50 @@
+from unittest.mock import Mock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from modservice.repository.set_content_hash import (
+    LOCK_CONTENT_HASH_QUERY,
+    SET_CONTENT_HASH_QUERY,
+    set_content_hash,
+)
+
+SHA256 = "ab" * 32
+
+
+def _pool(mocker: MockerFixture, row: dict[str, str] | None) -> Mock:
+    conn = mocker.Mock()
+    conn.execute = mocker.AsyncMock()
+    conn.fetchrow = mocker.AsyncMock(return_value=row)
+    transaction_cm = mocker.AsyncMock()
+    conn.transaction.return_value = transaction_cm
+    acquire_cm = mocker.AsyncMock()
+    acquire_cm.__aenter__.return_value = conn
+    acquire_cm.__aexit__.return_value = None
+    pool: Mock = mocker.Mock()
+    pool.acquire.return_value = acquire_cm
+    return pool
+
+
+@pytest.mark.asyncio
+async def test_set_content_hash_locks_hash_and_returns_s3_key(
+    mocker: MockerFixture,
+) -> None:
+    pool = _pool(mocker, {"s3_key": "1/5"})
+    conn = pool.acquire.return_value.__aenter__.return_value
+
+    result = await set_content_hash(pool, 9, SHA256)
+
+    assert result == "1/5"
+    conn.transaction.assert_called_once_with()
+    conn.execute.assert_awaited_once_with(LOCK_CONTENT_HASH_QUERY, SHA256)
+    conn.fetchrow.assert_awaited_once_with(SET_CONTENT_HASH_QUERY, 9, SHA256)
+
+
+@pytest.mark.asyncio
+async def test_set_content_hash_returns_none_when_already_hashed(
+    mocker: MockerFixture,
+) -> None:
+    pool = _pool(mocker, None)
+
+    assert await set_content_hash(pool, 9, SHA256) is None
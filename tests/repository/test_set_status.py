@@ -4,6 +4,7 @@ import pytest
 from faker import Faker
 from pytest_mock import MockerFixture
 
+from modservice.repository.pool import PoolExhaustedError
 from modservice.repository.set_status import set_status
 
 
@@ -50,3 +51,14 @@ async def test_set_status_returns_false_on_exception(
     )
 
     assert result is False
+
+
+@pytest.mark.asyncio
+async def test_set_status_propagates_pool_exhausted(
+    mocker: MockerFixture, faker: Faker
+) -> None:
+    pool = mocker.Mock()
+    pool.acquire.side_effect = PoolExhaustedError("busy")
+
+    with pytest.raises(PoolExhaustedError):
+        await set_status(pool, faker.random_int(min=1, max=100000), "BANNED")
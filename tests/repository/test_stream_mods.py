@@ -0,0 +1,59 @@
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import UTC
+from typing import Any
+
+import pytest
+from faker import Faker
+from pytest_mock import MockerFixture
+
+from modservice.repository.model import ModRow
+from modservice.repository.stream_mods import stream_mods
+
+
+async def _iterate(
+    rows: list[tuple[Any, ...]],
+) -> AsyncIterator[tuple[Any, ...]]:
+    for row in rows:
+        await asyncio.sleep(0)
+        yield row
+
+
+@pytest.mark.asyncio
+async def test_stream_mods_reads_through_cursor(
+    mocker: MockerFixture, faker: Faker
+) -> None:
+    rows = [
+        (
+            faker.random_int(min=1, max=100000),
+            faker.random_int(min=1, max=100000),
+            faker.sentence(nb_words=3),
+            faker.text(),
+            1,
+            faker.file_path(depth=2),
+            "UPLOADED",
+            faker.date_time(tzinfo=UTC),
+        )
+        for _ in range(3)
+    ]
+
+    conn = mocker.Mock()
+    conn.cursor.return_value = _iterate(rows)
+    transaction_cm = mocker.AsyncMock()
+    conn.transaction.return_value = transaction_cm
+    acquire_cm = mocker.AsyncMock()
+    acquire_cm.__aenter__.return_value = conn
+    acquire_cm.__aexit__.return_value = None
+    pool = mocker.Mock()
+    pool.acquire.return_value = acquire_cm
+
+    result = [mod async for mod in stream_mods(pool, prefetch=2)]
+
+    assert result == [ModRow(*row) for row in rows]
+    assert all(isinstance(mod, ModRow) for mod in result)
+    conn.transaction.assert_called_once_with(readonly=True)
+    transaction_cm.__aenter__.assert_awaited_once()
+    transaction_cm.__aexit__.assert_awaited_once()
+    sql = conn.cursor.call_args.args[0]
+    assert "ORDER BY created_at DESC, id DESC" in sql
+    assert conn.cursor.call_args.kwargs == {"prefetch": 2}
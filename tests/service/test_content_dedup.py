@@ -0,0 +1,182 @@
+import asyncio
+from concurrent.futures import Executor
+from unittest.mock import Mock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from modservice.repository.model import ReplacedObject, UnhashedMod
+from modservice.repository.repository import ModRepository
+from modservice.service.content_dedup import (
+    DEDUP_ARCHIVES,
+    DEDUP_DELETES,
+    ContentDeduplicator,
+)
+from modservice.service.s3_service import S3Service
+from modservice.service.service import ModService
+
+
+def _hashes(
+    mocker: MockerFixture, digests: dict[str, str], s3_service: Mock
+) -> dict[str, int]:
+    in_flight = {"now": 0, "max": 0}
+
+    async def hash_mod_object(s3_key: str, executor: Executor) -> str:
+        assert executor is not None
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0)
+        in_flight["now"] -= 1
+        if s3_key not in digests:
+            raise OSError("read timeout")
+        return digests[s3_key]
+
+    s3_service.hash_mod_object = mocker.AsyncMock(side_effect=hash_mod_object)
+    return in_flight
+
+
+def _service(mocker: MockerFixture) -> Mock:
+    service: Mock = mocker.Mock(spec=ModService)
+    service.get_replaced_objects = mocker.AsyncMock(return_value=[])
+    return service
+
+
+@pytest.mark.asyncio
+async def test_run_once_merges_duplicates_and_deletes_copies(
+    mocker: MockerFixture,
+) -> None:
+    mods = [UnhashedMod(i, f"1/{i}") for i in range(1, 6)]
+    service = _service(mocker)
+    service.get_unhashed_mods = mocker.AsyncMock(
+        side_effect=[mods[:3], mods[3:]]
+    )
+    service.get_replaced_objects = mocker.AsyncMock(
+        return_value=[ReplacedObject(4, "1/4")]
+    )
+    # Мод 4 — копия мода 1; у мода 5 архив не читается
+    digests = {"1/1": "a", "1/2": "b", "1/3": "c", "1/4": "a"}
+    service.record_content_hash = mocker.AsyncMock(
+        side_effect=lambda _mod_id, s3_key, sha256: (
+            "1/1" if sha256 == "a" else s3_key
+        )
+    )
+    s3_service = mocker.Mock(spec=S3Service)
+    in_flight = _hashes(mocker, digests, s3_service)
+    s3_service.delete_mod_object = mocker.AsyncMock(return_value=True)
+    errors_before = DEDUP_ARCHIVES.value(("error",))
+    deduplicator = ContentDeduplicator(
+        service, s3_service, batch_size=3, workers=2, min_age=7200.0
+    )
+
+    try:
+        merged = await deduplicator.run_once()
+    finally:
+        await deduplicator.close()
+
+    assert merged == 1
+    assert [
+        call.args for call in service.get_unhashed_mods.await_args_list
+    ] == [(3, 0, 7200.0), (3, 3, 7200.0)]
+    assert [
+        call.args for call in service.record_content_hash.await_args_list
+    ] == [(1, "1/1", "a"), (2, "1/2", "b"), (3, "1/3", "c"), (4, "1/4", "a")]
+    s3_service.delete_mod_object.assert_awaited_once_with("1/4")
+    service.clear_replaced_objects.assert_awaited_once_with(
+        [ReplacedObject(4, "1/4")]
+    )
+    assert in_flight["max"] <= 2
+    assert DEDUP_ARCHIVES.value(("error",)) - errors_before == 1
+
+
+@pytest.mark.asyncio
+async def test_already_hashed_mod_is_left_alone(
+    mocker: MockerFixture,
+) -> None:
+    service = _service(mocker)
+    service.get_unhashed_mods = mocker.AsyncMock(
+        return_value=[UnhashedMod(7, "1/7")]
+    )
+    service.record_content_hash = mocker.AsyncMock(return_value=None)
+    s3_service = mocker.Mock(spec=S3Service)
+    _hashes(mocker, {"1/7": "f"}, s3_service)
+    deduplicator = ContentDeduplicator(service, s3_service, batch_size=10)
+
+    try:
+        assert await deduplicator.run_once() == 0
+    finally:
+        await deduplicator.close()
+
+    s3_service.delete_mod_object.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_first_run_is_capped_and_resumes_from_cursor(
+    mocker: MockerFixture,
+) -> None:
+    mods = [UnhashedMod(i, f"1/{i}") for i in range(1, 6)]
+    service = _service(mocker)
+    service.get_unhashed_mods = mocker.AsyncMock(
+        side_effect=[mods[:2], mods[2:3], mods[3:5], []]
+    )
+    service.record_content_hash = mocker.AsyncMock(return_value=None)
+    s3_service = mocker.Mock(spec=S3Service)
+    _hashes(mocker, {mod.s3_key: str(mod.id) for mod in mods}, s3_service)
+    deduplicator = ContentDeduplicator(
+        service, s3_service, batch_size=2, min_age=0, max_archives=3
+    )
+
+    try:
+        await deduplicator.run_once()
+        await deduplicator.run_once()
+    finally:
+        await deduplicator.close()
+
+    assert [
+        call.args for call in service.get_unhashed_mods.await_args_list
+    ] == [(2, 0, 0), (1, 2, 0), (2, 3, 0), (1, 5, 0)]
+    assert s3_service.hash_mod_object.await_count == 5
+
+
+@pytest.mark.asyncio
+async def test_failed_delete_is_kept_for_retry(
+    mocker: MockerFixture,
+) -> None:
+    service = _service(mocker)
+    service.get_unhashed_mods = mocker.AsyncMock(return_value=[])
+    replaced = [ReplacedObject(4, "1/4"), ReplacedObject(6, "1/6")]
+    service.get_replaced_objects = mocker.AsyncMock(return_value=replaced)
+    s3_service = mocker.Mock(spec=S3Service)
+    s3_service.delete_mod_object = mocker.AsyncMock(side_effect=[False, True])
+    failed_before = DEDUP_DELETES.value(("failed",))
+    deduplicator = ContentDeduplicator(
+        service, s3_service, batch_size=10, delete_delay=3600.0
+    )
+
+    try:
+        assert await deduplicator.run_once() == 0
+    finally:
+        await deduplicator.close()
+
+    # Только копии, ссылки на скачивание которых уже истекли
+    service.get_replaced_objects.assert_awaited_once_with(10, 0, 3600.0)
+    service.clear_replaced_objects.assert_awaited_once_with(
+        [ReplacedObject(6, "1/6")]
+    )
+    assert DEDUP_DELETES.value(("failed",)) == failed_before + 1
+
+
+@pytest.mark.asyncio
+async def test_record_content_hash_invalidates_repointed_mod(
+    mocker: MockerFixture,
+) -> None:
+    repo = mocker.Mock(spec=ModRepository)
+    repo.set_content_hash = mocker.AsyncMock(side_effect=["1/1", "1/3"])
+    service = ModService(repo, mocker.Mock(spec=S3Service))
+    version = service.catalogue_version
+
+    assert await service.record_content_hash(2, "1/2", "a") == "1/1"
+    repo.invalidate_s3_key.assert_called_once_with(2)
+    assert service.catalogue_version == version + 1
+
+    assert await service.record_content_hash(3, "1/3", "b") == "1/3"
+    repo.invalidate_s3_key.assert_called_once_with(2)
@@ -5,6 +5,7 @@ from faker import Faker
 from pytest_mock import MockerFixture
 
 from modservice.repository.repository import ModRepository
+from modservice.service.create_mod import create_mod
 from modservice.service.s3_service import S3Service
 from modservice.service.service import ModService
 
@@ -29,9 +30,36 @@ async def test_service_create_mod_invokes_helper(
     author_id = faker.random_int(min=1, max=100000)
     description = faker.text()
 
+    before = service.catalogue_version
     result = await service.create_mod(title, author_id, description)
 
     assert result == expected
+    assert service.catalogue_version > before
     helper.assert_awaited_once_with(
         repo, s3_service, title, author_id, description
     )
+
+
+@pytest.mark.asyncio
+async def test_create_mod_uses_single_repository_call(
+    mocker: MockerFixture, faker: Faker
+) -> None:
+    repo = mocker.Mock(spec=ModRepository)
+    s3_service = mocker.Mock(spec=S3Service)
+    mod_id = faker.random_int(min=1, max=100000)
+    s3_key = f"{faker.random_int(min=1, max=100000)}/{mod_id}"
+    upload_url = faker.uri()
+    repo.create_mod = AsyncMock(return_value=(mod_id, s3_key))
+    s3_service.generate_mod_upload_url = AsyncMock(return_value=upload_url)
+
+    title = faker.sentence(nb_words=3)
+    author_id = faker.random_int(min=1, max=100000)
+    description = faker.text()
+
+    result = await create_mod(repo, s3_service, title, author_id, description)
+
+    assert result == (mod_id, s3_key, upload_url)
+    repo.create_mod.assert_awaited_once_with(title, author_id, description)
+    s3_service.generate_mod_upload_url.assert_awaited_once_with(
+        s3_key_prefix=s3_key
+    )
@@ -0,0 +1,83 @@
+import pytest
+from faker import Faker
+
+from modservice.service.download_link_cache import DownloadLinkCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> _Clock:
+    return _Clock()
+
+
+def test_reuses_link_while_more_than_half_lifetime_left(
+    clock: _Clock, faker: Faker
+) -> None:
+    cache = DownloadLinkCache(clock=clock)
+    url = faker.uri()
+    cache.put(1, 3600, url)
+
+    clock.now += 1799
+    assert cache.get(1, 3600) == url
+
+    clock.now += 1
+    assert cache.get(1, 3600) is None
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_entries_are_keyed_by_expiration(clock: _Clock, faker: Faker) -> None:
+    cache = DownloadLinkCache(clock=clock)
+    cache.put(1, 3600, faker.uri())
+
+    assert cache.get(1, 600) is None
+    assert cache.misses == 1
+
+
+def test_evicts_least_recently_used(clock: _Clock, faker: Faker) -> None:
+    cache = DownloadLinkCache(max_size=2, clock=clock)
+    cache.put(1, 3600, faker.uri())
+    cache.put(2, 3600, faker.uri())
+    assert cache.get(1, 3600) is not None
+
+    cache.put(3, 3600, faker.uri())
+
+    assert len(cache) == 2
+    assert cache.get(2, 3600) is None
+    assert cache.get(1, 3600) is not None
+    assert cache.get(3, 3600) is not None
+
+
+def test_invalidate_drops_every_expiration_of_mod(
+    clock: _Clock, faker: Faker
+) -> None:
+    cache = DownloadLinkCache(clock=clock)
+    cache.put(1, 3600, faker.uri())
+    cache.put(1, 600, faker.uri())
+    other = faker.uri()
+    cache.put(2, 3600, other)
+
+    cache.invalidate(1)
+
+    assert cache.get(1, 3600) is None
+    assert cache.get(1, 600) is None
+    assert cache.get(2, 3600) == other
+
+
+def test_put_with_stale_version_is_ignored(
+    clock: _Clock, faker: Faker
+) -> None:
+    cache = DownloadLinkCache(clock=clock)
+    version = cache.version
+
+    cache.invalidate(1)
+    cache.put(1, 3600, faker.uri(), version)
+
+    assert len(cache) == 0
@@ -0,0 +1,72 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from pytest_mock import MockerFixture
+
+from modservice.repository.repository import ModRepository
+from modservice.service.finalize_uploads import (
+    UPLOAD_FINALIZE_LAG,
+    UPLOADS_FINALIZED,
+    UploadedObject,
+    finalize_uploads,
+)
+from modservice.service.s3_service import S3Service
+from modservice.service.service import ModService
+
+
+@pytest.mark.asyncio
+async def test_finalize_uploads_dedupes_and_records_lag(
+    mocker: MockerFixture,
+) -> None:
+    repo = mocker.Mock(spec=ModRepository)
+    repo.mark_uploaded = mocker.AsyncMock(return_value=[1])
+    uploaded_at = datetime.now(UTC) - timedelta(seconds=30)
+
+    result = await finalize_uploads(
+        repo,
+        [
+            UploadedObject(1, "7/1", 10, uploaded_at),
+            UploadedObject(2, "7/2", 20, uploaded_at),
+            UploadedObject(1, "7/1", 11, uploaded_at),
+            UploadedObject(1, "8/1", 12, uploaded_at),
+        ],
+        "test_dedupe",
+    )
+
+    assert result == [1]
+    # Чужой префикс с тем же id уходит в UPDATE отдельно: его отсечёт
+    # условие на s3_key
+    repo.mark_uploaded.assert_awaited_once_with(
+        [1, 2, 1], ["7/1", "7/2", "8/1"], [11, 20, 12]
+    )
+    assert UPLOADS_FINALIZED.value(("test_dedupe",)) == 1
+    assert UPLOAD_FINALIZE_LAG.count(("test_dedupe",)) == 1
+    assert UPLOAD_FINALIZE_LAG.sum(("test_dedupe",)) >= 30
+
+
+@pytest.mark.asyncio
+async def test_finalize_uploads_skips_empty_batch(
+    mocker: MockerFixture,
+) -> None:
+    repo = mocker.Mock(spec=ModRepository)
+    repo.mark_uploaded = mocker.AsyncMock()
+
+    assert await finalize_uploads(repo, [], "test_empty") == []
+    repo.mark_uploaded.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_service_finalize_uploads_invalidates_caches(
+    mocker: MockerFixture,
+) -> None:
+    repo = mocker.Mock(spec=ModRepository)
+    repo.mark_uploaded = mocker.AsyncMock(return_value=[5])
+    service = ModService(repo, mocker.Mock(spec=S3Service))
+    before = service.catalogue_version
+
+    await service.finalize_uploads(
+        [UploadedObject(5, "7/5", 1, datetime.now(UTC))], "test_service"
+    )
+
+    repo.invalidate_s3_key.assert_called_once_with(5)
+    assert service.catalogue_version > before
@@ -5,6 +5,7 @@ from faker import Faker
 from pytest_mock import MockerFixture
 
 from modservice.repository.repository import ModRepository
+from modservice.s3_client import S3Client
 from modservice.service.s3_service import S3Service
 from modservice.service.service import ModService
 
@@ -29,3 +30,26 @@ async def test_service_generate_mod_download_url(
     s3_service.generate_mod_download_url.assert_awaited_once_with(
         prefix, expiration
     )
+
+
+@pytest.mark.asyncio
+async def test_s3_service_generate_mod_download_urls(
+    mocker: MockerFixture, faker: Faker
+) -> None:
+    s3_client = mocker.Mock(spec=S3Client)
+    download_urls = [faker.uri(), faker.uri()]
+    s3_client.generate_presigned_get_urls = AsyncMock(
+        return_value=download_urls
+    )
+    s3_service = S3Service(s3_client)
+
+    prefixes = [faker.file_path(depth=1), faker.file_path(depth=1)]
+    expiration = faker.random_int(min=100, max=10000)
+
+    result = await s3_service.generate_mod_download_urls(prefixes, expiration)
+
+    assert result == download_urls
+    s3_client.generate_presigned_get_urls.assert_awaited_once_with(
+        s3_keys=[f"{prefix}/mod.zip" for prefix in prefixes],
+        expiration=expiration,
+    )
@@ -1,10 +1,13 @@
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
 from faker import Faker
 from pytest_mock import MockerFixture
 
+from modservice.constants import S3_KEY_NOT_FOUND
 from modservice.repository.repository import ModRepository
+from modservice.service.download_link_cache import DownloadLinkCache
 from modservice.service.s3_service import S3Service
 from modservice.service.service import ModService
 
@@ -33,3 +36,75 @@ async def test_service_get_mod_download_link(
     s3_service.generate_mod_download_url.assert_awaited_once_with(
         s3_key, expiration
     )
+
+
+@pytest.mark.asyncio
+async def test_service_get_mod_download_link_uses_cache(
+    mocker: MockerFixture, faker: Faker
+) -> None:
+    repo = mocker.Mock(spec=ModRepository)
+    s3_service = mocker.Mock(spec=S3Service)
+    repo.get_mod_s3_key = AsyncMock(return_value=faker.file_path(depth=2))
+    download_url = faker.uri()
+    s3_service.generate_mod_download_url = AsyncMock(return_value=download_url)
+    cache = DownloadLinkCache()
+
+    service = ModService(repo, s3_service, cache)
+    mod_id = faker.random_int(min=1, max=100000)
+
+    first = await service.get_mod_download_link(mod_id)
+    second = await service.get_mod_download_link(mod_id)
+
+    assert first == second == download_url
+    repo.get_mod_s3_key.assert_awaited_once_with(mod_id)
+    s3_service.generate_mod_download_url.assert_awaited_once()
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_service_get_mod_download_link_skips_cache_for_missing_mod(
+    mocker: MockerFixture, faker: Faker
+) -> None:
+    repo = mocker.Mock(spec=ModRepository)
+    s3_service = mocker.Mock(spec=S3Service)
+    repo.get_mod_s3_key = AsyncMock(return_value=S3_KEY_NOT_FOUND)
+    s3_service.generate_mod_download_url = AsyncMock(return_value=faker.uri())
+    cache = DownloadLinkCache()
+
+    service = ModService(repo, s3_service, cache)
+
+    await service.get_mod_download_link(faker.random_int(min=1, max=100000))
+
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_service_get_mod_download_link_coalesces_concurrent_calls(
+    mocker: MockerFixture, faker: Faker
+) -> None:
+    repo = mocker.Mock(spec=ModRepository)
+    s3_service = mocker.Mock(spec=S3Service)
+    release = asyncio.Event()
+    s3_key = faker.file_path(depth=2)
+
+    async def get_mod_s3_key(mod_id: int) -> str:  # noqa: ARG001
+        await release.wait()
+        return s3_key
+
+    repo.get_mod_s3_key = AsyncMock(side_effect=get_mod_s3_key)
+    download_url = faker.uri()
+    s3_service.generate_mod_download_url = AsyncMock(return_value=download_url)
+
+    service = ModService(repo, s3_service)
+    mod_id = faker.random_int(min=1, max=100000)
+
+    waiters = [
+        asyncio.create_task(service.get_mod_download_link(mod_id))
+        for _ in range(5)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*waiters) == [download_url] * 5
+    repo.get_mod_s3_key.assert_awaited_once_with(mod_id)
+    s3_service.generate_mod_download_url.assert_awaited_once()
@@ -0,0 +1,85 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from faker import Faker
+from pytest_mock import MockerFixture
+
+from modservice.constants import MAX_DOWNLOAD_LINKS_BATCH
+from modservice.repository.repository import ModRepository
+from modservice.service.download_link_cache import DownloadLinkCache
+from modservice.service.s3_service import S3Service
+from modservice.service.service import ModService
+
+
+@pytest.mark.asyncio
+async def test_service_get_mod_download_links_signs_found_mods(
+    mocker: MockerFixture, faker: Faker
+) -> None:
+    repo = mocker.Mock(spec=ModRepository)
+    s3_service = mocker.Mock(spec=S3Service)
+    repo.get_mod_s3_keys = AsyncMock(return_value={1: "10/1", 3: "30/3"})
+    s3_service.generate_mod_download_urls = AsyncMock(
+        return_value=["https://one", "https://three"]
+    )
+    service = ModService(repo, s3_service)
+
+    expiration = faker.random_int(min=100, max=10000)
+    result = await service.get_mod_download_links([1, 2, 3, 1], expiration)
+
+    assert result == {1: "https://one", 3: "https://three"}
+    repo.get_mod_s3_keys.assert_awaited_once_with([1, 2, 3])
+    s3_service.generate_mod_download_urls.assert_awaited_once_with(
+        ["10/1", "30/3"], expiration
+    )
+
+
+@pytest.mark.asyncio
+async def test_service_get_mod_download_links_queries_only_cache_misses(
+    mocker: MockerFixture,
+) -> None:
+    repo = mocker.Mock(spec=ModRepository)
+    s3_service = mocker.Mock(spec=S3Service)
+    repo.get_mod_s3_keys = AsyncMock(return_value={2: "20/2"})
+    s3_service.generate_mod_download_urls = AsyncMock(
+        return_value=["https://two"]
+    )
+    cache = DownloadLinkCache()
+    cache.put(1, 3600, "https://one")
+    service = ModService(repo, s3_service, cache)
+
+    result = await service.get_mod_download_links([1, 2])
+
+    assert result == {1: "https://one", 2: "https://two"}
+    repo.get_mod_s3_keys.assert_awaited_once_with([2])
+    assert cache.get(2, 3600) == "https://two"
+
+
+@pytest.mark.asyncio
+async def test_service_get_mod_download_links_all_cached(
+    mocker: MockerFixture,
+) -> None:
+    repo = mocker.Mock(spec=ModRepository)
+    s3_service = mocker.Mock(spec=S3Service)
+    repo.get_mod_s3_keys = AsyncMock()
+    cache = DownloadLinkCache()
+    cache.put(1, 3600, "https://one")
+    service = ModService(repo, s3_service, cache)
+
+    result = await service.get_mod_download_links([1])
+
+    assert result == {1: "https://one"}
+    repo.get_mod_s3_keys.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_service_get_mod_download_links_rejects_large_batch(
+    mocker: MockerFixture,
+) -> None:
+    repo = mocker.Mock(spec=ModRepository)
+    s3_service = mocker.Mock(spec=S3Service)
+    service = ModService(repo, s3_service)
+
+    with pytest.raises(ValueError):
+        await service.get_mod_download_links(
+            list(range(MAX_DOWNLOAD_LINKS_BATCH + 1))
+        )
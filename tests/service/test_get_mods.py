@@ -1,27 +1,189 @@
+import asyncio
+from datetime import datetime, timedelta
 from unittest.mock import AsyncMock
 
 import pytest
 from faker import Faker
 from pytest_mock import MockerFixture
 
+from modservice.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from modservice.repository.model import ModFilter, ModRow
 from modservice.repository.repository import ModRepository
+from modservice.service.get_mods import get_mods
+from modservice.service.page_token import decode_page_token, encode_page_token
 from modservice.service.s3_service import S3Service
 from modservice.service.service import ModService
 
 
+def _rows(faker: Faker, count: int) -> list[ModRow]:
+    newest = faker.date_time()
+    return [
+        ModRow(
+            id=count - i,
+            author_id=faker.random_int(min=1, max=100000),
+            title=faker.word(),
+            description=faker.text(),
+            version=1,
+            s3_key=None,
+            status="UPLOADED",
+            created_at=newest - timedelta(minutes=i),
+        )
+        for i in range(count)
+    ]
+
+
 @pytest.mark.asyncio
 async def test_service_get_mods_returns_helper_result(
     mocker: MockerFixture, faker: Faker
 ) -> None:
     repo = mocker.Mock(spec=ModRepository)
     s3_service = mocker.Mock(spec=S3Service)
-    mods = [{"id": faker.random_int(), "title": faker.word()}]
-    helper = AsyncMock(return_value=mods)
+    mods = _rows(faker, 1)
+    helper = AsyncMock(return_value=(mods, ""))
     mocker.patch("modservice.service.service._get_mods", helper)
 
     service = ModService(repo, s3_service)
 
-    result = await service.get_mods()
+    result = await service.get_mods(20, "token")
+
+    assert result == (mods, "")
+    helper.assert_awaited_once_with(repo, 20, "token", None)
+
+
+@pytest.mark.asyncio
+async def test_service_get_mods_coalesces_identical_requests(
+    mocker: MockerFixture, faker: Faker
+) -> None:
+    repo = mocker.Mock(spec=ModRepository)
+    s3_service = mocker.Mock(spec=S3Service)
+    mods = _rows(faker, 1)
+    release = asyncio.Event()
+
+    async def helper(
+        *args: object,
+    ) -> tuple[list[ModRow], str]:  # noqa: ARG001
+        await release.wait()
+        return mods, ""
+
+    helper_mock = AsyncMock(side_effect=helper)
+    mocker.patch("modservice.service.service._get_mods", helper_mock)
+    service = ModService(repo, s3_service)
+    mod_filter = ModFilter(author_id=1)
+
+    same = [
+        asyncio.create_task(service.get_mods(20, "", mod_filter))
+        for _ in range(3)
+    ]
+    other = asyncio.create_task(service.get_mods(20, "", ModFilter()))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*same) == [(mods, "")] * 3
+    assert await other == (mods, "")
+    assert helper_mock.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_mods_returns_next_page_token(
+    mocker: MockerFixture, faker: Faker
+) -> None:
+    repo = mocker.Mock(spec=ModRepository)
+    rows = _rows(faker, 4)
+    repo.get_mods = AsyncMock(return_value=rows)
+
+    mods, next_page_token = await get_mods(repo, 3)
+
+    assert mods == rows[:3]
+    assert decode_page_token(next_page_token) == (
+        rows[2].created_at,
+        rows[2].id,
+    )
+    repo.get_mods.assert_awaited_once_with(4, None, None)
+
+
+@pytest.mark.asyncio
+async def test_get_mods_last_page_has_no_token(
+    mocker: MockerFixture, faker: Faker
+) -> None:
+    repo = mocker.Mock(spec=ModRepository)
+    rows = _rows(faker, 2)
+    repo.get_mods = AsyncMock(return_value=rows)
+    created_at = datetime(2025, 10, 9, 9, 30, 17, 123456)
+    token = encode_page_token(created_at, 42)
+
+    mods, next_page_token = await get_mods(repo, 3, token)
+
+    assert mods == rows
+    assert next_page_token == ""
+    repo.get_mods.assert_awaited_once_with(4, (created_at, 42), None)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("page_size", "expected_limit"),
+    [
+        (0, DEFAULT_PAGE_SIZE + 1),
+        (MAX_PAGE_SIZE * 10, MAX_PAGE_SIZE + 1),
+    ],
+)
+async def test_get_mods_clamps_page_size(
+    mocker: MockerFixture, page_size: int, expected_limit: int
+) -> None:
+    repo = mocker.Mock(spec=ModRepository)
+    repo.get_mods = AsyncMock(return_value=[])
+
+    await get_mods(repo, page_size)
+
+    repo.get_mods.assert_awaited_once_with(expected_limit, None, None)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("page_size", "page_token"),
+    [(-1, ""), (10, "not a token"), (10, "bm90LWEtZGF0ZXwx")],
+)
+async def test_get_mods_rejects_bad_arguments(
+    mocker: MockerFixture, page_size: int, page_token: str
+) -> None:
+    repo = mocker.Mock(spec=ModRepository)
+    repo.get_mods = AsyncMock()
+
+    with pytest.raises(ValueError):
+        await get_mods(repo, page_size, page_token)
+
+    repo.get_mods.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_mods_passes_filter_to_repository(
+    mocker: MockerFixture, faker: Faker
+) -> None:
+    repo = mocker.Mock(spec=ModRepository)
+    repo.get_mods = AsyncMock(return_value=[])
+    mod_filter = ModFilter(
+        author_id=faker.random_int(min=1, max=100000),
+        statuses=("UPLOADED",),
+    )
+
+    await get_mods(repo, 10, "", mod_filter)
+
+    repo.get_mods.assert_awaited_once_with(11, None, mod_filter)
+
+
+@pytest.mark.asyncio
+async def test_get_mods_rejects_empty_created_range(
+    mocker: MockerFixture, faker: Faker
+) -> None:
+    repo = mocker.Mock(spec=ModRepository)
+    repo.get_mods = AsyncMock()
+    moment = faker.date_time()
+
+    with pytest.raises(ValueError):
+        await get_mods(
+            repo,
+            10,
+            "",
+            ModFilter(created_after=moment, created_before=moment),
+        )
 
-    assert result == mods
-    helper.assert_awaited_once_with(repo)
+    repo.get_mods.assert_not_called()
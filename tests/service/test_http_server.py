@@ -0,0 +1,112 @@
+import asyncio
+
+import pytest
+
+from modservice.http_server import HttpServer
+
+
+async def _request(port: int, raw: bytes) -> bytes:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(raw)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    await writer.wait_closed()
+    return response
+
+
+@pytest.mark.asyncio
+async def test_http_server_routes_requests() -> None:
+    received: list[bytes] = []
+
+    async def echo(body: bytes) -> tuple[int, str, bytes]:
+        await asyncio.sleep(0)
+        received.append(body)
+        return 202, "text/plain", b"ok"
+
+    server = HttpServer("127.0.0.1", 0)
+    server.add_route("GET", "/metrics", lambda _: (200, "text/plain", b"m 1"))
+    server.add_route("POST", "/events", echo)
+    await server.start()
+    try:
+        metrics = await _request(
+            server.port, b"GET /metrics HTTP/1.1\r\nHost: x\r\n\r\n"
+        )
+        posted = await _request(
+            server.port,
+            b"POST /events HTTP/1.1\r\nContent-Length: 4\r\n\r\nping",
+        )
+        missing = await _request(server.port, b"GET /nope HTTP/1.1\r\n\r\n")
+        wrong_method = await _request(
+            server.port, b"POST /metrics HTTP/1.1\r\n\r\n"
+        )
+    finally:
+        await server.close()
+
+    assert metrics.startswith(b"HTTP/1.1 200 OK\r\n")
+    assert metrics.endswith(b"\r\n\r\nm 1")
+    assert posted.startswith(b"HTTP/1.1 202 Accepted\r\n")
+    assert received == [b"ping"]
+    assert missing.startswith(b"HTTP/1.1 404 ")
+    assert wrong_method.startswith(b"HTTP/1.1 405 ")
+
+
+@pytest.mark.asyncio
+async def test_http_server_checks_bearer_token() -> None:
+    server = HttpServer("127.0.0.1", 0)
+    server.add_route(
+        "POST", "/events", lambda _: (200, "text/plain", b"ok"), "secret"
+    )
+    await server.start()
+    try:
+        anonymous = await _request(
+            server.port, b"POST /events HTTP/1.1\r\n\r\n"
+        )
+        wrong = await _request(
+            server.port,
+            b"POST /events HTTP/1.1\r\nAuthorization: Bearer nope\r\n\r\n",
+        )
+        authorized = await _request(
+            server.port,
+            b"POST /events HTTP/1.1\r\nAuthorization: Bearer secret\r\n\r\n",
+        )
+    finally:
+        await server.close()
+
+    assert anonymous.startswith(b"HTTP/1.1 401 Unauthorized\r\n")
+    assert wrong.startswith(b"HTTP/1.1 401 ")
+    assert authorized.startswith(b"HTTP/1.1 200 ")
+
+
+@pytest.mark.asyncio
+async def test_slow_handler_is_not_cut_by_read_timeout(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("modservice.http_server.READ_TIMEOUT", 0.01)
+    monkeypatch.setattr("modservice.http_server.HANDLER_TIMEOUT", 0.05)
+
+    async def slow(_: bytes) -> tuple[int, str, bytes]:
+        await asyncio.sleep(0.02)
+        return 200, "text/plain", b"ok"
+
+    async def stuck(_: bytes) -> tuple[int, str, bytes]:
+        await asyncio.Event().wait()
+        return 200, "text/plain", b"never"
+
+    server = HttpServer("127.0.0.1", 0)
+    server.add_route("POST", "/slow", slow)
+    server.add_route("POST", "/stuck", stuck)
+    await server.start()
+    try:
+        slow_response = await _request(
+            server.port, b"POST /slow HTTP/1.1\r\n\r\n"
+        )
+        stuck_response = await _request(
+            server.port, b"POST /stuck HTTP/1.1\r\n\r\n"
+        )
+    finally:
+        await server.close()
+
+    assert slow_response.startswith(b"HTTP/1.1 200 ")
+    # 503, а не 400: нотификатор S3 повторит доставку
+    assert stuck_response.startswith(b"HTTP/1.1 503 Service Unavailable\r\n")
@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+from prometheus_client import CollectorRegistry
+
+from modservice.metrics import (
+    CONTENT_TYPE,
+    LAYER_DURATION,
+    Counter,
+    Gauge,
+    Histogram,
+    metrics_response,
+    timed,
+)
+
+
+def test_counter_and_gauge_render_in_text_format() -> None:
+    registry = CollectorRegistry()
+    requests = Counter(
+        "requests_total", "Requests", ("method",), registry=registry
+    )
+    in_flight = Gauge("in_flight", "In flight", registry=registry)
+
+    requests.inc(labels=("GetMods",))
+    requests.inc(2, labels=("GetMods",))
+    in_flight.set_function(lambda: 3)
+
+    _, _, body = metrics_response(registry=registry)
+    assert 'requests_total{method="GetMods"} 3.0' in body.decode()
+    assert "in_flight 3.0" in body.decode()
+    assert requests.value(("GetMods",)) == 3
+    assert in_flight.value() == 3
+
+
+def test_histogram_buckets_are_cumulative() -> None:
+    registry = CollectorRegistry()
+    latency = Histogram(
+        "latency_seconds", "Latency", buckets=(0.1, 1.0), registry=registry
+    )
+
+    for value in (0.05, 0.5, 0.7, 5.0):
+        latency.observe(value)
+
+    _, _, body = metrics_response(registry=registry)
+    lines = [
+        line for line in body.decode().splitlines() if not line.startswith("#")
+    ]
+    assert lines == [
+        'latency_seconds_bucket{le="0.1"} 1.0',
+        'latency_seconds_bucket{le="1.0"} 3.0',
+        'latency_seconds_bucket{le="+Inf"} 4.0',
+        "latency_seconds_count 4.0",
+        "latency_seconds_sum 6.25",
+    ]
+    assert latency.count() == 4
+    assert latency.sum() == 6.25
+
+
+def test_duplicate_metric_and_wrong_labels_are_rejected() -> None:
+    registry = CollectorRegistry()
+    counter = Counter("c", "C", ("a",), registry=registry)
+    gauge = Gauge("g", "G", registry=registry)
+
+    with pytest.raises(ValueError):
+        Counter("c", "C", registry=registry)
+    with pytest.raises(ValueError):
+        counter.inc()
+    with pytest.raises(ValueError):
+        gauge.set(1, labels=("x",))
+
+
+def test_metrics_response_escapes_labels() -> None:
+    registry = CollectorRegistry()
+    Counter("c", "C", ("a",), registry=registry).inc(labels=('x"y',))
+
+    status, content_type, body = metrics_response(registry=registry)
+
+    assert (status, content_type) == (200, CONTENT_TYPE)
+    assert b'c_total{a="x\\"y"} 1.0' in body
+
+
+@pytest.mark.asyncio
+async def test_timed_records_layer_duration_even_on_error() -> None:
+    @timed("test_layer")
+    async def lookup(value: int) -> int:
+        await asyncio.sleep(0)
+        if value < 0:
+            raise ValueError("negative")
+        return value
+
+    assert await lookup(1) == 1
+    with pytest.raises(ValueError, match="negative"):
+        await lookup(-1)
+
+    assert LAYER_DURATION.count(("test_layer", "lookup")) == 2
+    assert lookup.__name__ == "lookup"
@@ -0,0 +1,113 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from modservice.repository.model import ModManifest, UninspectedMod
+from modservice.service.mod_inspector import INSPECTIONS, ModInspector
+from modservice.service.s3_service import S3Service
+from modservice.service.service import ModService
+from modservice.zip_manifest import ZipEntry, ZipFormatError, ZipManifest
+
+ENTRIES = [ZipEntry("mod/", 0, 0), ZipEntry("mod/a.txt", 10, 1000)]
+
+
+@pytest.mark.asyncio
+async def test_run_once_saves_manifests_per_batch(
+    mocker: MockerFixture,
+) -> None:
+    mods = [UninspectedMod(i, f"1/{i}") for i in range(1, 4)]
+    service = mocker.Mock(spec=ModService)
+    service.get_uninspected_mods = mocker.AsyncMock(
+        side_effect=[mods[:2], mods[2:]]
+    )
+    service.save_mod_manifests = mocker.AsyncMock()
+
+    def read(s3_key: str) -> ZipManifest:
+        if s3_key == "1/2":
+            raise ZipFormatError("End of central directory не найден")
+        return ZipManifest(ENTRIES)
+
+    s3_service = mocker.Mock(spec=S3Service)
+    s3_service.read_mod_manifest = mocker.AsyncMock(side_effect=read)
+    inspector = ModInspector(service, s3_service, batch_size=2)
+
+    assert await inspector.run_once() == 3
+
+    assert [
+        call.args for call in service.get_uninspected_mods.await_args_list
+    ] == [(2, 0), (2, 2)]
+    assert [
+        call.args for call in service.save_mod_manifests.await_args_list
+    ] == [
+        (
+            [
+                ModManifest(1, 1, 10, 1000, ENTRIES),
+                ModManifest(
+                    2, 0, 0, 0, [], "End of central directory не найден"
+                ),
+            ],
+        ),
+        ([ModManifest(3, 1, 10, 1000, ENTRIES)],),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_rejected_manifest_gets_error_row_instead_of_failing_pass(
+    mocker: MockerFixture,
+) -> None:
+    mods = [UninspectedMod(i, f"1/{i}") for i in range(1, 3)]
+    service = mocker.Mock(spec=ModService)
+    service.get_uninspected_mods = mocker.AsyncMock(return_value=mods)
+    rejected = ValueError("unsupported Unicode escape sequence")
+    # Пачка, мод 1, мод 2, строка с ошибкой для мода 2
+    service.save_mod_manifests = mocker.AsyncMock(
+        side_effect=[rejected, None, rejected, None]
+    )
+    s3_service = mocker.Mock(spec=S3Service)
+    s3_service.read_mod_manifest = mocker.AsyncMock(
+        return_value=ZipManifest(ENTRIES)
+    )
+    failed_before = INSPECTIONS.value(("save_failed",))
+    inspector = ModInspector(service, s3_service, batch_size=10)
+
+    assert await inspector.run_once() == 2
+
+    assert [
+        call.args[0] for call in service.save_mod_manifests.await_args_list
+    ][1:] == [
+        [ModManifest(1, 1, 10, 1000, ENTRIES)],
+        [ModManifest(2, 1, 10, 1000, ENTRIES)],
+        [
+            ModManifest(
+                2,
+                0,
+                0,
+                0,
+                [],
+                "Оглавление не сохранено: unsupported Unicode escape "
+                "sequence",
+            )
+        ],
+    ]
+    assert INSPECTIONS.value(("save_failed",)) == failed_before + 1
+
+
+@pytest.mark.asyncio
+async def test_s3_errors_are_retried_on_next_pass(
+    mocker: MockerFixture,
+) -> None:
+    service = mocker.Mock(spec=ModService)
+    service.get_uninspected_mods = mocker.AsyncMock(
+        return_value=[UninspectedMod(5, "1/5")]
+    )
+    service.save_mod_manifests = mocker.AsyncMock()
+    s3_service = mocker.Mock(spec=S3Service)
+    s3_service.read_mod_manifest = mocker.AsyncMock(
+        side_effect=OSError("connection reset")
+    )
+    errors_before = INSPECTIONS.value(("error",))
+    inspector = ModInspector(service, s3_service, batch_size=10)
+
+    assert await inspector.run_once() == 0
+
+    service.save_mod_manifests.assert_not_awaited()
+    assert INSPECTIONS.value(("error",)) - errors_before == 1
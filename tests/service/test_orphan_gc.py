@@ -0,0 +1,240 @@
+import asyncio
+import json
+import time
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from modservice.s3_client import S3Client, S3ObjectPage
+from modservice.service.orphan_gc import GC_OBJECTS, OrphanCollector
+from modservice.service.s3_service import S3Service
+from modservice.service.service import ModService
+
+OLD = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _page(keys: list[str], next_token: str | None) -> S3ObjectPage:
+    return S3ObjectPage(
+        objects=[
+            {"key": key, "size": 1, "last_modified": OLD, "etag": '"e"'}
+            for key in keys
+        ],
+        next_token=next_token,
+    )
+
+
+def _s3(
+    mocker: MockerFixture, pages: dict[str | None, S3ObjectPage]
+) -> tuple[S3Service, Mock]:
+    """S3Service поверх фейкового клиента: листинг по токенам из pages"""
+    s3_client = mocker.Mock(spec=S3Client)
+
+    async def iter_objects(
+        prefix: str = "",
+        page_size: int = 1000,
+        continuation_token: str | None = None,
+    ) -> AsyncIterator[S3ObjectPage]:
+        while True:
+            await asyncio.sleep(0)
+            page = pages[continuation_token]
+            yield page
+            if page.next_token is None:
+                return
+            continuation_token = page.next_token
+
+    s3_client.iter_objects = mocker.Mock(side_effect=iter_objects)
+    s3_client.delete_objects = mocker.AsyncMock(return_value=[])
+    return S3Service(s3_client), s3_client
+
+
+def _service(mocker: MockerFixture, existing: set[int]) -> Mock:
+    service: Mock = mocker.Mock(spec=ModService)
+    service.get_existing_mod_ids = mocker.AsyncMock(
+        side_effect=lambda ids: existing & set(ids)
+    )
+    service.get_referenced_s3_keys = mocker.AsyncMock(return_value=set())
+    return service
+
+
+PAGES = {
+    None: _page(["1/1/mod.zip", "1/2/mod.zip", "1/2/icon.png"], "page-2"),
+    "page-2": _page(["2/3/mod.zip", "2/4/mod.zip"], None),
+}
+
+
+@pytest.mark.asyncio
+async def test_dry_run_reports_orphans_without_deleting(
+    mocker: MockerFixture,
+) -> None:
+    s3_service, s3_client = _s3(mocker, PAGES)
+    service = _service(mocker, existing={1, 3})
+    collector = OrphanCollector(service, s3_service, dry_run=True)
+    dry_run_before = GC_OBJECTS.value(("dry_run",))
+
+    stats = await collector.run_once()
+
+    assert (stats.scanned, stats.orphaned, stats.deleted) == (5, 3, 0)
+    s3_client.delete_objects.assert_not_awaited()
+    assert GC_OBJECTS.value(("dry_run",)) - dry_run_before == 3
+
+
+@pytest.mark.asyncio
+async def test_orphans_are_deleted_one_batch_per_page(
+    mocker: MockerFixture,
+) -> None:
+    s3_service, s3_client = _s3(mocker, PAGES)
+    service = _service(mocker, existing={1, 3})
+    s3_client.delete_objects.side_effect = [["1/2/icon.png"], []]
+    collector = OrphanCollector(
+        service, s3_service, dry_run=False, rate_limit=0
+    )
+
+    stats = await collector.run_once()
+
+    assert [
+        call.args for call in service.get_existing_mod_ids.await_args_list
+    ] == [([1, 2],), ([3, 4],)]
+    assert [
+        call.args for call in s3_client.delete_objects.await_args_list
+    ] == [(["1/2/mod.zip", "1/2/icon.png"],), (["2/4/mod.zip"],)]
+    assert (stats.deleted, stats.failed) == (2, 1)
+
+
+@pytest.mark.asyncio
+async def test_objects_shared_by_duplicates_are_kept(
+    mocker: MockerFixture,
+) -> None:
+    s3_service, s3_client = _s3(mocker, PAGES)
+    service = _service(mocker, existing={1, 3})
+    # Мод 2 удалён, но его mod.zip — общий объект дубликата
+    service.get_referenced_s3_keys.return_value = {"1/2"}
+    collector = OrphanCollector(
+        service, s3_service, dry_run=False, rate_limit=0
+    )
+
+    stats = await collector.run_once()
+
+    assert service.get_referenced_s3_keys.await_args_list[0].args == (["1/2"],)
+    assert [
+        call.args for call in s3_client.delete_objects.await_args_list
+    ] == [(["2/4/mod.zip"],)]
+    assert stats.orphaned == 1
+
+
+@pytest.mark.asyncio
+async def test_young_and_foreign_keys_are_never_deleted(
+    mocker: MockerFixture,
+) -> None:
+    # id больше INT уронил бы id = ANY($1::int[]) для всей страницы
+    page = _page(
+        ["1/20260101_120000_file.zip", "readme.txt", "1/99999999999/a.zip"],
+        None,
+    )
+    page.objects.append(
+        {
+            "key": "1/5/mod.zip",
+            "size": 1,
+            "last_modified": datetime.now(UTC) - timedelta(minutes=5),
+            "etag": '"e"',
+        }
+    )
+    s3_service, s3_client = _s3(mocker, {None: page})
+    service = _service(mocker, existing=set())
+    collector = OrphanCollector(
+        service, s3_service, dry_run=False, min_age=3600
+    )
+
+    stats = await collector.run_once()
+
+    assert (stats.scanned, stats.skipped, stats.orphaned) == (4, 4, 0)
+    service.get_existing_mod_ids.assert_not_awaited()
+    s3_client.delete_objects.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_interrupted_pass_resumes_from_checkpoint(
+    mocker: MockerFixture, tmp_path: Path
+) -> None:
+    checkpoint = tmp_path / "gc.json"
+    s3_service, s3_client = _s3(mocker, PAGES)
+    service = _service(mocker, existing={1, 3})
+    service.get_existing_mod_ids.side_effect = [
+        {1},
+        OSError("db down"),
+    ]
+    collector = OrphanCollector(
+        service,
+        s3_service,
+        dry_run=False,
+        rate_limit=0,
+        checkpoint_path=str(checkpoint),
+    )
+
+    with pytest.raises(OSError):
+        await collector.run_once()
+    assert json.loads(checkpoint.read_text()) == {
+        "next_token": "page-2",
+        "dry_run": False,
+    }
+
+    service.get_existing_mod_ids.side_effect = None
+    service.get_existing_mod_ids.return_value = {3}
+    stats = await collector.run_once()
+
+    assert stats.scanned == 2
+    assert s3_client.iter_objects.call_args.args == ("", 1000, "page-2")
+    assert not checkpoint.exists()
+
+
+@pytest.mark.asyncio
+async def test_dry_run_checkpoint_is_ignored_by_deleting_pass(
+    mocker: MockerFixture, tmp_path: Path
+) -> None:
+    checkpoint = tmp_path / "gc.json"
+    checkpoint.write_text(
+        json.dumps({"next_token": "page-2", "dry_run": True})
+    )
+    s3_service, s3_client = _s3(mocker, PAGES)
+    collector = OrphanCollector(
+        _service(mocker, existing=set()),
+        s3_service,
+        dry_run=False,
+        rate_limit=0,
+        checkpoint_path=str(checkpoint),
+    )
+
+    stats = await collector.run_once()
+
+    assert stats.scanned == 5
+    assert s3_client.iter_objects.call_args.args == ("", 1000, None)
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_spaces_delete_batches(
+    mocker: MockerFixture,
+) -> None:
+    s3_service, s3_client = _s3(mocker, PAGES)
+    collector = OrphanCollector(
+        _service(mocker, existing=set()),
+        s3_service,
+        dry_run=False,
+        rate_limit=100.0,
+    )
+    delete_times: list[float] = []
+
+    async def delete(keys: list[str]) -> list[Any]:
+        delete_times.append(time.monotonic())
+        await asyncio.sleep(0)
+        return []
+
+    s3_client.delete_objects.side_effect = delete
+
+    await collector.run_once()
+
+    # Первая пачка из 3 ключей при 100/с занимает 30 мс
+    assert delete_times[1] - delete_times[0] >= 0.025
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import AbstractAsyncContextManager
 from pathlib import Path
 from types import TracebackType
@@ -9,9 +11,10 @@ from typing import Any
 from unittest.mock import AsyncMock, Mock
 
 import pytest
+from botocore.exceptions import ClientError
 from pytest_mock import MockerFixture
 
-from modservice.s3_client import S3Client
+from modservice.s3_client import S3Client, S3ObjectPage
 
 
 class _ValueContext[T](AbstractAsyncContextManager[T]):
@@ -37,8 +40,9 @@ def _async_cm[T](value: T) -> AbstractAsyncContextManager[T]:
 
 
 class _FakeBodyStream:
-    def __init__(self, data: bytes):
+    def __init__(self, data: bytes, chunk_size: int | None = None):
         self._data = data
+        self._chunk_size = chunk_size
 
     async def __aenter__(self) -> _FakeBodyStream:
         await asyncio.sleep(0)
@@ -53,9 +57,17 @@ class _FakeBodyStream:
         await asyncio.sleep(0)
         return False
 
-    async def read(self) -> bytes:
+    async def read(self, amt: int = -1) -> bytes:
         await asyncio.sleep(0)
-        return self._data
+        size = len(self._data) if amt < 0 else amt
+        if self._chunk_size is not None:
+            size = min(size, self._chunk_size)
+        chunk, self._data = self._data[:size], self._data[size:]
+        return chunk
+
+
+def _etag(data: bytes) -> str:
+    return f'"{hashlib.md5(data, usedforsecurity=False).hexdigest()}"'
 
 
 class _FakePaginator:
@@ -123,6 +135,45 @@ def test_get_client_uses_session_client(
     assert context_manager is session.client.return_value
 
 
+@pytest.mark.asyncio
+async def test_started_client_is_reused_across_calls(
+    s3_client_and_session: tuple[S3Client, Mock],
+    mocker: MockerFixture,
+) -> None:
+    s3_client, session = s3_client_and_session
+    storage_client: Mock = mocker.Mock()
+    storage_client.get_paginator.side_effect = lambda _: _FakePaginator([])
+    session.client.return_value = _async_cm(storage_client)
+
+    await s3_client.start()
+    await s3_client.start()
+    await s3_client.list_objects("mods/a")
+    await s3_client.list_objects("mods/b")
+
+    session.client.assert_called_once()
+    assert storage_client.get_paginator.call_count == 2
+
+    await s3_client.close()
+
+
+@pytest.mark.asyncio
+async def test_close_falls_back_to_per_call_client(
+    s3_client_and_session: tuple[S3Client, Mock],
+    mocker: MockerFixture,
+) -> None:
+    s3_client, session = s3_client_and_session
+    storage_client: Mock = mocker.Mock()
+    storage_client.get_paginator.side_effect = lambda _: _FakePaginator([])
+    session.client.side_effect = lambda *_, **__: _async_cm(storage_client)
+
+    async with s3_client:
+        await s3_client.list_objects("mods/a")
+
+    await s3_client.list_objects("mods/b")
+
+    assert session.client.call_count == 2
+
+
 @pytest.mark.asyncio
 async def test_upload_file_puts_object(
     tmp_path: Path,
@@ -172,6 +223,98 @@ async def test_upload_file_returns_false_on_error(
     assert result is False
 
 
+def _multipart_client(mocker: MockerFixture) -> tuple[Mock, dict[str, int]]:
+    storage_client: Mock = mocker.Mock()
+    storage_client.create_multipart_upload = AsyncMock(
+        return_value={"UploadId": "upload-1"}
+    )
+    storage_client.complete_multipart_upload = AsyncMock()
+    storage_client.abort_multipart_upload = AsyncMock()
+    in_flight = {"now": 0, "max": 0}
+
+    async def upload_part(**kwargs: Any) -> dict[str, str]:
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        # Первая часть отвечает последней: порядок Parts не зависит от
+        # порядка завершения
+        await asyncio.sleep(0.01 if kwargs["PartNumber"] == 1 else 0)
+        in_flight["now"] -= 1
+        return {"ETag": f'"etag-{kwargs["PartNumber"]}"'}
+
+    storage_client.upload_part = AsyncMock(side_effect=upload_part)
+    return storage_client, in_flight
+
+
+@pytest.mark.asyncio
+async def test_upload_file_uses_multipart_for_large_files(
+    tmp_path: Path,
+    s3_client_and_session: tuple[S3Client, Mock],
+    mocker: MockerFixture,
+) -> None:
+    s3_client, _ = s3_client_and_session
+    mocker.patch("modservice.s3_client.S3_MIN_PART_SIZE", 4)
+    file_path = tmp_path / "payload.bin"
+    file_path.write_bytes(b"0123456789abcdefXY")
+
+    storage_client, in_flight = _multipart_client(mocker)
+    mocker.patch.object(
+        s3_client, "get_client", return_value=_async_cm(storage_client)
+    )
+
+    result = await s3_client.upload_file(
+        str(file_path), "mods/payload.bin", part_size=4, concurrency=2
+    )
+
+    assert result is True
+    bodies = [
+        call.kwargs["Body"]
+        for call in storage_client.upload_part.await_args_list
+    ]
+    assert bodies == [b"0123", b"4567", b"89ab", b"cdef", b"XY"]
+    assert in_flight["max"] == 2
+    storage_client.complete_multipart_upload.assert_awaited_once_with(
+        Bucket="bucket",
+        Key="mods/payload.bin",
+        UploadId="upload-1",
+        MultipartUpload={
+            "Parts": [
+                {"ETag": f'"etag-{n}"', "PartNumber": n} for n in range(1, 6)
+            ]
+        },
+    )
+    storage_client.abort_multipart_upload.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_upload_file_aborts_multipart_upload_on_failure(
+    tmp_path: Path,
+    s3_client_and_session: tuple[S3Client, Mock],
+    mocker: MockerFixture,
+) -> None:
+    s3_client, _ = s3_client_and_session
+    mocker.patch("modservice.s3_client.S3_MIN_PART_SIZE", 4)
+    file_path = tmp_path / "payload.bin"
+    file_path.write_bytes(b"0123456789abcdef")
+
+    storage_client, _ = _multipart_client(mocker)
+    storage_client.upload_part = AsyncMock(
+        side_effect=[{"ETag": '"etag-1"'}, RuntimeError("boom")]
+    )
+    mocker.patch.object(
+        s3_client, "get_client", return_value=_async_cm(storage_client)
+    )
+
+    result = await s3_client.upload_file(
+        str(file_path), "mods/payload.bin", part_size=4, concurrency=1
+    )
+
+    assert result is False
+    storage_client.complete_multipart_upload.assert_not_called()
+    storage_client.abort_multipart_upload.assert_awaited_once_with(
+        Bucket="bucket", Key="mods/payload.bin", UploadId="upload-1"
+    )
+
+
 @pytest.mark.asyncio
 async def test_download_file_writes_to_disk(
     tmp_path: Path,
@@ -183,7 +326,10 @@ async def test_download_file_writes_to_disk(
 
     storage_client: Mock = mocker.Mock()
     storage_client.get_object = AsyncMock(
-        return_value={"Body": _FakeBodyStream(b"downloaded")}
+        return_value={
+            "Body": _FakeBodyStream(b"downloaded", chunk_size=3),
+            "ETag": _etag(b"downloaded"),
+        }
     )
     mocker.patch.object(
         s3_client, "get_client", return_value=_async_cm(storage_client)
@@ -200,12 +346,132 @@ async def test_download_file_writes_to_disk(
     )
 
 
+@pytest.mark.asyncio
+async def test_download_file_rejects_etag_mismatch(
+    tmp_path: Path,
+    s3_client_and_session: tuple[S3Client, Mock],
+    mocker: MockerFixture,
+) -> None:
+    s3_client, _ = s3_client_and_session
+    destination = tmp_path / "file.bin"
+
+    storage_client: Mock = mocker.Mock()
+    storage_client.get_object = AsyncMock(
+        return_value={
+            "Body": _FakeBodyStream(b"truncated"),
+            "ETag": _etag(b"downloaded"),
+        }
+    )
+    mocker.patch.object(
+        s3_client, "get_client", return_value=_async_cm(storage_client)
+    )
+
+    result = await s3_client.download_file("mods/file.bin", str(destination))
+
+    assert result is False
+    assert list(tmp_path.iterdir()) == []
+
+
+def _ranged_client(
+    mocker: MockerFixture, data: bytes, etag: str, part_size: int
+) -> Mock:
+    storage_client: Mock = mocker.Mock()
+
+    async def head_object(**kwargs: Any) -> dict[str, Any]:
+        await asyncio.sleep(0)
+        if "PartNumber" in kwargs:
+            return {"ContentLength": part_size}
+        return {"ContentLength": len(data), "ETag": etag}
+
+    async def get_object(**kwargs: Any) -> dict[str, Any]:
+        start, end = map(
+            int, kwargs["Range"].removeprefix("bytes=").split("-")
+        )
+        # Поздние диапазоны приходят раньше ранних
+        await asyncio.sleep(0.001 * (len(data) - start))
+        return {"Body": _FakeBodyStream(data[start : end + 1], chunk_size=2)}
+
+    storage_client.head_object = AsyncMock(side_effect=head_object)
+    storage_client.get_object = AsyncMock(side_effect=get_object)
+    return storage_client
+
+
+@pytest.mark.asyncio
+async def test_download_file_parallel_writes_ranges_at_offsets(
+    tmp_path: Path,
+    s3_client_and_session: tuple[S3Client, Mock],
+    mocker: MockerFixture,
+) -> None:
+    s3_client, _ = s3_client_and_session
+    destination = tmp_path / "file.bin"
+    data = b"0123456789abcdefXY"
+    # ETag multipart объекта: MD5 от MD5 частей и число частей
+    digests = b"".join(
+        hashlib.md5(data[i : i + 4], usedforsecurity=False).digest()
+        for i in range(0, len(data), 4)
+    )
+    etag = f'"{hashlib.md5(digests, usedforsecurity=False).hexdigest()}-5"'
+
+    storage_client = _ranged_client(mocker, data, etag, part_size=4)
+    mocker.patch.object(
+        s3_client, "get_client", return_value=_async_cm(storage_client)
+    )
+
+    result = await s3_client.download_file(
+        "mods/file.bin",
+        str(destination),
+        parallel=True,
+        part_size=4,
+        concurrency=3,
+    )
+
+    assert result is True
+    assert destination.read_bytes() == data
+    ranges = [
+        call.kwargs["Range"]
+        for call in storage_client.get_object.await_args_list
+    ]
+    assert sorted(ranges) == sorted(
+        ["bytes=0-3", "bytes=4-7", "bytes=8-11", "bytes=12-15", "bytes=16-17"]
+    )
+    assert all(
+        call.kwargs["IfMatch"] == etag
+        for call in storage_client.get_object.await_args_list
+    )
+
+
+@pytest.mark.asyncio
+async def test_download_file_parallel_rejects_corrupted_object(
+    tmp_path: Path,
+    s3_client_and_session: tuple[S3Client, Mock],
+    mocker: MockerFixture,
+) -> None:
+    s3_client, _ = s3_client_and_session
+    destination = tmp_path / "file.bin"
+    data = b"0123456789"
+
+    storage_client = _ranged_client(
+        mocker, data, _etag(b"something else"), part_size=4
+    )
+    mocker.patch.object(
+        s3_client, "get_client", return_value=_async_cm(storage_client)
+    )
+
+    result = await s3_client.download_file(
+        "mods/file.bin", str(destination), parallel=True, part_size=4
+    )
+
+    assert result is False
+    assert list(tmp_path.iterdir()) == []
+
+
 @pytest.mark.asyncio
 async def test_generate_presigned_put_url_uses_client(
     s3_client_and_session: tuple[S3Client, Mock],
     mocker: MockerFixture,
 ) -> None:
     s3_client, _ = s3_client_and_session
+    s3_client.presigner = None
     storage_client: Mock = mocker.Mock()
     storage_client.generate_presigned_url = AsyncMock(
         return_value="https://put-url"
@@ -238,6 +504,7 @@ async def test_generate_presigned_get_url_uses_client(
     mocker: MockerFixture,
 ) -> None:
     s3_client, _ = s3_client_and_session
+    s3_client.presigner = None
     storage_client: Mock = mocker.Mock()
     storage_client.generate_presigned_url = AsyncMock(
         return_value="https://get-url"
@@ -262,6 +529,70 @@ async def test_generate_presigned_get_url_uses_client(
     )
 
 
+@pytest.mark.asyncio
+async def test_presigned_urls_are_signed_locally_by_default(
+    s3_client_and_session: tuple[S3Client, Mock],
+) -> None:
+    s3_client, session = s3_client_and_session
+
+    get_url = await s3_client.generate_presigned_get_url("/mods/file.bin")
+    put_url = await s3_client.generate_presigned_put_url(
+        "mods/file.bin", content_type="application/zip"
+    )
+
+    session.client.assert_not_called()
+    assert get_url.startswith("https://bucket.example.com/mods/file.bin?")
+    assert "X-Amz-SignedHeaders=host&" in get_url
+    assert "X-Amz-SignedHeaders=content-type%3Bhost&" in put_url
+
+
+@pytest.mark.asyncio
+async def test_generate_presigned_get_urls_signs_batch_with_one_timestamp(
+    s3_client_and_session: tuple[S3Client, Mock],
+    mocker: MockerFixture,
+) -> None:
+    s3_client, session = s3_client_and_session
+    assert s3_client.presigner is not None
+    presign = mocker.spy(s3_client.presigner, "presign")
+
+    urls = await s3_client.generate_presigned_get_urls(
+        ["/mods/a.zip", "mods/b.zip"], expiration=600
+    )
+
+    session.client.assert_not_called()
+    assert [url.split("?")[0] for url in urls] == [
+        "https://bucket.example.com/mods/a.zip",
+        "https://bucket.example.com/mods/b.zip",
+    ]
+    first_now = presign.call_args_list[0].kwargs["now"]
+    assert presign.call_args_list[1].kwargs["now"] is first_now
+
+
+@pytest.mark.asyncio
+async def test_generate_presigned_get_urls_uses_one_client(
+    s3_client_and_session: tuple[S3Client, Mock],
+    mocker: MockerFixture,
+) -> None:
+    s3_client, _ = s3_client_and_session
+    s3_client.presigner = None
+    storage_client: Mock = mocker.Mock()
+    storage_client.generate_presigned_url = AsyncMock(
+        side_effect=["https://a", "https://b"]
+    )
+    get_client = mocker.patch.object(
+        s3_client, "get_client", return_value=_async_cm(storage_client)
+    )
+
+    urls = await s3_client.generate_presigned_get_urls(["a", "/b"])
+
+    assert urls == ["https://a", "https://b"]
+    get_client.assert_called_once()
+    assert [
+        call.kwargs["Params"]["Key"]
+        for call in storage_client.generate_presigned_url.await_args_list
+    ] == ["a", "b"]
+
+
 @pytest.mark.asyncio
 async def test_list_objects_collects_all_pages(
     s3_client_and_session: tuple[S3Client, Mock],
@@ -308,6 +639,205 @@ async def test_list_objects_collects_all_pages(
     assert paginator.called_with == [{"Bucket": "bucket", "Prefix": "mods/"}]
 
 
+@pytest.mark.asyncio
+async def test_head_object_returns_metadata_or_none(
+    s3_client_and_session: tuple[S3Client, Mock],
+    mocker: MockerFixture,
+) -> None:
+    s3_client, _ = s3_client_and_session
+    storage_client: Mock = mocker.Mock()
+    storage_client.head_object = AsyncMock(
+        side_effect=[
+            {"ContentLength": 5, "LastModified": "ts", "ETag": '"t"'},
+            ClientError({"Error": {"Code": "404"}}, "HeadObject"),
+            ClientError({"Error": {"Code": "403"}}, "HeadObject"),
+        ]
+    )
+    mocker.patch.object(
+        s3_client, "get_client", return_value=_async_cm(storage_client)
+    )
+
+    assert await s3_client.head_object("1/2/mod.zip") == {
+        "key": "1/2/mod.zip",
+        "size": 5,
+        "last_modified": "ts",
+        "etag": '"t"',
+    }
+    assert await s3_client.head_object("1/3/mod.zip") is None
+    with pytest.raises(ClientError):
+        await s3_client.head_object("1/4/mod.zip")
+
+
+@pytest.mark.asyncio
+async def test_object_sha256_hashes_stream_in_executor(
+    s3_client_and_session: tuple[S3Client, Mock],
+    mocker: MockerFixture,
+) -> None:
+    s3_client, _ = s3_client_and_session
+    data = b"mod archive bytes" * 1000
+    storage_client: Mock = mocker.Mock()
+    storage_client.get_object = AsyncMock(
+        return_value={"Body": _FakeBodyStream(data, chunk_size=4096)}
+    )
+    mocker.patch.object(
+        s3_client, "get_client", return_value=_async_cm(storage_client)
+    )
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        digest = await s3_client.object_sha256("1/2/mod.zip", executor)
+
+    assert digest == hashlib.sha256(data).hexdigest()
+    storage_client.get_object.assert_awaited_once_with(
+        Bucket="bucket", Key="1/2/mod.zip"
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_object_range_returns_bytes_and_object_size(
+    s3_client_and_session: tuple[S3Client, Mock],
+    mocker: MockerFixture,
+) -> None:
+    s3_client, _ = s3_client_and_session
+    storage_client: Mock = mocker.Mock()
+    storage_client.get_object = AsyncMock(
+        side_effect=[
+            {
+                "Body": _FakeBodyStream(b"tail"),
+                "ContentRange": "bytes 96-99/100",
+            },
+            {
+                "Body": _FakeBodyStream(b"middle"),
+                "ContentRange": "bytes 10-15/100",
+            },
+        ]
+    )
+    mocker.patch.object(
+        s3_client, "get_client", return_value=_async_cm(storage_client)
+    )
+
+    assert await s3_client.get_object_range("1/2/mod.zip", -4) == (
+        b"tail",
+        100,
+    )
+    assert await s3_client.get_object_range("1/2/mod.zip", 10, 15) == (
+        b"middle",
+        100,
+    )
+    assert [
+        call.kwargs["Range"]
+        for call in storage_client.get_object.await_args_list
+    ] == ["bytes=-4", "bytes=10-15"]
+
+
+@pytest.mark.asyncio
+async def test_delete_objects_sends_batches_of_1000_keys(
+    s3_client_and_session: tuple[S3Client, Mock],
+    mocker: MockerFixture,
+) -> None:
+    s3_client, _ = s3_client_and_session
+    keys = [f"1/{i}/mod.zip" for i in range(2500)]
+    storage_client: Mock = mocker.Mock()
+    storage_client.delete_objects = AsyncMock(
+        side_effect=[
+            {},
+            {"Errors": [{"Key": "1/1500/mod.zip", "Code": "AccessDenied"}]},
+            {"Deleted": []},
+        ]
+    )
+    mocker.patch.object(
+        s3_client, "get_client", return_value=_async_cm(storage_client)
+    )
+
+    failed = await s3_client.delete_objects(keys)
+
+    assert failed == ["1/1500/mod.zip"]
+    batches = [
+        call.kwargs["Delete"]["Objects"]
+        for call in storage_client.delete_objects.await_args_list
+    ]
+    assert [len(batch) for batch in batches] == [1000, 1000, 500]
+    assert batches[2][-1] == {"Key": "1/2499/mod.zip"}
+
+
+def _listing_client(
+    mocker: MockerFixture, responses: list[dict[str, Any] | Exception]
+) -> Mock:
+    storage_client: Mock = mocker.Mock()
+    storage_client.list_objects_v2 = AsyncMock(side_effect=responses)
+    return storage_client
+
+
+@pytest.mark.asyncio
+async def test_iter_objects_yields_pages_with_tokens(
+    s3_client_and_session: tuple[S3Client, Mock],
+    mocker: MockerFixture,
+) -> None:
+    s3_client, _ = s3_client_and_session
+    obj = {"Key": "mods/1", "Size": 10, "LastModified": "ts", "ETag": "t"}
+    storage_client = _listing_client(
+        mocker,
+        [
+            {
+                "Contents": [obj],
+                "IsTruncated": True,
+                "NextContinuationToken": "page-2",
+            },
+            {"IsTruncated": False},
+        ],
+    )
+    mocker.patch.object(
+        s3_client, "get_client", return_value=_async_cm(storage_client)
+    )
+
+    pages = [page async for page in s3_client.iter_objects("mods/", 1)]
+
+    assert pages == [
+        S3ObjectPage(
+            objects=[
+                {
+                    "key": "mods/1",
+                    "size": 10,
+                    "last_modified": "ts",
+                    "etag": "t",
+                }
+            ],
+            next_token="page-2",
+        ),
+        S3ObjectPage(objects=[], next_token=None),
+    ]
+    assert [
+        call.kwargs for call in storage_client.list_objects_v2.await_args_list
+    ] == [
+        {"Bucket": "bucket", "Prefix": "mods/", "MaxKeys": 1},
+        {
+            "Bucket": "bucket",
+            "Prefix": "mods/",
+            "MaxKeys": 1,
+            "ContinuationToken": "page-2",
+        },
+    ]
+
+
+@pytest.mark.asyncio
+async def test_iter_objects_resumes_from_token_and_raises_errors(
+    s3_client_and_session: tuple[S3Client, Mock],
+    mocker: MockerFixture,
+) -> None:
+    s3_client, _ = s3_client_and_session
+    storage_client = _listing_client(mocker, [RuntimeError("denied")])
+    mocker.patch.object(
+        s3_client, "get_client", return_value=_async_cm(storage_client)
+    )
+
+    with pytest.raises(RuntimeError, match="denied"):
+        async for _ in s3_client.iter_objects(continuation_token="page-7"):
+            pass
+
+    storage_client.list_objects_v2.assert_awaited_once_with(
+        Bucket="bucket", Prefix="", MaxKeys=1000, ContinuationToken="page-7"
+    )
+
+
 def test_time_format_formats_values(
     s3_client_and_session: tuple[S3Client, Mock],
 ) -> None:
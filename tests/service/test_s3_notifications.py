@@ -0,0 +1,256 @@
+import asyncio
+import json
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import AsyncMock, Mock
+from urllib.parse import quote_plus
+
+import pytest
+from pytest_mock import MockerFixture
+
+from modservice.http_server import HttpServer
+from modservice.service.finalize_uploads import UploadedObject
+from modservice.service.s3_notifications import (
+    S3NotificationIngester,
+    parse_notification,
+)
+from modservice.service.service import ModService
+
+BUCKET = "mods-bucket"
+
+
+class FakeS3Notifier:
+    """
+    Локальный нотификатор: шлёт webhook в формате MinIO, как это делает
+    MinIO с notify_webhook, на HttpServer сервиса
+    """
+
+    def __init__(self, port: int, token: str | None = None) -> None:
+        self._port = port
+        self._token = token
+
+    @staticmethod
+    def event(
+        key: str,
+        size: int = 1024,
+        event_name: str = "s3:ObjectCreated:Put",
+        bucket: str = BUCKET,
+    ) -> dict[str, Any]:
+        return {
+            "EventName": event_name,
+            "Key": f"{bucket}/{key}",
+            "Records": [
+                {
+                    "eventVersion": "2.0",
+                    "eventSource": "minio:s3",
+                    "eventTime": "2026-10-18T12:00:00.000Z",
+                    "eventName": event_name,
+                    "s3": {
+                        "bucket": {"name": bucket},
+                        "object": {
+                            "key": quote_plus(key),
+                            "size": size,
+                            "eTag": "d41d8cd98f00b204e9800998ecf8427e",
+                        },
+                    },
+                }
+            ],
+        }
+
+    async def send(self, payload: dict[str, Any] | bytes) -> int:
+        body = (
+            payload
+            if isinstance(payload, bytes)
+            else json.dumps(payload).encode()
+        )
+        head = (
+            "POST /s3/events HTTP/1.1\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+        )
+        if self._token is not None:
+            head += f"Authorization: Bearer {self._token}\r\n"
+        reader, writer = await asyncio.open_connection("127.0.0.1", self._port)
+        writer.write(head.encode() + b"\r\n" + body)
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        await writer.wait_closed()
+        return int(response.split(b" ", 2)[1])
+
+
+def test_parse_minio_notification() -> None:
+    body = json.dumps(FakeS3Notifier.event("12/345/mod.zip", 77)).encode()
+
+    parsed = parse_notification(body, BUCKET)
+
+    assert parsed.uploads == [
+        UploadedObject(
+            345, "12/345", 77, datetime(2026, 10, 18, 12, tzinfo=UTC)
+        )
+    ]
+    assert (parsed.ignored, parsed.invalid) == (0, 0)
+
+
+@pytest.mark.parametrize(
+    "event",
+    [
+        FakeS3Notifier.event("12/345/readme.txt"),
+        FakeS3Notifier.event("12/345/mod.zip", bucket="other"),
+        FakeS3Notifier.event(
+            "12/345/mod.zip", event_name="s3:ObjectRemoved:Delete"
+        ),
+    ],
+)
+def test_parse_notification_ignores_foreign_records(
+    event: dict[str, Any],
+) -> None:
+    parsed = parse_notification(json.dumps(event).encode(), BUCKET)
+
+    assert parsed == ([], 1, 0)
+
+
+def test_parse_yandex_cloud_notification() -> None:
+    body = json.dumps(
+        {
+            "messages": [
+                {
+                    "event_metadata": {
+                        "event_type": (
+                            "yandex.cloud.events.storage.ObjectCreate"
+                        ),
+                        "created_at": "2026-10-18T12:00:00Z",
+                    },
+                    "details": {
+                        "bucket_id": BUCKET,
+                        "object_id": "12/345/mod.zip",
+                    },
+                }
+            ]
+        }
+    ).encode()
+
+    parsed = parse_notification(body, BUCKET)
+
+    assert parsed.uploads == [
+        UploadedObject(
+            345, "12/345", None, datetime(2026, 10, 18, 12, tzinfo=UTC)
+        )
+    ]
+
+
+@pytest.mark.parametrize("body", [b"not json", b"[]", b'{"Records": {}}'])
+def test_parse_notification_rejects_malformed_body(body: bytes) -> None:
+    with pytest.raises(ValueError):
+        parse_notification(body)
+
+
+def test_parse_notification_skips_only_malformed_records() -> None:
+    good = FakeS3Notifier.event("1/2/mod.zip")["Records"][0]
+    huge = FakeS3Notifier.event("1/3/mod.zip", size=2**63)["Records"][0]
+    negative = FakeS3Notifier.event("1/4/mod.zip", size=-1)["Records"][0]
+    text = FakeS3Notifier.event("1/5/mod.zip")["Records"][0]
+    text["s3"]["object"]["size"] = "big"
+    # id за пределами INT уронили бы $1::int[] для всей пачки
+    huge_id = FakeS3Notifier.event("1/99999999999/mod.zip")["Records"][0]
+    huge_author = FakeS3Notifier.event(f"{2**31}/6/mod.zip")["Records"][0]
+    body = json.dumps(
+        {
+            "Records": [
+                good,
+                huge,
+                negative,
+                text,
+                {"eventName": 1},
+                huge_id,
+                huge_author,
+            ]
+        }
+    ).encode()
+
+    parsed = parse_notification(body, BUCKET)
+
+    assert [upload.mod_id for upload in parsed.uploads] == [2]
+    assert (parsed.ignored, parsed.invalid) == (0, 6)
+
+
+async def _serve(
+    ingester: S3NotificationIngester, token: str | None = None
+) -> HttpServer:
+    server = HttpServer("127.0.0.1", 0)
+    server.add_route("POST", "/s3/events", ingester.handle, token)
+    await server.start()
+    return server
+
+
+def _service(mocker: MockerFixture) -> Mock:
+    service: Mock = mocker.Mock(spec=ModService)
+    service.finalize_uploads = AsyncMock(
+        side_effect=lambda uploads, _source: [u.mod_id for u in uploads]
+    )
+    return service
+
+
+@pytest.mark.asyncio
+async def test_notifications_within_window_are_applied_as_one_batch(
+    mocker: MockerFixture,
+) -> None:
+    service = _service(mocker)
+    ingester = S3NotificationIngester(service, BUCKET, window=0.05)
+    server = await _serve(ingester, token="secret")
+    notifier = FakeS3Notifier(server.port, token="secret")
+    try:
+        statuses = await asyncio.gather(
+            *(
+                notifier.send(FakeS3Notifier.event(f"1/{mod_id}/mod.zip"))
+                for mod_id in (10, 11, 12)
+            ),
+            notifier.send(FakeS3Notifier.event("1/13/other.bin")),
+        )
+    finally:
+        await server.close()
+        await ingester.close()
+
+    assert statuses == [200, 200, 200, 200]
+    service.finalize_uploads.assert_awaited_once()
+    uploads, source = service.finalize_uploads.await_args.args
+    assert sorted(upload.mod_id for upload in uploads) == [10, 11, 12]
+    assert source == "notification"
+
+
+@pytest.mark.asyncio
+async def test_full_batch_is_flushed_before_window(
+    mocker: MockerFixture,
+) -> None:
+    service = _service(mocker)
+    ingester = S3NotificationIngester(
+        service, BUCKET, window=60.0, max_batch=2
+    )
+    uploads = [
+        UploadedObject(mod_id, f"1/{mod_id}", 1, datetime.now(UTC))
+        for mod_id in (1, 2)
+    ]
+
+    await asyncio.wait_for(ingester.submit(uploads), timeout=1.0)
+
+    service.finalize_uploads.assert_awaited_once_with(uploads, "notification")
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_returns_server_error_for_redelivery(
+    mocker: MockerFixture,
+) -> None:
+    service = mocker.Mock(spec=ModService)
+    service.finalize_uploads = AsyncMock(side_effect=OSError("db down"))
+    ingester = S3NotificationIngester(service, BUCKET, window=0.01)
+    server = await _serve(ingester)
+    notifier = FakeS3Notifier(server.port)
+    try:
+        failed = await notifier.send(FakeS3Notifier.event("1/2/mod.zip"))
+        invalid = await notifier.send(b"{")
+    finally:
+        await server.close()
+        await ingester.close()
+
+    assert failed == 500
+    assert invalid == 400
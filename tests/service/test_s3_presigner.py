@@ -0,0 +1,116 @@
+from datetime import UTC, datetime
+
+import pytest
+from pytest_mock import MockerFixture
+
+from modservice import s3_presigner
+from modservice.s3_client import S3Client
+from modservice.s3_presigner import S3Presigner
+
+SIGNED_AT = datetime(2025, 10, 9, 9, 30, 17, tzinfo=UTC)
+
+KEYS = (
+    "12/34/mod.zip",
+    "1/2/mod with spaces.zip",
+    "1/2/мод-ü~+=&?%.zip",
+    "deep/nested/path/file.tar.gz",
+)
+
+
+def _make_client(endpoint_url: str, local_presign: bool) -> S3Client:
+    return S3Client(
+        access_key="dev-access",
+        secret_key="5ece9238b18dc29d5e0724b3ae577cdf",
+        endpoint_url=endpoint_url,
+        bucket_name="dev",
+        verify=True,
+        local_presign=local_presign,
+    )
+
+
+def _make_clients(
+    endpoint_url: str = "https://s3.esclient.ru",
+) -> tuple[S3Client, S3Client]:
+    return (
+        _make_client(endpoint_url, local_presign=True),
+        _make_client(endpoint_url, local_presign=False),
+    )
+
+
+@pytest.fixture
+def frozen_time(mocker: MockerFixture) -> None:
+    mocker.patch(
+        "botocore.auth.get_current_datetime",
+        return_value=SIGNED_AT.replace(tzinfo=None),
+    )
+    clock = mocker.patch("modservice.s3_presigner.datetime")
+    clock.now.return_value = SIGNED_AT
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("frozen_time")
+@pytest.mark.parametrize("s3_key", KEYS)
+@pytest.mark.parametrize("expiration", [60, 3600, 604800])
+async def test_get_url_matches_botocore(s3_key: str, expiration: int) -> None:
+    local, botocore = _make_clients()
+
+    expected = await botocore.generate_presigned_get_url(s3_key, expiration)
+    actual = await local.generate_presigned_get_url(s3_key, expiration)
+
+    assert actual == expected
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("frozen_time")
+@pytest.mark.parametrize("s3_key", KEYS)
+@pytest.mark.parametrize("content_type", [None, "application/zip"])
+async def test_put_url_matches_botocore(
+    s3_key: str, content_type: str | None
+) -> None:
+    local, botocore = _make_clients()
+
+    expected = await botocore.generate_presigned_put_url(
+        s3_key, 3600, content_type
+    )
+    actual = await local.generate_presigned_put_url(s3_key, 3600, content_type)
+
+    assert actual == expected
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("frozen_time")
+@pytest.mark.parametrize(
+    "endpoint_url",
+    ["https://s3.esclient.ru:443", "http://localhost:9000"],
+)
+async def test_endpoint_port_matches_botocore(endpoint_url: str) -> None:
+    local, botocore = _make_clients(endpoint_url)
+
+    expected = await botocore.generate_presigned_get_url("1/2/mod.zip")
+    actual = await local.generate_presigned_get_url("1/2/mod.zip")
+
+    assert actual == expected
+
+
+def test_signing_key_is_cached_per_day(mocker: MockerFixture) -> None:
+    presigner = S3Presigner(
+        access_key="access",
+        secret_key="secret",
+        endpoint_url="https://s3.example.com",
+        bucket_name="bucket",
+    )
+    derive = mocker.spy(presigner, "_signing_key")
+    hmac_spy = mocker.patch(
+        "modservice.s3_presigner._hmac_sha256",
+        wraps=s3_presigner._hmac_sha256,
+    )
+
+    first = presigner.presign("GET", "a", now=SIGNED_AT)
+    presigner.presign("GET", "b", now=SIGNED_AT)
+    next_day = SIGNED_AT.replace(day=SIGNED_AT.day + 1)
+    presigner.presign("GET", "a", now=next_day)
+
+    assert derive.call_count == 3
+    # 4 HMAC на вывод ключа, только для двух разных дней
+    assert hmac_spy.call_count == 8
+    assert first.startswith("https://bucket.s3.example.com/a?")
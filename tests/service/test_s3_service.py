@@ -1,9 +1,38 @@
+import asyncio
+import io
+import zipfile
+from collections.abc import AsyncIterator
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from botocore.exceptions import ClientError
 
-from modservice.s3_client import S3Client
+from modservice.s3_client import S3Client, S3ObjectPage
 from modservice.service.s3_service import S3Service
+from modservice.zip_manifest import ZipFormatError
+
+
+def _zip(files: dict[str, bytes]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, data in files.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+def _serve_ranges(client: MagicMock, data: bytes) -> None:
+    """get_object_range поверх data, как ranged GET в S3"""
+
+    async def get_object_range(
+        s3_key: str, start: int, end: int | None = None
+    ) -> tuple[bytes, int]:
+        await asyncio.sleep(0)
+        if start < 0:
+            return data[start:], len(data)
+        stop = len(data) if end is None else end + 1
+        return data[start:stop], len(data)
+
+    client.get_object_range = AsyncMock(side_effect=get_object_range)
 
 
 class TestS3Service:
@@ -200,12 +229,17 @@ class TestS3Service:
             {"key": "123/789", "size": 2048},
         ]
 
-        mock_s3_client.list_objects.return_value = expected_files
+        async def iter_objects(prefix: str) -> AsyncIterator[S3ObjectPage]:
+            await asyncio.sleep(0)
+            yield S3ObjectPage(objects=expected_files[:1], next_token="t")
+            yield S3ObjectPage(objects=expected_files[1:], next_token=None)
+
+        mock_s3_client.iter_objects = MagicMock(side_effect=iter_objects)
 
         result = await s3_service.list_files(prefix)
 
         assert result == expected_files
-        mock_s3_client.list_objects.assert_awaited_once_with(prefix)
+        mock_s3_client.iter_objects.assert_called_once_with(prefix)
 
     @pytest.mark.asyncio
     async def test_generate_upload_url_auto_content_type(
@@ -262,6 +296,31 @@ class TestS3Service:
         assert info["filename"] == "Test_Mod.zip"
         assert info["full_s3_key"] == s3_key
 
+    def test_get_file_info_from_s3_key_mod_file_format(
+        self, s3_service: S3Service
+    ) -> None:
+        """Тест парсинга S3 ключа файла мода author_id/mod_id/<файл>"""
+        s3_key = "123/456/mod.zip"
+
+        info = s3_service.get_file_info_from_s3_key(s3_key)
+
+        assert info["author_id"] == 123
+        assert info["mod_id"] == 456
+        assert info["filename"] == "mod.zip"
+        assert info["full_s3_key"] == s3_key
+
+    @pytest.mark.parametrize(
+        "s3_key", ["1/99999999999/mod.zip", "1/2147483648", "99999999999/1"]
+    )
+    def test_get_file_info_from_s3_key_rejects_ids_outside_int(
+        self, s3_service: S3Service, s3_key: str
+    ) -> None:
+        """id больше INT не уходит в $1::int[], а считается ошибкой"""
+        info = s3_service.get_file_info_from_s3_key(s3_key)
+
+        assert "mod_id" not in info
+        assert "error" in info
+
     def test_get_file_info_from_s3_key_invalid(
         self, s3_service: S3Service
     ) -> None:
@@ -307,3 +366,77 @@ class TestS3Service:
         assert all(
             char not in safe_title for char in ["!", "@", "#", "$", "%"]
         )
+
+    @pytest.mark.asyncio
+    async def test_read_mod_manifest_reads_only_the_tail(
+        self, s3_service: S3Service, mock_s3_client: MagicMock
+    ) -> None:
+        """Небольшой архив: central directory приходит вместе с хвостом"""
+        payload = bytes(range(256)) * 1024
+        _serve_ranges(
+            mock_s3_client, _zip({"big.bin": payload, "readme.txt": b"hi"})
+        )
+
+        manifest = await s3_service.read_mod_manifest("1/2")
+
+        assert [entry.name for entry in manifest.entries] == [
+            "big.bin",
+            "readme.txt",
+        ]
+        assert manifest.uncompressed_size == len(payload) + 2
+        mock_s3_client.get_object_range.assert_awaited_once()
+        assert mock_s3_client.get_object_range.await_args.args[0] == (
+            "1/2/mod.zip"
+        )
+
+    @pytest.mark.asyncio
+    async def test_read_mod_manifest_fetches_large_central_directory(
+        self, s3_service: S3Service, mock_s3_client: MagicMock
+    ) -> None:
+        """Central directory больше хвоста читается отдельным GET"""
+        files = {f"assets/{'x' * 100}/{i:05d}.txt": b"" for i in range(1000)}
+        data = _zip(files)
+        _serve_ranges(mock_s3_client, data)
+
+        manifest = await s3_service.read_mod_manifest("1/2")
+
+        assert len(manifest.entries) == 1000
+        assert mock_s3_client.get_object_range.await_count == 2
+        _, start, end = mock_s3_client.get_object_range.await_args.args
+        assert data[start : start + 4] == b"PK\x01\x02"
+        assert data[end + 1 : end + 5] == b"PK\x05\x06"
+
+    @pytest.mark.asyncio
+    async def test_read_mod_manifest_rejects_oversized_central_directory(
+        self,
+        s3_service: S3Service,
+        mock_s3_client: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Central directory больше лимита не скачивается"""
+        files = {f"assets/{'x' * 100}/{i:05d}.txt": b"" for i in range(1000)}
+        _serve_ranges(mock_s3_client, _zip(files))
+        monkeypatch.setattr(
+            "modservice.service.s3_service.MAX_CENTRAL_DIRECTORY_SIZE", 1024
+        )
+
+        with pytest.raises(ZipFormatError, match="слишком большой"):
+            await s3_service.read_mod_manifest("1/2")
+        mock_s3_client.get_object_range.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_read_mod_manifest_rejects_non_zip_and_empty_objects(
+        self, s3_service: S3Service, mock_s3_client: MagicMock
+    ) -> None:
+        """Не zip и пустой объект — ZipFormatError, а не ошибка S3"""
+        _serve_ranges(mock_s3_client, b"definitely not a zip")
+        with pytest.raises(ZipFormatError):
+            await s3_service.read_mod_manifest("1/2")
+
+        mock_s3_client.get_object_range = AsyncMock(
+            side_effect=ClientError(
+                {"Error": {"Code": "InvalidRange"}}, "GetObject"
+            )
+        )
+        with pytest.raises(ZipFormatError):
+            await s3_service.read_mod_manifest("1/2")
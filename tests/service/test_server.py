@@ -0,0 +1,15 @@
+import sys
+
+from pytest_mock import MockerFixture
+
+from modservice import server as server_module
+
+
+def test_loop_factory_falls_back_without_uvloop(
+    mocker: MockerFixture,
+) -> None:
+    # None в sys.modules: import uvloop поднимает ImportError
+    mocker.patch.dict(sys.modules, {"uvloop": None})
+
+    assert server_module.loop_factory(use_uvloop=False) is None
+    assert server_module.loop_factory(use_uvloop=True) is None
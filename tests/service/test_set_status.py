@@ -5,6 +5,7 @@ from faker import Faker
 from pytest_mock import MockerFixture
 
 from modservice.repository.repository import ModRepository
+from modservice.service.download_link_cache import DownloadLinkCache
 from modservice.service.s3_service import S3Service
 from modservice.service.service import ModService
 
@@ -27,3 +28,81 @@ async def test_service_set_status_uses_helper(
 
     assert result is True
     helper.assert_awaited_once_with(repo, mod_id, status)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("status", "invalidated"),
+    [("BANNED", True), ("HIDDEN", True), ("UPLOADED", False)],
+)
+async def test_service_set_status_invalidates_download_links(
+    mocker: MockerFixture, faker: Faker, status: str, invalidated: bool
+) -> None:
+    repo = mocker.Mock(spec=ModRepository)
+    s3_service = mocker.Mock(spec=S3Service)
+    mocker.patch(
+        "modservice.service.service._set_status",
+        AsyncMock(return_value=True),
+    )
+    cache = DownloadLinkCache()
+    mod_id = faker.random_int(min=1, max=100000)
+    cache.put(mod_id, 3600, faker.uri())
+
+    service = ModService(repo, s3_service, cache)
+
+    await service.set_status(mod_id, status)
+
+    assert (cache.get(mod_id, 3600) is None) is invalidated
+
+
+@pytest.mark.asyncio
+async def test_service_set_status_invalidates_s3_key(
+    mocker: MockerFixture, faker: Faker
+) -> None:
+    repo = mocker.Mock(spec=ModRepository)
+    s3_service = mocker.Mock(spec=S3Service)
+    mocker.patch(
+        "modservice.service.service._set_status",
+        AsyncMock(return_value=True),
+    )
+    mod_id = faker.random_int(min=1, max=100000)
+
+    service = ModService(repo, s3_service)
+
+    await service.set_status(mod_id, "BANNED")
+
+    repo.invalidate_s3_key.assert_called_once_with(mod_id)
+
+
+def test_service_reset_caches_clears_everything(
+    mocker: MockerFixture, faker: Faker
+) -> None:
+    repo = mocker.Mock(spec=ModRepository)
+    s3_service = mocker.Mock(spec=S3Service)
+    cache = DownloadLinkCache()
+    cache.put(faker.random_int(min=1, max=100000), 3600, faker.uri())
+
+    service = ModService(repo, s3_service, cache)
+
+    service.reset_caches()
+
+    assert len(cache) == 0
+    repo.clear_s3_keys.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status", ["BANNED", "UPLOADED"])
+async def test_service_set_status_bumps_catalogue_version(
+    mocker: MockerFixture, faker: Faker, status: str
+) -> None:
+    repo = mocker.Mock(spec=ModRepository)
+    s3_service = mocker.Mock(spec=S3Service)
+    mocker.patch(
+        "modservice.service.service._set_status", AsyncMock(return_value=True)
+    )
+    service = ModService(repo, s3_service)
+    before = service.catalogue_version
+
+    await service.set_status(faker.random_int(min=1, max=100000), status)
+
+    assert service.catalogue_version > before
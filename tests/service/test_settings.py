@@ -0,0 +1,67 @@
+import pytest
+from pydantic import ValidationError
+
+from modservice.settings import Settings
+
+REQUIRED_ENV = {
+    "HOST": "0.0.0.0",
+    "PORT": "7004",
+    "DATABASE_URL": "postgresql://localhost/mods",
+    "LOG_LEVEL": "INFO",
+    "LOG_FORMAT": "%(message)s",
+    "LOG_DATEFMT": "%H:%M:%S",
+    "S3_API_ENDPOINT": "https://s3.example.com",
+    "S3_ACCESS_KEY": "access",
+    "S3_SECRET_KEY": "secret",
+    "S3_BUCKET_NAME": "bucket",
+    "S3_VERIFY": "true",
+}
+
+
+@pytest.fixture
+def settings_env(monkeypatch: pytest.MonkeyPatch) -> pytest.MonkeyPatch:
+    for name, value in REQUIRED_ENV.items():
+        monkeypatch.setenv(name, value)
+    return monkeypatch
+
+
+def test_grpc_server_options_default_to_grpc_defaults(
+    settings_env: pytest.MonkeyPatch,  # noqa: ARG001
+) -> None:
+    assert Settings().grpc_server_options() == []
+
+
+def test_grpc_server_options_from_env(
+    settings_env: pytest.MonkeyPatch,
+) -> None:
+    settings_env.setenv("GRPC_MAX_CONCURRENT_STREAMS", "256")
+    settings_env.setenv("GRPC_KEEPALIVE_TIME_MS", "30000")
+    settings_env.setenv("GRPC_KEEPALIVE_PERMIT_WITHOUT_CALLS", "true")
+    settings_env.setenv("GRPC_MAX_CONNECTION_AGE_MS", "600000")
+
+    assert sorted(Settings().grpc_server_options()) == [
+        ("grpc.keepalive_permit_without_calls", 1),
+        ("grpc.keepalive_time_ms", 30000),
+        ("grpc.max_concurrent_streams", 256),
+        ("grpc.max_connection_age_ms", 600000),
+    ]
+
+
+def test_s3_notifications_require_token_and_port(
+    settings_env: pytest.MonkeyPatch,
+) -> None:
+    settings_env.setenv("S3_NOTIFY_ENABLED", "true")
+
+    with pytest.raises(ValidationError, match="S3_NOTIFY_TOKEN"):
+        Settings()
+
+    settings_env.setenv("S3_NOTIFY_TOKEN", "secret")
+    with pytest.raises(ValidationError, match="S3_NOTIFY_PORT"):
+        Settings()
+
+    settings_env.setenv("S3_NOTIFY_PORT", "9200")
+    settings = Settings()
+    assert (settings.s3_notify_token, settings.s3_notify_port) == (
+        "secret",
+        9200,
+    )
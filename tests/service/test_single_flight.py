@@ -0,0 +1,103 @@
+import asyncio
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+import pytest
+
+from modservice.service.single_flight import (
+    SINGLE_FLIGHT_SHARED,
+    SingleFlight,
+)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_with_same_key_share_one_call() -> None:
+    flight: SingleFlight[int, str] = SingleFlight("test_share")
+    release = asyncio.Event()
+    calls = 0
+
+    async def fetch() -> str:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "value"
+
+    waiters = [asyncio.create_task(flight.do(1, fetch)) for _ in range(10)]
+    await asyncio.sleep(0)
+    assert len(flight) == 1
+    release.set()
+
+    assert await asyncio.gather(*waiters) == ["value"] * 10
+    assert calls == 1
+    assert len(flight) == 0
+    assert SINGLE_FLIGHT_SHARED.value(("test_share",)) == 9
+
+
+@pytest.mark.asyncio
+async def test_different_keys_are_not_coalesced() -> None:
+    flight: SingleFlight[int, int] = SingleFlight("test_keys")
+
+    async def fetch(value: int) -> int:
+        await asyncio.sleep(0)
+        return value
+
+    def fetcher(value: int) -> Callable[[], Coroutine[Any, Any, int]]:
+        return lambda: fetch(value)
+
+    results = await asyncio.gather(
+        *(flight.do(key, fetcher(key)) for key in (1, 2))
+    )
+
+    assert results == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_exception_is_propagated_to_all_waiters() -> None:
+    flight: SingleFlight[int, str] = SingleFlight("test_error")
+
+    async def fail() -> str:
+        await asyncio.sleep(0)
+        raise RuntimeError("boom")
+
+    results = await asyncio.gather(
+        flight.do(1, fail), flight.do(1, fail), return_exceptions=True
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert len(flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_next_call_after_completion_runs_again() -> None:
+    flight: SingleFlight[int, int] = SingleFlight("test_repeat")
+    calls = 0
+
+    async def fetch() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return calls
+
+    assert await flight.do(1, fetch) == 1
+    assert await flight.do(1, fetch) == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_others() -> None:
+    flight: SingleFlight[int, str] = SingleFlight("test_cancel")
+    release = asyncio.Event()
+
+    async def fetch() -> str:
+        await release.wait()
+        return "value"
+
+    first = asyncio.create_task(flight.do(1, fetch))
+    second = asyncio.create_task(flight.do(1, fetch))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await second == "value"
+    assert first.cancelled()
@@ -0,0 +1,174 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+from pytest_mock import MockerFixture
+
+from modservice.repository.model import PendingUpload
+from modservice.service.finalize_uploads import UploadedObject
+from modservice.service.s3_service import S3Service
+from modservice.service.service import ModService
+from modservice.service.upload_reconciler import (
+    RECONCILER_FAILED,
+    RECONCILER_PENDING,
+    RECONCILER_RUNS,
+    UploadReconciler,
+)
+
+
+def _pending(count: int) -> list[PendingUpload]:
+    started = datetime(2026, 1, 1)
+    return [
+        PendingUpload(i, f"1/{i}", started + timedelta(seconds=i))
+        for i in range(1, count + 1)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_run_once_finalizes_found_uploads_in_batches(
+    mocker: MockerFixture,
+) -> None:
+    pending = _pending(5)
+    service = mocker.Mock(spec=ModService)
+    service.get_pending_uploads = mocker.AsyncMock(
+        side_effect=[pending[:2], pending[2:4], pending[4:]]
+    )
+    service.finalize_uploads = mocker.AsyncMock(
+        side_effect=lambda uploads, _source: [u.mod_id for u in uploads]
+    )
+    service.mark_failed_uploads = mocker.AsyncMock(return_value=[])
+    uploaded_at = datetime.now(UTC)
+    in_flight = {"now": 0, "max": 0}
+
+    async def head(s3_key: str) -> dict[str, Any] | None:
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0)
+        in_flight["now"] -= 1
+        mod_id = int(s3_key.split("/")[1])
+        if mod_id % 2 == 0:
+            return None
+        return {"size": mod_id * 10, "last_modified": uploaded_at}
+
+    s3_service = mocker.Mock(spec=S3Service)
+    s3_service.get_mod_object_info = mocker.AsyncMock(side_effect=head)
+    reconciler = UploadReconciler(
+        service, s3_service, batch_size=2, concurrency=1
+    )
+
+    finalized = await reconciler.run_once()
+
+    assert finalized == 3
+    assert [
+        call.args for call in service.get_pending_uploads.await_args_list
+    ] == [
+        (2, None),
+        (2, (pending[1].created_at, 2)),
+        (2, (pending[3].created_at, 4)),
+    ]
+    assert [
+        call.args for call in service.finalize_uploads.await_args_list
+    ] == [
+        ([UploadedObject(1, "1/1", 10, uploaded_at)], "reconciler"),
+        ([UploadedObject(3, "1/3", 30, uploaded_at)], "reconciler"),
+        ([UploadedObject(5, "1/5", 50, uploaded_at)], "reconciler"),
+    ]
+    assert in_flight["max"] == 1
+    assert RECONCILER_PENDING.value() == 2
+
+
+@pytest.mark.asyncio
+async def test_run_once_skips_mods_whose_head_fails(
+    mocker: MockerFixture,
+) -> None:
+    service = mocker.Mock(spec=ModService)
+    service.get_pending_uploads = mocker.AsyncMock(return_value=_pending(2))
+    service.finalize_uploads = mocker.AsyncMock(return_value=[2])
+    s3_service = mocker.Mock(spec=S3Service)
+    s3_service.get_mod_object_info = mocker.AsyncMock(
+        side_effect=[
+            RuntimeError("timeout"),
+            {"size": 1, "last_modified": datetime.now(UTC)},
+        ]
+    )
+    reconciler = UploadReconciler(service, s3_service, batch_size=10)
+
+    assert await reconciler.run_once() == 1
+    uploads = service.finalize_uploads.await_args.args[0]
+    assert [upload.mod_id for upload in uploads] == [2]
+
+
+@pytest.mark.asyncio
+async def test_run_once_marks_missing_uploads_failed_after_max_age(
+    mocker: MockerFixture,
+) -> None:
+    service = mocker.Mock(spec=ModService)
+    service.get_pending_uploads = mocker.AsyncMock(return_value=_pending(3))
+    service.finalize_uploads = mocker.AsyncMock(return_value=[1])
+    service.mark_failed_uploads = mocker.AsyncMock(return_value=[2])
+    s3_service = mocker.Mock(spec=S3Service)
+    s3_service.get_mod_object_info = mocker.AsyncMock(
+        side_effect=[
+            {"size": 1, "last_modified": datetime.now(UTC)},
+            None,
+            None,
+        ]
+    )
+    failed_before = RECONCILER_FAILED.value()
+    reconciler = UploadReconciler(
+        service, s3_service, batch_size=10, max_age=3600.0
+    )
+
+    assert await reconciler.run_once() == 1
+    service.mark_failed_uploads.assert_awaited_once_with([2, 3], 3600.0)
+    assert RECONCILER_FAILED.value() == failed_before + 1
+    assert RECONCILER_PENDING.value() == 1
+
+
+@pytest.mark.asyncio
+async def test_run_once_keeps_missing_uploads_without_max_age(
+    mocker: MockerFixture,
+) -> None:
+    service = mocker.Mock(spec=ModService)
+    service.get_pending_uploads = mocker.AsyncMock(return_value=_pending(1))
+    service.finalize_uploads = mocker.AsyncMock(return_value=[])
+    s3_service = mocker.Mock(spec=S3Service)
+    s3_service.get_mod_object_info = mocker.AsyncMock(return_value=None)
+    reconciler = UploadReconciler(
+        service, s3_service, batch_size=10, max_age=0
+    )
+
+    assert await reconciler.run_once() == 0
+    service.mark_failed_uploads.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_background_task_survives_failed_pass(
+    mocker: MockerFixture,
+) -> None:
+    service = mocker.Mock(spec=ModService)
+    calls = 0
+
+    async def get_pending_uploads(*args: Any) -> list[PendingUpload]:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        if calls == 1:
+            raise OSError("db down")
+        return []
+
+    service.get_pending_uploads = mocker.AsyncMock(
+        side_effect=get_pending_uploads
+    )
+    errors_before = RECONCILER_RUNS.value(("error",))
+    reconciler = UploadReconciler(
+        service, mocker.Mock(spec=S3Service), interval=0
+    )
+
+    reconciler.start()
+    while calls < 2:
+        await asyncio.sleep(0)
+    await reconciler.close()
+
+    assert RECONCILER_RUNS.value(("error",)) == errors_before + 1
@@ -0,0 +1,89 @@
+import os
+import signal
+import threading
+import time
+from multiprocessing import Value
+
+import pytest
+from pytest_mock import MockerFixture
+
+from modservice import workers as workers_module
+from modservice.workers import WorkerSupervisor
+
+pytestmark = [
+    pytest.mark.skipif(
+        not hasattr(os, "fork"), reason="fork start method is required"
+    ),
+    # Потоки gRPC от соседних тестов; дочерние процессы gRPC не используют
+    pytest.mark.filterwarnings(
+        "ignore:This process .* is multi-threaded:DeprecationWarning"
+    ),
+]
+
+
+def _stop_later(supervisor: WorkerSupervisor, delay: float) -> None:
+    timer = threading.Timer(delay, supervisor.stop)
+    timer.daemon = True
+    timer.start()
+
+
+def test_supervisor_restarts_crashed_workers(mocker: MockerFixture) -> None:
+    mocker.patch.object(workers_module, "POLL_INTERVAL", 0.05)
+    starts = Value("i", 0)
+
+    def crash(index: int) -> None:
+        with starts.get_lock():
+            starts.value += 1
+        os._exit(1 + index)
+
+    supervisor = WorkerSupervisor(crash, 2, start_method="fork")
+    _stop_later(supervisor, 0.8)
+    supervisor.run()
+
+    # Первый перезапуск через 0.5s, второй — уже через 1s
+    assert starts.value == 4
+
+
+def test_supervisor_terminates_workers_on_stop(
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch.object(workers_module, "POLL_INTERVAL", 0.05)
+    stopped = Value("i", 0)
+
+    def serve_forever(index: int) -> None:  # noqa: ARG001
+        def on_term(signum: int, frame: object) -> None:  # noqa: ARG001
+            with stopped.get_lock():
+                stopped.value += 1
+            os._exit(0)
+
+        signal.signal(signal.SIGTERM, on_term)
+        while True:
+            time.sleep(0.01)
+
+    supervisor = WorkerSupervisor(serve_forever, 3, start_method="fork")
+    _stop_later(supervisor, 0.3)
+    started = time.monotonic()
+    supervisor.run()
+
+    assert stopped.value == 3
+    assert time.monotonic() - started < 5
+
+
+def test_supervisor_kills_workers_after_timeout(
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch.object(workers_module, "POLL_INTERVAL", 0.05)
+
+    def ignore_term(index: int) -> None:  # noqa: ARG001
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+        while True:
+            time.sleep(0.01)
+
+    supervisor = WorkerSupervisor(
+        ignore_term, 1, shutdown_timeout=0.2, start_method="fork"
+    )
+    _stop_later(supervisor, 0.3)
+    started = time.monotonic()
+    supervisor.run()
+
+    assert time.monotonic() - started < 5
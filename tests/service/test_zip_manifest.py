@@ -0,0 +1,123 @@
+import io
+import json
+import struct
+import zipfile
+
+import pytest
+
+from modservice.zip_manifest import (
+    ZipEntry,
+    ZipFormatError,
+    find_end_of_central_directory,
+    parse_central_directory,
+    parse_zip64_end_of_central_directory,
+)
+
+
+def _zip(files: dict[str, bytes], comment: bytes = b"") -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, data in files.items():
+            archive.writestr(name, data)
+        archive.comment = comment
+    return buffer.getvalue()
+
+
+def _expected(data: bytes) -> list[ZipEntry]:
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        return [
+            ZipEntry(info.filename, info.compress_size, info.file_size)
+            for info in archive.infolist()
+        ]
+
+
+def _manifest_entries(data: bytes) -> list[ZipEntry]:
+    directory = find_end_of_central_directory(data, 0)
+    if directory.zip64_eocd_offset is not None:
+        offset = directory.zip64_eocd_offset
+        directory = parse_zip64_end_of_central_directory(data[offset:])
+    central = data[directory.offset : directory.offset + directory.size]
+    return parse_central_directory(central, directory.entry_count).entries
+
+
+def test_manifest_matches_zipfile() -> None:
+    files = {
+        "mod/": b"",
+        "mod/config.json": b'{"a": 1}',
+        "mod/textures/стена.png": b"\x89PNG" + b"\x00" * 5000,
+    }
+    # Сигнатура EOCD в комментарии сбивает даже zipfile
+    data = _zip(files, comment=b"PK\x05\x06 in comment")
+
+    directory = find_end_of_central_directory(data, 0)
+    central = data[directory.offset : directory.offset + directory.size]
+    manifest = parse_central_directory(central, directory.entry_count)
+
+    assert manifest.entries == _expected(_zip(files))
+    assert manifest.file_count == 2
+    assert manifest.uncompressed_size == 8 + 5004
+    assert manifest.compression_ratio > 1
+
+
+def test_zip64_records_and_extra_fields(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Пороги ZIP64 занижены: zipfile пишет ZIP64 EOCD и поля ZIP64
+    # с размерами так же, как для архивов больше 4 GiB
+    monkeypatch.setattr(zipfile, "ZIP64_LIMIT", 10)
+    monkeypatch.setattr(zipfile, "ZIP_FILECOUNT_LIMIT", 1)
+    data = _zip({"a.bin": b"a" * 100, "b.bin": b"b" * 200})
+    monkeypatch.undo()
+
+    directory = find_end_of_central_directory(data, 0)
+
+    assert directory.zip64_eocd_offset is not None
+    assert _manifest_entries(data) == _expected(data)
+    assert [e.uncompressed_size for e in _manifest_entries(data)] == [
+        100,
+        200,
+    ]
+
+
+def test_tail_offset_is_applied_to_bounds_check() -> None:
+    data = _zip({"a.txt": b"hello"})
+    tail_offset = len(data) - 30
+
+    directory = find_end_of_central_directory(data[tail_offset:], tail_offset)
+
+    assert directory == find_end_of_central_directory(data, 0)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"not a zip archive at all",
+        # EOCD, который ссылается за свои пределы
+        struct.pack("<4sHHHHIIH", b"PK\x05\x06", 0, 0, 1, 1, 500, 10, 0),
+    ],
+)
+def test_missing_or_broken_eocd_is_rejected(data: bytes) -> None:
+    with pytest.raises(ZipFormatError):
+        find_end_of_central_directory(data, 0)
+
+
+def test_truncated_central_directory_is_rejected() -> None:
+    data = _zip({"a.txt": b"hello", "b.txt": b"world"})
+    directory = find_end_of_central_directory(data, 0)
+    central = data[directory.offset : directory.offset + directory.size]
+
+    with pytest.raises(ZipFormatError):
+        parse_central_directory(central[:-10], directory.entry_count)
+    with pytest.raises(ZipFormatError):
+        parse_central_directory(b"XX" + central, directory.entry_count)
+
+
+def test_nul_in_entry_name_is_replaced() -> None:
+    # zipfile обрезает имя по NUL при записи: байт подставляется вручную
+    data = _zip({"a_b.txt": b"x"}).replace(b"a_b.txt", b"a\x00b.txt")
+
+    entries = _manifest_entries(data)
+
+    assert [entry.name for entry in entries] == ["a\ufffdb.txt"]
+    assert "\\u0000" not in json.dumps([entry.name for entry in entries])